@@ -0,0 +1,169 @@
+"""
+Measure mongo_bakery's generation and persistence throughput against mongomock.
+
+Usage:
+    python -m benchmarks.run [--output results.json] [--compare previous.json] [--quantity 500] [--repeat 3]
+
+Results are written as JSON, so runs on different versions can be compared with `--compare`.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import mongoengine
+import mongomock
+
+from benchmarks.schemas import SCHEMAS, FlatDocument
+from mongo_bakery.__about__ import __version__
+from mongo_bakery.bakery import Baker
+
+SCALING_QUANTITIES = (1, 10, 100, 1000)
+# Code timed by `bench_import` in a fresh interpreter: what pytest imports for every run, and what the first
+# generated value costs on top of that.
+IMPORT_SCRIPTS = {
+    "pytest_plugin": "import mongo_bakery.pytest_plugin",
+    "first_value": "import mongo_bakery.bakery; mongo_bakery.bakery.faker.word()",
+}
+
+
+def best_of(repeat: int, setup: Callable[[], Any], measured: Callable[[Any], Any]) -> float:
+    """Return the fastest of `repeat` timings of `measured(setup())`, excluding `setup` itself."""
+    timings = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        measured(state)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_throughput(baker: Baker, quantity: int, repeat: int) -> dict[str, Any]:
+    """Documents/sec of `make` for each schema in `SCHEMAS`."""
+    results = {}
+    for name, document_class in SCHEMAS.items():
+        seconds = best_of(repeat, baker.cleanup, lambda _, cls=document_class: baker.make(cls, _quantity=quantity))
+        results[name] = {"quantity": quantity, "seconds": seconds, "docs_per_sec": quantity / seconds}
+    baker.cleanup()
+    return results
+
+
+def bench_scaling(baker: Baker, repeat: int) -> dict[str, Any]:
+    """Documents/sec of `make` on the flat schema across increasing `_quantity` values."""
+    results = {}
+    for quantity in SCALING_QUANTITIES:
+        seconds = best_of(repeat, baker.cleanup, lambda _, q=quantity: baker.make(FlatDocument, _quantity=q))
+        results[str(quantity)] = {"seconds": seconds, "docs_per_sec": quantity / seconds}
+    baker.cleanup()
+    return results
+
+
+def bench_cleanup(baker: Baker, quantity: int, repeat: int) -> dict[str, Any]:
+    """Seconds `cleanup()` takes to delete `quantity` flat documents."""
+
+    def setup() -> None:
+        baker.cleanup()
+        baker.make(FlatDocument, _quantity=quantity)
+
+    seconds = best_of(repeat, setup, lambda _: baker.cleanup())
+    return {"quantity": quantity, "seconds": seconds, "docs_per_sec": quantity / seconds}
+
+
+def bench_memory(baker: Baker, quantity: int) -> dict[str, Any]:
+    """Peak traced memory per document while `make` builds, saves and returns each schema's instances."""
+    results = {}
+    for name, document_class in SCHEMAS.items():
+        baker.cleanup()
+        tracemalloc.start()
+        instances = baker.make(document_class, _quantity=quantity)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del instances
+        results[name] = {"quantity": quantity, "peak_bytes": peak, "bytes_per_doc": peak / quantity}
+    baker.cleanup()
+    return results
+
+
+def bench_import(repeat: int) -> dict[str, Any]:
+    """Seconds a fresh interpreter spends running each of `IMPORT_SCRIPTS`, excluding interpreter startup."""
+    results = {}
+    for name, code in IMPORT_SCRIPTS.items():
+        script = f"import time\nstart = time.perf_counter()\n{code}\nprint(time.perf_counter() - start)"
+        timings = [
+            float(subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout)  # noqa: S603
+            for _ in range(repeat)
+        ]
+        results[name] = {"seconds": min(timings)}
+    return results
+
+
+def run(quantity: int, repeat: int) -> dict[str, Any]:
+    """Run every benchmark and return the results, along with enough context to compare runs."""
+    mongoengine.connect(
+        "bakery_bench", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient, uuidRepresentation="standard"
+    )
+    baker = Baker()
+    baker.seed(0)
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "results": {
+            "throughput": bench_throughput(baker, quantity, repeat),
+            "scaling": bench_scaling(baker, repeat),
+            "cleanup": bench_cleanup(baker, quantity, repeat),
+            "memory": bench_memory(baker, quantity),
+            "import": bench_import(repeat),
+        },
+    }
+
+
+def flatten(results: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Flatten nested results into `{"throughput.flat.docs_per_sec": 1234.5, ...}` for comparison."""
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        elif key in ("docs_per_sec", "bytes_per_doc", "seconds"):
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def compare(previous: dict[str, Any], current: dict[str, Any]) -> str:
+    """Render a table of every metric in both runs, with the current/previous ratio."""
+    before, after = flatten(previous["results"]), flatten(current["results"])
+    lines = [f"{'metric':<45} {previous['version']:>14} {current['version']:>14} {'ratio':>8}"]
+    for metric in sorted(before.keys() & after.keys()):
+        ratio = after[metric] / before[metric] if before[metric] else float("nan")
+        lines.append(f"{metric:<45} {before[metric]:>14.2f} {after[metric]:>14.2f} {ratio:>8.2f}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file.")
+    parser.add_argument("--compare", type=Path, help="A previous results file to compare against.")
+    parser.add_argument("--quantity", type=int, default=500, help="Documents per measurement (default: 500).")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per timing, keeping the best.")
+    args = parser.parse_args(argv)
+
+    results = run(args.quantity, args.repeat)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        print(compare(json.loads(args.compare.read_text()), results))
+    else:
+        print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
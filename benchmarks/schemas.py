@@ -0,0 +1,98 @@
+from mongoengine import (
+    BooleanField,
+    DateTimeField,
+    DictField,
+    Document,
+    EmbeddedDocument,
+    EmbeddedDocumentField,
+    EmbeddedDocumentListField,
+    FloatField,
+    IntField,
+    ListField,
+    ReferenceField,
+    StringField,
+)
+
+
+class FlatDocument(Document):
+    """A handful of scalar fields, the baseline every other schema is compared against."""
+
+    name = StringField(required=True)
+    email = StringField(required=True)
+    age = IntField(required=True)
+    score = FloatField(required=True)
+    is_active = BooleanField(required=True)
+    joined_at = DateTimeField(required=True)
+
+    meta = {"collection": "bench_flat"}
+
+
+# 80 required scalar fields, cycling through the same types as `FlatDocument`.
+WideDocument = type(
+    "WideDocument",
+    (Document,),
+    {
+        **{
+            f"field_{index}": [StringField, IntField, FloatField, BooleanField, DateTimeField][index % 5](required=True)
+            for index in range(80)
+        },
+        "meta": {"collection": "bench_wide"},
+    },
+)
+
+
+class Address(EmbeddedDocument):
+    """The innermost level of `NestedDocument`."""
+
+    street = StringField(required=True)
+    city = StringField(required=True)
+    postcode = StringField(required=True)
+
+
+class LineItem(EmbeddedDocument):
+    """The middle level of `NestedDocument`, embedding an `Address`."""
+
+    sku = StringField(required=True)
+    quantity = IntField(required=True)
+    price = FloatField(required=True)
+    ship_to = EmbeddedDocumentField(Address, required=True)
+
+
+class NestedDocument(Document):
+    """Embedded documents three levels deep, including a list of them."""
+
+    reference = StringField(required=True)
+    billing = EmbeddedDocumentField(Address, required=True)
+    items = EmbeddedDocumentListField(LineItem, required=True)
+    tags = ListField(StringField(), required=True)
+    attributes = DictField(required=True)
+
+    meta = {"collection": "bench_nested"}
+
+
+class Author(Document):
+    """The target of `ReferenceHeavyDocument`'s references."""
+
+    name = StringField(required=True)
+
+    meta = {"collection": "bench_authors"}
+
+
+class ReferenceHeavyDocument(Document):
+    """Every instance requires saving four referenced documents first."""
+
+    title = StringField(required=True)
+    author = ReferenceField(Author, required=True)
+    editor = ReferenceField(Author, required=True)
+    reviewer = ReferenceField(Author, required=True)
+    translator = ReferenceField(Author, required=True)
+
+    meta = {"collection": "bench_references"}
+
+
+SCHEMAS = {
+    "flat": FlatDocument,
+    "wide": WideDocument,
+    "nested": NestedDocument,
+    "references": ReferenceHeavyDocument,
+}
@@ -1 +1,16 @@
-from .bakery import baker as baker
+from typing import TYPE_CHECKING, Any
+
+from .recipe import Recipe as Recipe
+
+if TYPE_CHECKING:
+    from .bakery import baker as baker
+
+
+def __getattr__(name: str) -> Any:
+    # The pytest plugin imports this package for every test run, so the baker is only imported once it's used.
+    if name == "baker":
+        from .bakery import baker
+
+        globals()["baker"] = baker
+        return baker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,27 +2,70 @@ import importlib
 import inspect
 import re
 import sys
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import ExitStack, contextmanager
 from datetime import date, datetime, timedelta
-from typing import Any
+from functools import cache, partial
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
-from faker import Faker
-from faker.generator import SeedType
+from bson import ObjectId
 from mongoengine import Document, EmbeddedDocument, signals
-
+from mongoengine.base import get_document
+from mongoengine.connection import get_db
+
+from mongo_bakery.cache import DatasetCache
+from mongo_bakery.counters import FileCounter, MongoCounter
+from mongo_bakery.datasets import export_documents, load_documents
+from mongo_bakery.distributions import Distribution
+from mongo_bakery.lazy import LazyFieldData
+from mongo_bakery.plans import GenerationPlan, column_values
+from mongo_bakery.recipe import Recipe
 from mongo_bakery.sequences import Sequence
+from mongo_bakery.sizing import Padding, target_sizes
+from mongo_bakery.snapshots import (
+    Snapshot,
+    capture_collection,
+    collection_key,
+    restore_collection,
+)
+from mongo_bakery.stats import BakeryStats
+from mongo_bakery.timeseries import TimeSeries
+
+if TYPE_CHECKING:
+    from faker.generator import SeedType
 
-faker = Faker()
 bakery_fields_generators = importlib.import_module("mongo_bakery.bakery_fields_generators")
+faker = bakery_fields_generators.faker
+
+# Keeps each `$in` filter well below MongoDB's 16MB command size limit.
+CLEANUP_BATCH_SIZE = 50_000
+# What `make(..., _return=...)` can hand back.
+RETURN_SHAPES = ("documents", "ids", "none")
+# Documents per `insert` call when `make` doesn't return documents.
+INSERT_BATCH_SIZE = 1000
+# Returned by `_usable_default` for fields that need mock data, since `None` can be a default.
+_NO_DEFAULT = object()
 
 
 class Baker:
     def __init__(self, mock_class=None):
         self._dependencies_to_patch = mock_class or []
         self._created_instances = []
+        self._created_ids: dict[type[Document], list[Any]] = {}
+        self._touched_classes: set[type[Document]] = set()
+        self._created_files: dict[tuple[str, str], list[ObjectId]] = {}
         self._generation_chain = []
+        # How many `make` calls are drawing distribution values, which may bake documents for their fields.
+        self._drawing = 0
+        self._cache: DatasetCache | None = None
+        self._seed: SeedType | None = None
+        self._generations_since_seed = 0
+        self._stats: BakeryStats | None = None
+        self._generated_fields: dict[tuple[type[Document], frozenset[str]], list[tuple[str, Any]]] = {}
+        self._embedded_plans: dict[type[EmbeddedDocument], GenerationPlan] = {}
 
     def mock_dependencies(self, mock_class: list):
         """
@@ -33,16 +76,177 @@ class Baker:
         """
         self._dependencies_to_patch = mock_class
 
+    def use_cache(self, directory: str | Path | None) -> None:
+        """
+        Cache the documents `make` saves on disk, and reload them instead of regenerating them on later runs.
+
+        Only applies once `seed` has been called, since unseeded data isn't meant to be reproducible, and only
+        to `make` calls whose kwargs are plain BSON values. Entries are keyed by the document class's schema
+        (see `mongo_bakery.cache.schema_hash`), the kwargs, `_quantity`, the seed and how many generation calls
+        were made since seeding, so a hit returns exactly what generating would have.
+
+        Args:
+            directory (str | Path | None): Where to store the cache, or `None` to disable it.
+        """
+        self._cache = DatasetCache(directory) if directory is not None else None
+
+    def collect_stats(self, enabled: bool = True) -> None:
+        """
+        Turn generation statistics on or off. They're off by default, so baking pays no instrumentation cost.
+
+        Enabling them keeps any stats already collected; use `reset_stats` to start over.
+
+        Args:
+            enabled (bool, optional): Whether to collect stats from now on. Defaults to True.
+        """
+        if not enabled:
+            self._stats = None
+        elif self._stats is None:
+            self._stats = BakeryStats()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Report where baking time went since stats were enabled or last reset.
+
+        Returns:
+            dict[str, Any]: Seconds spent baking top-level documents, by phase (`"total"`). Per document class
+            (`"documents"`): how many were created, how many of those filled a
+            reference or embedded field of another document, and seconds spent generating field values,
+            constructing, saving and bulk-writing them. Per field type (`"fields"`): how many values were generated
+            and the seconds spent in generators. For `"cleanup"`: calls, documents deleted and seconds. Timings are
+            inclusive of nested documents. Empty sections if stats were never enabled.
+        """
+        return (self._stats or BakeryStats()).as_dict()
+
+    def reset_stats(self) -> None:
+        """Discard the stats collected so far, if stats are enabled."""
+        if self._stats is not None:
+            self._stats = BakeryStats()
+
     def make(
-        self, document_class: type[Document], _quantity: int = 1, **kwargs: dict[Any, Any]
-    ) -> Document | list[Document]:
+        self,
+        document_class: type[Document],
+        _quantity: int = 1,
+        _return: str = "documents",
+        _target_bytes: int | Distribution | None = None,
+        _timeseries: TimeSeries | None = None,
+        **kwargs: dict[Any, Any],
+    ) -> Any:
         """
         Creates and saves one or more instances of a MongoEngine document.
 
         Args:
             document_class (type[Document]): The MongoEngine document class to instantiate.
             _quantity (int, optional): The number of instances to create. Defaults to 1.
-            **kwargs: Additional field values to set on the document instances.
+            _return (str, optional): `"documents"` to get the instances back; `"ids"` for just their primary
+                keys, or `"none"` for nothing. With `"ids"` and `"none"`, instances are validated and inserted
+                in bulk, then dropped, so memory doesn't grow with `_quantity`; `post_save` isn't sent, but
+                `pre_bulk_insert`/`post_bulk_insert` are. Defaults to `"documents"`.
+            _target_bytes (int | Distribution, optional): Pad each document up to this BSON size, in bytes, or
+                to sizes drawn from a distribution. Generated free-text, binary and string list fields are
+                padded; see `mongo_bakery.sizing.Padding`. Defaults to the generators' natural sizes.
+            _timeseries (TimeSeries, optional): Give the documents increasing timestamps and per-series
+                metadata, and build and write them in time order; see `mongo_bakery.timeseries.TimeSeries`.
+            **kwargs: Additional field values to set on the document instances. Callables (like the
+                `Sequence`s returned by `seq`) are called for each instance, and `Recipe`s are made for each
+                instance, e.g. to fill a `ReferenceField`. `Distribution`s from `mongo_bakery.distributions`
+                draw every instance's value at once. Iterators, `range`s and NumPy arrays are columns:
+                instance `i` gets their `i`-th value. Lists and tuples are used as-is for every instance.
+
+        Returns:
+            A single document instance (or id) if _quantity is 1, otherwise a list of them; `None` with
+            `_return="none"`.
+
+        Raises:
+            ValueError: If the provided document_class is not a subclass of mongoengine.Document
+                or mongoengine.EmbeddedDocument, or `_return` isn't one of `RETURN_SHAPES`, or ids are
+                requested for an `EmbeddedDocument`, or `_target_bytes` is given for a document with no field
+                to pad, or more than its fields have room for, or `_timeseries` fields are also given as kwargs.
+        """
+        if _return not in RETURN_SHAPES:
+            raise ValueError(f"_return must be one of {', '.join(RETURN_SHAPES)}, got {_return!r}")
+        if _timeseries is not None:
+            columns = _timeseries.columns(_quantity)
+            if overlap := sorted(set(columns) & set(kwargs)):
+                raise ValueError(f"_timeseries already sets {', '.join(overlap)}; don't pass them as kwargs too")
+            kwargs = {**kwargs, **columns}
+
+        cache = self._cache if self._seed is not None and _target_bytes is None else None
+        if cache is not None and not self._nested():
+            instances = self._make_cached(cache, document_class, _quantity, kwargs)
+            results: list[Any] = instances if _return == "documents" else [instance.pk for instance in instances]
+        elif _return == "documents":
+            results = list(self._bake(document_class, _quantity, kwargs, save=True, target_bytes=_target_bytes))
+        else:
+            results = self._insert_in_bulk(document_class, _quantity, kwargs, _target_bytes)
+
+        if _return == "none":
+            return None
+        return results if _quantity > 1 else results[0]
+
+    def _insert_in_bulk(
+        self,
+        document_class: type[Document],
+        quantity: int,
+        kwargs: dict[Any, Any],
+        target_bytes: int | Distribution | None = None,
+    ) -> list[Any]:
+        """
+        `make` without keeping instances around: validate and insert them in batches, tracking only their ids.
+
+        Returns:
+            list[Any]: The inserted documents' primary keys, in order.
+        """
+        if issubclass(document_class, EmbeddedDocument):
+            raise ValueError("EmbeddedDocuments aren't saved on their own, so make can only return them as documents")
+
+        ids: list[Any] = []
+        batch = []
+        for instance in self._bake(document_class, quantity, kwargs, save=False, target_bytes=target_bytes):
+            instance.validate()
+            batch.append(instance)
+            if len(batch) == INSERT_BATCH_SIZE:
+                ids.extend(self._insert(document_class, batch))
+                batch = []
+        if batch:
+            ids.extend(self._insert(document_class, batch))
+        return ids
+
+    def _insert(self, document_class: type[Document], batch: list[Document]) -> list[Any]:
+        """Insert one batch, tracking its ids for `cleanup()` straight away, in case a later batch fails."""
+        started = perf_counter()
+        ids = document_class.objects.insert(batch, load_bulk=False)
+        if self._stats is not None:
+            self._stats.record_write(document_class._class_name, perf_counter() - started)
+        self._created_ids.setdefault(document_class, []).extend(ids)
+        self._touched_classes.add(document_class)
+        return ids
+
+    def prepare(
+        self,
+        document_class: type[Document],
+        _quantity: int = 1,
+        _lazy: bool = False,
+        _target_bytes: int | Distribution | None = None,
+        **kwargs: dict[Any, Any],
+    ) -> Document | list[Document]:
+        """
+        Build one or more instances of a MongoEngine document like `make`, without saving them.
+
+        Documents required to fill reference fields are still created with `make`, so they're saved and
+        tracked for `cleanup()` as usual.
+
+        Args:
+            document_class (type[Document]): The MongoEngine document class to instantiate.
+            _quantity (int, optional): The number of instances to build. Defaults to 1.
+            _lazy (bool, optional): Generate each field's mock data the first time it's read, rather than up
+                front, so tests over wide documents only pay for the fields they use. Validating, saving or
+                serializing an instance generates the rest. Each instance draws a seed when it's built, and
+                each field is generated from that seed and its name, so values don't depend on the order
+                fields are read in. Defaults to False.
+            _target_bytes (int | Distribution, optional): Pad each document up to this BSON size, as for `make`.
+                Can't be combined with `_lazy`, since measuring an instance generates all of its fields.
+            **kwargs: Additional field values to set on the document instances, as for `make`.
 
         Returns:
             Document or list[Document]: A single document instance if _quantity is 1,
@@ -50,42 +254,327 @@ class Baker:
 
         Raises:
             ValueError: If the provided document_class is not a subclass of mongoengine.Document
-                or mongoengine.EmbeddedDocument.
+                or mongoengine.EmbeddedDocument, or `_target_bytes` is combined with `_lazy`.
+        """
+        if _lazy and _target_bytes is not None:
+            raise ValueError("_target_bytes can't be combined with _lazy: measuring an instance generates every field")
+        instances = list(
+            self._bake(document_class, _quantity, kwargs, save=False, lazy=_lazy, target_bytes=_target_bytes)
+        )
+        return instances if _quantity > 1 else instances[0]
+
+    def _make_cached(
+        self, cache: DatasetCache, document_class: type[Document], quantity: int, kwargs: dict[Any, Any]
+    ) -> list[Document]:
+        """
+        `make` through the dataset cache: reload a hit, or generate and store a miss.
+
+        On a hit, every document the original call saved (nested references included) is inserted in bulk
+        and tracked for `cleanup()`, and the random generator is restored to where generation left it, so
+        subsequent uncached calls still produce the same data as an uncached run would.
+        """
+        key = None
+        if issubclass(document_class, Document):
+            key = cache.key(document_class, quantity, kwargs, self._seed, self._generations_since_seed)
+        if key is None:
+            return list(self._bake(document_class, quantity, kwargs, save=True))
+
+        entry = cache.get(document_class, key)
+        if entry is None:
+            first_created = len(self._created_instances)
+            instances = list(self._bake(document_class, quantity, kwargs, save=True))
+            cache.put(document_class, key, self._created_instances[first_created:], faker.random.getstate())
+            return instances
+
+        runs, random_state = entry
+        self._generations_since_seed += 1
+        instances = []
+        for class_name, sons in runs:
+            run_class = get_document(class_name)
+            started = perf_counter()
+            run_class._get_collection().insert_many(sons)
+            if self._stats is not None:
+                self._stats.record_bulk_write(class_name, len(sons), perf_counter() - started)
+            self._touched_classes.add(run_class)
+            run_instances = [run_class._from_son(son) for son in sons]
+            self._created_instances.extend(run_instances)
+            if run_class is document_class:
+                instances.extend(run_instances)
+        faker.random.setstate(random_state)
+        return instances
+
+    def export(
+        self,
+        document_class: type[Document],
+        path: str | Path,
+        _quantity: int = 1,
+        _format: str = "bson",
+        _compress: bool = False,
+        _chunk_size: int | None = None,
+        **kwargs: dict[Any, Any],
+    ) -> list[Path]:
+        """
+        Generate instances of a MongoEngine document and stream them to files instead of saving them.
+
+        Uses the same generators as `make`, but each instance is validated, given a primary key and written
+        out as soon as it's built, so memory stays flat however large `_quantity` is. `.bson` output can be
+        loaded with `mongorestore`, `.jsonl` output (Extended JSON) with `mongoimport`.
+
+        Referenced documents required by `document_class` are still created with `make`, so they're saved
+        to the current connection and tracked for `cleanup()` as usual.
+
+        Args:
+            document_class (type[Document]): The MongoEngine document class to generate.
+            path (str | Path): The output file. See `mongo_bakery.datasets.export_documents` for how
+                chunked and compressed file names are derived from it.
+            _quantity (int, optional): The number of instances to generate. Defaults to 1.
+            _format (str, optional): `"bson"` or `"jsonl"`. Defaults to `"bson"`.
+            _compress (bool, optional): Gzip the output. Defaults to False.
+            _chunk_size (int, optional): The maximum number of documents per file. Defaults to a single file.
+            **kwargs: Additional field values to set on the generated instances.
+
+        Returns:
+            list[Path]: The files written, in order.
+        """
+        return export_documents(
+            self._prepared_for_export(self._bake(document_class, _quantity, kwargs, save=False)),
+            path,
+            format=_format,
+            compress=_compress,
+            chunk_size=_chunk_size,
+        )
+
+    def load(self, document_class: type[Document], path: str | Path, _batch_size: int = 1000) -> int:
+        """
+        Load a pre-generated `.bson` dump into `document_class`'s collection, tracking it for `cleanup()`.
+
+        The file is memory-mapped and inserted in raw batches, without building `Document` instances, so
+        reloading a large fixture set is bound by I/O rather than Python object creation. Use it with files
+        written by `export` (uncompressed) or `mongodump`.
+
+        Args:
+            document_class (type[Document]): The MongoEngine document class whose collection receives the data.
+            path (str | Path): The `.bson` file to load.
+            _batch_size (int, optional): The number of documents per `insert_many` call. Defaults to 1000.
+
+        Returns:
+            int: The number of documents loaded.
+        """
+        started = perf_counter()
+        self._touched_classes.add(document_class)
+        # Batches are tracked as they're inserted, so `cleanup()` deletes them even if a later one fails.
+        ids = load_documents(
+            document_class._get_collection(),
+            path,
+            batch_size=_batch_size,
+            on_batch=self._created_ids.setdefault(document_class, []).extend,
+        )
+        if self._stats is not None:
+            self._stats.record_bulk_write(document_class._class_name, len(ids), perf_counter() - started)
+        return len(ids)
+
+    def _bake(
+        self,
+        document_class: type[Document],
+        quantity: int,
+        kwargs: dict[Any, Any],
+        save: bool,
+        lazy: bool = False,
+        target_bytes: int | Distribution | None = None,
+    ) -> Iterator[Document]:
+        """
+        Build instances of `document_class` one at a time, optionally saving and tracking each of them.
+
+        Instances are yielded as soon as they're built, so callers that don't keep them around (like `export`)
+        never hold more than one in memory.
+
+        Args:
+            document_class: The MongoEngine document class to instantiate.
+            quantity: The number of instances to build.
+            kwargs: Explicit field values, which take precedence over defaults/mocks.
+            save: Whether to save each `Document` instance and track it for `cleanup()`.
+            lazy: Whether to defer mock data until each field is read (see `prepare`). Only for unsaved instances.
+            target_bytes: The BSON size to pad each instance up to, or a distribution of sizes (see `make`).
+
+        Yields:
+            Document: Each built instance, in order.
+
+        Raises:
+            ValueError: If the provided document_class is not a subclass of mongoengine.Document
+                or mongoengine.EmbeddedDocument, or it's already being generated further up the chain.
         """
         if not (issubclass(document_class, Document) or issubclass(document_class, EmbeddedDocument)):
             raise ValueError("The document must be a subclass of mongoengine.Document or mongoengine.EmbeddedDocument")
 
-        if document_class in self._generation_chain:
-            chain_repr = " -> ".join(cls.__name__ for cls in [*self._generation_chain, document_class])
-            raise ValueError(
-                f"Cycle detected while generating mock data for required fields: {chain_repr}. "
-                "Pass an explicit value via kwargs to break the cycle."
-            )
+        self._check_cycle(document_class)
 
+        nested = self._nested()
+        if not nested:
+            self._generations_since_seed += 1
+        save = save and not issubclass(document_class, EmbeddedDocument)
+        if save:
+            self._touched_classes.add(document_class)
+
+        # Distributions are drawn for the whole call before `_tracking` starts, since a draw may bake documents of
+        # this very class (e.g. parents in a tree); those documents still count as nested in this one.
+        started = perf_counter()
+        self._drawing += 1
+        try:
+            plan = self._plan(document_class, kwargs, quantity)
+        finally:
+            self._drawing -= 1
+        if self._stats is not None:
+            self._stats.record_timings(document_class._class_name, nested, generate=perf_counter() - started)
+        padding = None
+        if target_bytes is not None:
+            padding = Padding(plan.generated, target_sizes(target_bytes, quantity))
         with self._tracking(document_class), self._signals_disabled(document_class):
             patch_dependencies = self._build_dependency_patches(document_class)
 
-            instances = []
             with ExitStack() as stack:
                 for mock in patch_dependencies.values():
                     stack.enter_context(mock)
 
-                for _ in range(_quantity):
-                    instance_data = self._build_instance_data(document_class, kwargs)
-                    instance = document_class(**instance_data)
-                    if not issubclass(document_class, EmbeddedDocument):
-                        instance.save()
+                stats = self._stats
+                for _ in range(quantity):
+                    if lazy:
+                        instance = self._lazy_instance(document_class, plan)
+                    elif stats is None:
+                        instance = document_class(**self._build_instance_data(plan))
+                        if padding is not None:
+                            padding.pad(instance)
+                        if save:
+                            instance.save()
+                    else:
+                        instance = self._timed_instance(stats, document_class, plan, save, nested, padding)
+                    if save:
                         self._created_instances.append(instance)
-                    instances.append(instance)
+                    yield instance
+
+    def _lazy_instance(self, document_class: type[Document], plan: GenerationPlan) -> Document:
+        """Build an instance whose mock data is generated on first read, for `prepare(..., _lazy=True)`."""
+        seed = faker.random.getrandbits(64)
+        instance_data = {}
+        pending: dict[str, Callable[[], Any]] = {}
+        for field_name, field in plan.generated:
+            default_value = _usable_default(field)
+            if default_value is not _NO_DEFAULT:
+                instance_data[field_name] = default_value
+            else:
+                pending[field_name] = partial(self._seeded_mock_data, field, f"{seed}:{field_name}")
+
+        instance_data.update(plan.values)
+        for field_name, resolve in plan.resolvers.items():
+            instance_data[field_name] = resolve()
+
+        instance = document_class(**instance_data)
+        instance._data = LazyFieldData(instance._data, pending)
+        return instance
+
+    def _seeded_mock_data(self, field, seed: str) -> Any:
+        """Generate mock data for `field` from `seed`, leaving the shared random generator as it was."""
+        state = faker.random.getstate()
+        faker.random.seed(seed)
+        try:
+            return self._generate_mock_data(field)
+        finally:
+            faker.random.setstate(state)
 
-            return instances if _quantity > 1 else instances[0]
+    def _make_embedded(self, document_class: type[EmbeddedDocument]) -> EmbeddedDocument:
+        """
+        Build one `EmbeddedDocument` to fill an embedded field, skipping the work `make` does for persistence.
+
+        Embedded documents are never saved on their own, so there's no tracking for `cleanup()`, no signals
+        to silence and no dependency patching beyond what the parent's `make` already applies; the generation
+        plan is cached per class. Cycle detection still applies.
+
+        Args:
+            document_class: The embedded document class to build.
+
+        Returns:
+            EmbeddedDocument: The built instance.
+
+        Raises:
+            ValueError: If `document_class` is already being generated further up the chain.
+        """
+        self._check_cycle(document_class)
+
+        plan = self._embedded_plans.get(document_class)
+        if plan is None:
+            plan = self._embedded_plans[document_class] = self._plan(document_class, {}, 1)
+
+        self._generation_chain.append(document_class)
+        try:
+            if self._stats is not None:
+                return self._timed_instance(self._stats, document_class, plan, save=False, nested=True)
+            return document_class(**self._build_instance_data(plan))
+        finally:
+            self._generation_chain.pop()
+
+    def _timed_instance(
+        self,
+        stats: BakeryStats,
+        document_class: type[Document],
+        plan: GenerationPlan,
+        save: bool,
+        nested: bool,
+        padding: Padding | None = None,
+    ) -> Document:
+        """Build (and optionally save) one instance like `_bake` does, recording how long each phase took."""
+        started = perf_counter()
+        instance_data = self._build_instance_data(plan)
+        generated = perf_counter()
+        instance = document_class(**instance_data)
+        constructed = perf_counter()
+        if padding is not None:
+            padding.pad(instance)
+        padded = perf_counter()
+        if save:
+            instance.save()
+        saved = perf_counter()
+
+        timings = {"generate": generated - started, "construct": constructed - generated, "save": saved - padded}
+        if padding is not None:
+            timings["pad"] = padded - constructed
+        stats.record_document(document_class._class_name, nested=nested, **timings)
+        return instance
+
+    @staticmethod
+    def _prepared_for_export(instances: Iterator[Document]) -> Iterator[Document]:
+        """Give each unsaved instance the primary key `save()` would have, and validate it like `save()` does."""
+        for instance in instances:
+            if instance.pk is None and instance._meta.get("id_field"):
+                instance.pk = ObjectId()
+            instance.validate()
+            yield instance
+
+    def _nested(self) -> bool:
+        """Whether documents built now fill fields of a document another `make` call is building."""
+        return bool(self._generation_chain) or self._drawing > 0
+
+    def _check_cycle(self, document_class: type[Document] | type[EmbeddedDocument]) -> None:
+        """
+        Refuse to generate `document_class` while it's already being generated further up the chain.
+
+        Args:
+            document_class: The document class about to be generated.
+
+        Raises:
+            ValueError: If `document_class` is in `_generation_chain`, naming the chain that leads back to it.
+        """
+        if document_class in self._generation_chain:
+            chain_repr = " -> ".join(cls.__name__ for cls in [*self._generation_chain, document_class])
+            raise ValueError(
+                f"Cycle detected while generating mock data for required fields: {chain_repr}. "
+                "Pass an explicit value via kwargs to break the cycle."
+            )
 
     @contextmanager
     def _tracking(self, document_class: type[Document]) -> Iterator[None]:
         """
         Track `document_class` as in-progress for the duration of the block.
 
-        `make` consults `_generation_chain` before entering this context to detect reference
+        `_bake` calls `_check_cycle` before entering this context to detect reference
         cycles, so the class must be popped again even if the block raises.
 
         Args:
@@ -142,40 +631,78 @@ class Baker:
 
         return patch_dependencies
 
-    def _build_instance_data(self, document_class: type[Document], kwargs: dict[Any, Any]) -> dict[str, Any]:
+    def _plan(self, document_class: type[Document], kwargs: dict[Any, Any], quantity: int) -> GenerationPlan:
         """
-        Resolve constructor kwargs for a single instance of `document_class`.
+        Work out how to build each instance of `document_class` for one `make` call.
 
-        For each required field not already covered by `kwargs`, uses the field's declared default
-        if it has one, otherwise generates mock data. `kwargs` are then overlaid on top, and any
-        resulting `Sequence` values are resolved to their next value.
+        The required fields left to generate only depend on the class and the names in `kwargs`, so they're
+        cached per baker; the explicit values are split between static ones and per-instance resolvers.
+        Column-like values (see `mongo_bakery.plans.column_values`) are checked against `quantity` here,
+        before anything is built, and then hand out their values in order.
 
         Args:
-            document_class: The document class whose fields should be resolved.
+            document_class: The document class whose instances will be built.
             kwargs: Explicit field values passed to `make`, which take precedence over defaults/mocks.
+            quantity: The number of instances that will be built.
 
         Returns:
-            dict[str, Any]: Field values ready to pass to `document_class(**instance_data)`.
+            GenerationPlan: The plan for `_build_instance_data`.
+
+        Raises:
+            ValueError: If a column-like value doesn't hold `quantity` values.
         """
-        instance_data = {}
-        for field_name, field in document_class._fields.items():
-            if field_name in kwargs or field_name == "id":
-                continue
-            if not field.required:
-                continue
+        key = (document_class, frozenset(kwargs))
+        generated = self._generated_fields.get(key)
+        if generated is None:
+            generated = [
+                (field_name, field)
+                for field_name, field in document_class._fields.items()
+                if field_name not in kwargs and field_name != "id" and field.required
+            ]
+            self._generated_fields[key] = generated
+
+        values = {}
+        resolvers: dict[str, Callable[[], Any]] = {}
+        for field_name, value in kwargs.items():
+            if isinstance(value, Distribution):
+                values_drawn = value.bind(document_class._fields.get(field_name), self).take(quantity)
+                resolvers[field_name] = iter(values_drawn).__next__
+            elif isinstance(value, Recipe):
+                resolvers[field_name] = partial(value.make, _baker=self)
+            elif isinstance(value, Sequence):
+                resolvers[field_name] = iter(value.take(quantity)).__next__
+            elif (column := column_values(field_name, value, quantity)) is not None:
+                resolvers[field_name] = iter(column).__next__
+            elif callable(value) and not isinstance(value, type):
+                resolvers[field_name] = value
+            else:
+                values[field_name] = value
+        return GenerationPlan(generated, values, resolvers)
+
+    def _build_instance_data(self, plan: GenerationPlan) -> dict[str, Any]:
+        """
+        Resolve constructor kwargs for a single instance, following `plan`.
+
+        Each required field not covered by explicit values gets its declared default if it has one,
+        otherwise mock data. The explicit values are then overlaid on top, with per-instance resolvers
+        (`Sequence`s, callables and `Recipe`s) resolved to a new value.
 
-            if field.default is not None:
-                default_value = field.default() if callable(field.default) else field.default
-                if default_value or not hasattr(field, "field"):
-                    instance_data[field_name] = default_value
-                    continue
+        Args:
+            plan: The plan built by `_plan` for this `make` call.
 
-            instance_data[field_name] = self._generate_mock_data(field)
+        Returns:
+            dict[str, Any]: Field values ready to pass to `document_class(**instance_data)`.
+        """
+        instance_data = {}
+        for field_name, field in plan.generated:
+            default_value = _usable_default(field)
+            if default_value is _NO_DEFAULT:
+                default_value = self._generate_mock_data(field)
+            instance_data[field_name] = default_value
 
-        instance_data.update(kwargs)
-        for field_name, value in instance_data.items():
-            if isinstance(value, Sequence):
-                instance_data[field_name] = value()
+        instance_data.update(plan.values)
+        for field_name, resolve in plan.resolvers.items():
+            instance_data[field_name] = resolve()
 
         return instance_data
 
@@ -184,6 +711,7 @@ class Baker:
         value: str | int | float | date | datetime,
         increment_by: int | float | timedelta = 1,
         start: int | float | timedelta | None = None,
+        counter: MongoCounter | FileCounter | None = None,
     ) -> Sequence:
         """
         Build a sequence that yields an incrementing value each time `make` creates an instance.
@@ -193,13 +721,16 @@ class Baker:
             increment_by: The amount added on every call. Defaults to 1. For date/datetime values,
                 this must be a timedelta.
             start: The offset applied on the first call. Defaults to `increment_by`.
+            counter: A counter shared with other processes, e.g. pytest-xdist workers or parallel seeding
+                scripts, that leases blocks of values to this sequence so no two processes produce the same
+                one. See `mongo_bakery.counters`. Defaults to counting in this process only.
 
         Returns:
             Sequence: A callable object that `make` resolves to a new value for each instance.
         """
-        return Sequence(value, increment_by=increment_by, start=start)
+        return Sequence(value, increment_by=increment_by, start=start, counter=counter)
 
-    def seed(self, value: SeedType) -> None:
+    def seed(self, value: "SeedType") -> None:
         """
         Seed Faker's shared random generator, so `make` produces reproducible mock data.
 
@@ -209,7 +740,11 @@ class Baker:
         Args:
             value: The seed value, passed through to `Faker.seed`.
         """
+        from faker import Faker
+
         Faker.seed(value)
+        self._seed = value
+        self._generations_since_seed = 0
 
     def _generate_mock_data(self, field):
         """
@@ -222,6 +757,45 @@ class Baker:
             Any: Mock data appropriate for the given field type.
 
         """
+        if self._stats is None:
+            return self._mock_value(field)
+
+        started = perf_counter()
+        value = self._mock_value(field)
+        self._stats.record_field(type(field).__name__, perf_counter() - started)
+        return value
+
+    def _generate_many(self, field, n):
+        """
+        Generate `n` mock values for `field` at once, e.g. to fill a large container.
+
+        Uses the field type's `many_<FieldType>` bulk generator if `bakery_fields_generators` has one, and calls
+        `_generate_mock_data` `n` times otherwise.
+
+        Args:
+            field: The Field instance to generate values for.
+            n (int): How many values to generate.
+
+        Returns:
+            list: The generated values.
+        """
+        if field.choices:
+            values = [choice[0] if isinstance(choice, list | tuple) else choice for choice in field.choices]
+            return faker.random.choices(values, k=n)
+
+        many_method = getattr(bakery_fields_generators, f"many_{type(field).__name__}", None)
+        if many_method is None:
+            return [self._generate_mock_data(field) for _ in range(n)]
+        if self._stats is None:
+            return many_method(field, n)
+
+        started = perf_counter()
+        values = many_method(field, n)
+        self._stats.record_field(type(field).__name__, perf_counter() - started, count=n)
+        return values
+
+    def _mock_value(self, field):
+        """Dispatch `field` to its `choices` or `bakery_fields_generators` generator, for `_generate_mock_data`."""
         if field.choices:
             return self._mock_choice(field)
 
@@ -229,7 +803,7 @@ class Baker:
         mock_method_name = f"mock_{field_type}"
         mock_method = getattr(bakery_fields_generators, mock_method_name, self._mock_default)
 
-        if "baker" in inspect.signature(mock_method).parameters:
+        if _takes_baker(mock_method):
             return mock_method(field, self)
         return mock_method(field)
 
@@ -250,16 +824,109 @@ class Baker:
         """When there is no match for the field type."""
         raise ValueError(f"No mock defined for field type: {type(field).__name__}")
 
+    def snapshot(self) -> Snapshot:
+        """
+        Capture the contents of every collection this baker has written to, to reset them later with `restore`.
+
+        This lets a shared dataset be baked once (e.g. per session) and restored before each test, instead of
+        being cleaned up and baked again. mongomock collections are captured copy-on-write, so both capturing and
+        restoring them is cheap; real servers are dumped as raw BSON and reloaded in bulk.
+
+        Returns:
+            Snapshot: The captured state, including which instances were tracked for `cleanup()` at the time.
+        """
+        collections: dict[tuple[str, str], Any] = {}
+        for document_class in self._touched_classes:
+            collection = document_class._get_collection()
+            collections.setdefault(collection_key(collection), collection)
+
+        return Snapshot(
+            [(collection, capture_collection(collection)) for collection in collections.values()],
+            list(self._created_instances),
+            {document_class: list(ids) for document_class, ids in self._created_ids.items()},
+        )
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """
+        Reset the collections captured by `snapshot` to their captured contents.
+
+        Documents this baker created since the snapshot in collections the snapshot doesn't cover are deleted, and
+        what's tracked for `cleanup()` goes back to what it was when the snapshot was taken.
+
+        Args:
+            snapshot (Snapshot): A snapshot returned by `snapshot()`.
+        """
+        for collection, state in snapshot.collections:
+            restore_collection(collection, state)
+
+        tracked_then = {id(instance) for instance in snapshot.created_instances}
+        for instance in self._created_instances:
+            if id(instance) not in tracked_then and not snapshot.covers(instance._get_collection()):
+                instance.delete()
+        for document_class, ids in self._created_ids.items():
+            collection = document_class._get_collection()
+            if not snapshot.covers(collection):
+                ids_then = set(snapshot.created_ids.get(document_class, []))
+                collection.delete_many({"_id": {"$in": [id_ for id_ in ids if id_ not in ids_then]}})
+
+        self._created_instances = list(snapshot.created_instances)
+        self._created_ids = {document_class: list(ids) for document_class, ids in snapshot.created_ids.items()}
+
+    def _track_file(self, db_alias: str, collection_name: str, grid_id: ObjectId) -> None:
+        """Track a GridFS file stored by a `FileField` generator, for `cleanup()`."""
+        self._created_files.setdefault((db_alias, collection_name), []).append(grid_id)
+
     def cleanup(self):
         """
         Delete all created instances.
 
         This method iterates over all instances stored in the `_created_instances`
         list, calls their `delete` method to remove them, and then clears the list.
+        Documents tracked only by id (e.g. those inserted by `load`) are deleted in bulk, per collection,
+        and so are GridFS files generated for `FileField`s, including those of unsaved or bulk-inserted documents.
         """
+        started = perf_counter()
+        deleted = len(self._created_instances) + sum(len(ids) for ids in self._created_ids.values())
         for instance in self._created_instances:
             instance.delete()
         self._created_instances.clear()
 
+        for document_class, ids in self._created_ids.items():
+            collection = document_class._get_collection()
+            for start in range(0, len(ids), CLEANUP_BATCH_SIZE):
+                collection.delete_many({"_id": {"$in": ids[start : start + CLEANUP_BATCH_SIZE]}})
+        self._created_ids.clear()
+
+        for (db_alias, collection_name), grid_ids in self._created_files.items():
+            database = get_db(db_alias)
+            for start in range(0, len(grid_ids), CLEANUP_BATCH_SIZE):
+                batch = grid_ids[start : start + CLEANUP_BATCH_SIZE]
+                database[f"{collection_name}.files"].delete_many({"_id": {"$in": batch}})
+                database[f"{collection_name}.chunks"].delete_many({"files_id": {"$in": batch}})
+        self._created_files.clear()
+
+        if self._stats is not None:
+            self._stats.record_cleanup(deleted, perf_counter() - started)
+
+
+def _usable_default(field) -> Any:
+    """
+    Return the value of `field`'s declared default, or `_NO_DEFAULT` if mock data should be generated instead.
+
+    A required complex field (e.g. a `ListField`) whose default is empty would fail validation, so it gets mock data.
+    """
+    if field.default is None:
+        return _NO_DEFAULT
+    default_value = field.default() if callable(field.default) else field.default
+    if default_value or not hasattr(field, "field"):
+        return default_value
+    return _NO_DEFAULT
+
+
+@cache
+def _takes_baker(mock_method: Callable[..., Any]) -> bool:
+    """Whether a generator takes the baker as its second argument, cached since `inspect.signature` is slow."""
+    return "baker" in inspect.signature(mock_method).parameters
+
 
 baker = Baker()
@@ -1,7 +1,9 @@
 from bson import ObjectId
-from faker import Faker
+from mongoengine import EmbeddedDocument
 
-faker = Faker()
+from mongo_bakery.lazy import LazyFaker
+
+faker = LazyFaker()
 
 
 def mock_DateField(field):
@@ -76,15 +78,102 @@ def mock_ObjectIdField(field):
 
 
 def mock_ReferenceField(field, baker):
-    return baker.make(field.document_type)
+    document_type = field.document_type
+    if issubclass(document_type, EmbeddedDocument):
+        return baker._make_embedded(document_type)
+    return baker.make(document_type)
 
 
 mock_EmbeddedDocumentField = mock_ReferenceField
 mock_LazyReferenceField = mock_ReferenceField
 
 
+def mock_BinaryField(field):
+    from mongo_bakery.buffers import payload_size, pool
+
+    return bytes(pool.take(payload_size(field)))
+
+
+def mock_PointField(field):
+    from mongo_bakery.geo import shapes
+
+    return shapes(field, 1)[0]
+
+
+mock_GeoPointField = mock_PointField
+mock_LineStringField = mock_PointField
+mock_PolygonField = mock_PointField
+mock_MultiPointField = mock_PointField
+mock_MultiLineStringField = mock_PointField
+mock_MultiPolygonField = mock_PointField
+
+
+def mock_FileField(field, baker):
+    from mongo_bakery.files import DEFAULT_FILE_BYTES, put_random_file
+
+    return put_random_file(field, DEFAULT_FILE_BYTES, baker)
+
+
+def mock_ImageField(field, baker):
+    from mongo_bakery.files import put_random_image
+
+    return put_random_image(field, baker)
+
+
 def mock_GenericReferenceField(field, baker):
     raise ValueError(
         "GenericReferenceField has no fixed document_type to mock automatically; "
         "pass an explicit value via baker.make(..., <field_name>=<document_instance>)."
     )
+
+
+# Bulk generators: `many_<FieldType>(field, n)` returns `n` values at once, drawn from the same range as
+# `mock_<FieldType>`. `Baker._generate_many` uses them when filling large containers or distribution pools, and
+# falls back to calling `mock_<FieldType>` `n` times for field types without one.
+
+
+def many_StringField(field, n):
+    if field.name and hasattr(faker, field.name):
+        return [mock_StringField(field) for _ in range(n)]
+    return faker.words(nb=n)
+
+
+def many_IntField(field, n):
+    return faker.random.choices(range(101), k=n)
+
+
+many_LongField = many_IntField
+
+
+def many_FloatField(field, n):
+    uniform = faker.random.uniform
+    return [uniform(0.1, 1000) for _ in range(n)]
+
+
+def many_BooleanField(field, n):
+    return faker.random.choices((True, False), k=n)
+
+
+def many_BinaryField(field, n):
+    from mongo_bakery.buffers import payload_size, pool
+
+    size = payload_size(field)
+    return [bytes(pool.take(size)) for _ in range(n)]
+
+
+def many_PointField(field, n):
+    from mongo_bakery.geo import shapes
+
+    return shapes(field, n)
+
+
+many_GeoPointField = many_PointField
+many_LineStringField = many_PointField
+many_PolygonField = many_PointField
+many_MultiPointField = many_PointField
+many_MultiLineStringField = many_PointField
+many_MultiPolygonField = many_PointField
+
+
+def many_ObjectIdField(field, n):
+    return [ObjectId() for _ in range(n)]
@@ -0,0 +1,58 @@
+import random
+
+from mongo_bakery.bakery_fields_generators import faker
+
+# Size of the payloads `mock_BinaryField` generates, unless the field's `max_bytes` or a `Length` says otherwise.
+DEFAULT_PAYLOAD_BYTES = 256
+
+# Size of the shared pool of random bytes, allocated on first use.
+POOL_BYTES = 8 * 1024 * 1024
+
+# The pool's contents are fixed, so seeding Faker (which picks where payloads start) is enough for reproducibility.
+POOL_SEED = 20_240_501
+
+
+class BufferPool:
+    """
+    A block of random bytes that binary payloads are sliced out of, instead of generating each one.
+
+    Generating random bytes costs about as much per byte as copying them, so slicing payloads out of one large
+    pre-generated buffer through `memoryview`s makes binary-heavy documents cheap to bake: the only copy is the
+    one that turns a slice into the `bytes` a field stores. Each payload starts at a random offset drawn from
+    Faker's shared random generator, so payloads differ and `baker.seed()` reproduces them.
+
+    Args:
+        size (int, optional): The pool size in bytes. Defaults to `POOL_BYTES`.
+    """
+
+    def __init__(self, size: int = POOL_BYTES):
+        self.size = size
+        self._view: memoryview | None = None
+
+    def take(self, n: int) -> memoryview:
+        """
+        Return `n` random bytes, as a view into the pool when it's large enough, without copying them.
+
+        Args:
+            n (int): The number of bytes.
+
+        Returns:
+            memoryview: The bytes. Payloads larger than the pool are stitched together from several slices.
+        """
+        view = self._view if self._view is not None else self._allocate()
+        if n <= self.size:
+            start = faker.random.randrange(self.size - n + 1)
+            return view[start : start + n]
+        return memoryview(b"".join(self.take(min(self.size, n - offset)) for offset in range(0, n, self.size)))
+
+    def _allocate(self) -> memoryview:
+        self._view = memoryview(random.Random(POOL_SEED).randbytes(self.size))  # noqa: S311
+        return self._view
+
+
+def payload_size(field, size: int = DEFAULT_PAYLOAD_BYTES) -> int:
+    """Cap a `BinaryField` payload `size` to the field's `max_bytes`, if it declares one."""
+    return size if field.max_bytes is None else min(size, field.max_bytes)
+
+
+pool = BufferPool()
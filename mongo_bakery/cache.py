@@ -0,0 +1,214 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import bson
+from bson import json_util
+from bson.errors import InvalidBSON
+from mongoengine import Document, FileField
+from mongoengine.base import BaseField
+
+from mongo_bakery.__about__ import __version__
+from mongo_bakery.datasets import DEFAULT_CODEC_OPTIONS
+
+# Field attributes that change between otherwise identical schemas without affecting the generated data.
+# `document_type_obj` turns from a class name into the class once it's resolved; `document_type` is described instead.
+_IGNORED_FIELD_ATTRIBUTES = {
+    "creation_counter",
+    "owner_document",
+    "_owner_document",
+    "_auto_dereference",
+    "document_type_obj",
+}
+
+
+class DatasetCache:
+    """
+    On-disk cache for the documents `Baker.make` saves, keyed by schema, arguments and seed.
+
+    Entries live in one directory per document class, named `<schema hash>-<arguments hash>`, so a schema change
+    only invalidates (and prunes) the entries of the class whose schema changed. Each entry is a `.bson` file
+    holding every document saved by the `make` call, nested references included, plus a small `.json` manifest.
+    Both are written under temporary names and moved into place, data first, so concurrent readers (e.g. other
+    pytest-xdist workers) only ever see complete entries.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+
+    def key(
+        self, document_class: type[Document], quantity: int, kwargs: dict[str, Any], seed: Any, position: int
+    ) -> str | None:
+        """
+        Build the cache key for a `make` call, or `None` if its kwargs can't be part of one.
+
+        Document classes with a `FileField` or `ImageField`, directly or in the documents they embed or
+        reference, are never cached: entries hold documents, not the GridFS files they point to.
+
+        Args:
+            document_class: The document class passed to `make`.
+            quantity: The `_quantity` passed to `make`.
+            kwargs: The field values passed to `make`. Only BSON-serializable values are cacheable;
+                anything stateful, like a `Sequence` or a `Document` instance, makes the call uncacheable.
+            seed: The value last passed to `Baker.seed`.
+            position: How many generation calls were made since `Baker.seed`, since each one
+                continues from the random state the previous one left behind.
+
+        Returns:
+            str | None: The key, or `None` if the call can't be cached.
+        """
+        if _stores_files(document_class, set()):
+            return None
+        try:
+            arguments = json_util.dumps(
+                {"quantity": quantity, "kwargs": kwargs, "seed": repr(seed), "position": position},
+                sort_keys=True,
+                json_options=json_util.CANONICAL_JSON_OPTIONS,
+            )
+        except (TypeError, ValueError):
+            return None
+        arguments_hash = hashlib.sha256(arguments.encode()).hexdigest()[:16]
+        return f"{schema_hash(document_class)}-{arguments_hash}"
+
+    def get(self, document_class: type[Document], key: str) -> tuple[list[tuple[str, list[dict]]], Any] | None:
+        """
+        Read a cache entry.
+
+        Args:
+            document_class: The document class the entry was stored for.
+            key: The key returned by `key`.
+
+        Returns:
+            The saved documents as `(class name, documents)` runs in save order, and the random state
+            generation left behind; or `None` on a miss, including an entry that's missing or can't be decoded.
+        """
+        data_path, manifest_path = self._paths(document_class, key)
+        if not (data_path.exists() and manifest_path.exists()):
+            return None
+
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            with data_path.open("rb") as handle:
+                documents = bson.decode_file_iter(handle, codec_options=DEFAULT_CODEC_OPTIONS)
+                runs = [
+                    (class_name, [next(documents) for _ in range(count)]) for class_name, count in manifest["runs"]
+                ]
+        except (OSError, ValueError, KeyError, StopIteration, InvalidBSON):
+            return None
+
+        version, internal_state, gauss_next = manifest["random_state"]
+        return runs, (version, tuple(internal_state), gauss_next)
+
+    def put(self, document_class: type[Document], key: str, documents: list[Any], random_state: Any) -> None:
+        """
+        Store the documents saved by a `make` call, replacing entries stored under an older schema.
+
+        Args:
+            document_class: The document class passed to `make`.
+            key: The key returned by `key`.
+            documents: Every `Document` instance saved by the call, in save order.
+            random_state: The random generator's state once generation finished.
+        """
+        data_path, manifest_path = self._paths(document_class, key)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        schema = key.partition("-")[0]
+        for stale in data_path.parent.iterdir():
+            if not stale.name.startswith(f"{schema}-"):
+                stale.unlink(missing_ok=True)
+
+        runs: list[list[Any]] = []
+
+        def write_documents(handle: BinaryIO) -> None:
+            for document in documents:
+                if runs and runs[-1][0] == document._class_name:
+                    runs[-1][1] += 1
+                else:
+                    runs.append([document._class_name, 1])
+                handle.write(bson.encode(document.to_mongo(), codec_options=DEFAULT_CODEC_OPTIONS))
+
+        # The manifest goes last, so `get` only sees an entry once its data is complete.
+        _write_atomically(data_path, write_documents)
+        manifest = json.dumps({"runs": runs, "random_state": random_state}).encode()
+        _write_atomically(manifest_path, lambda handle: handle.write(manifest))
+
+    def _paths(self, document_class: type[Document], key: str) -> tuple[Path, Path]:
+        directory = self.directory / f"{document_class.__module__}.{document_class.__qualname__}"
+        return directory / f"{key}.bson", directory / f"{key}.json"
+
+
+def _write_atomically(path: Path, write: Callable[[BinaryIO], Any]) -> None:
+    """Write `path` through a temporary file next to it, then move it into place in one step."""
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            write(handle)
+        os.replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+def schema_hash(document_class: type[Document]) -> str:
+    """
+    Hash everything about a document class that affects the data `make` generates for it.
+
+    Covers each field's type and constraints, the collection it's saved to, every document class it embeds or
+    references (recursively), and the mongo_bakery version, since generators change between releases.
+
+    Args:
+        document_class: The MongoEngine document class to hash.
+
+    Returns:
+        str: A short hex digest.
+    """
+    description = json.dumps([__version__, _describe_document(document_class, set())], sort_keys=True, default=repr)
+    return hashlib.sha256(description.encode()).hexdigest()[:16]
+
+
+def _describe_document(document_class: type[Document], seen: set[type]) -> Any:
+    if document_class in seen:
+        return document_class.__qualname__
+    seen.add(document_class)
+    fields = {name: _describe_value(field, seen) for name, field in sorted(document_class._fields.items())}
+    return [document_class.__qualname__, document_class._meta.get("collection"), fields]
+
+
+def _stores_files(document_class: type[Document], seen: set[type]) -> bool:
+    """Whether `document_class`, or any document class it embeds or references, has a GridFS-backed field."""
+    if document_class in seen:
+        return False
+    seen.add(document_class)
+    for field in document_class._fields.values():
+        while field is not None:
+            if isinstance(field, FileField):
+                return True
+            document_type = getattr(field, "document_type", None)
+            if isinstance(document_type, type) and _stores_files(document_type, seen):
+                return True
+            field = getattr(field, "field", None)
+    return False
+
+
+def _describe_value(value: Any, seen: set[type]) -> Any:
+    if isinstance(value, BaseField):
+        attributes = {
+            name: _describe_value(attribute, seen)
+            for name, attribute in sorted(vars(value).items())
+            if name not in _IGNORED_FIELD_ATTRIBUTES
+        }
+        if hasattr(type(value), "document_type"):
+            attributes["document_type"] = _describe_value(value.document_type, seen)
+        return [type(value).__qualname__, attributes]
+    if isinstance(value, type) and hasattr(value, "_fields"):
+        return _describe_document(value, seen)
+    if isinstance(value, list | tuple):
+        return [_describe_value(item, seen) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _describe_value(item, seen) for key, item in sorted(value.items(), key=str)}
+    if callable(value):
+        return getattr(value, "__qualname__", repr(value))
+    return value
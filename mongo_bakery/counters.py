@@ -0,0 +1,111 @@
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+DEFAULT_BLOCK_SIZE = 1000
+
+
+class MongoCounter:
+    """
+    A counter shared by every process connected to the same database, for `baker.seq(..., counter=...)`.
+
+    Each lease is a single `find_one_and_update` with `$inc` on a counter document, which MongoDB applies
+    atomically, so processes reserve blocks of indexes instead of coordinating on every value.
+
+    Args:
+        name (str): The counter's name: sequences sharing a name share their values.
+        block_size (int, optional): How many indexes a sequence leases at a time. Defaults to 1000.
+        alias (str, optional): The MongoEngine connection alias holding the counter. Defaults to "default".
+        collection_name (str, optional): The collection holding counter documents.
+            Defaults to "mongo_bakery_counters".
+    """
+
+    def __init__(
+        self,
+        name: str,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        alias: str = "default",
+        collection_name: str = "mongo_bakery_counters",
+    ):
+        self.name = name
+        self.block_size = block_size
+        self.alias = alias
+        self.collection_name = collection_name
+
+    def lease(self, count: int) -> int:
+        """
+        Reserve the next `count` indexes for the calling process.
+
+        Args:
+            count (int): How many indexes to reserve.
+
+        Returns:
+            int: The first reserved index; the block is `range(first, first + count)`.
+        """
+        from pymongo import ReturnDocument
+
+        counter = self._collection().find_one_and_update(
+            {"_id": self.name}, {"$inc": {"next": count}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+        return counter["next"] - count
+
+    def reset(self) -> None:
+        """Start the counter over from 0."""
+        self._collection().delete_one({"_id": self.name})
+
+    def _collection(self) -> Any:
+        from mongoengine.connection import get_db
+
+        return get_db(self.alias)[self.collection_name]
+
+
+class FileCounter:
+    """
+    A counter shared by every process on one machine through a file, for `baker.seq(..., counter=...)`.
+
+    Each lease reads and bumps the number stored in the file under an exclusive `flock`, so it needs no
+    database, but only works on POSIX systems.
+
+    Args:
+        path (str | Path): The file holding the counter. It's created on first use.
+        block_size (int, optional): How many indexes a sequence leases at a time. Defaults to 1000.
+
+    Raises:
+        OSError: If file locking isn't available on this platform.
+    """
+
+    def __init__(self, path: str | Path, block_size: int = DEFAULT_BLOCK_SIZE):
+        if fcntl is None:
+            raise OSError("FileCounter needs fcntl file locking, which isn't available on this platform")
+        self.path = Path(path)
+        self.block_size = block_size
+
+    def lease(self, count: int) -> int:
+        """
+        Reserve the next `count` indexes for the calling process.
+
+        Args:
+            count (int): How many indexes to reserve.
+
+        Returns:
+            int: The first reserved index; the block is `range(first, first + count)`.
+        """
+        descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+            first = int(os.read(descriptor, 32) or 0)
+            os.lseek(descriptor, 0, os.SEEK_SET)
+            os.ftruncate(descriptor, 0)
+            os.write(descriptor, str(first + count).encode())
+            return first
+        finally:
+            os.close(descriptor)
+
+    def reset(self) -> None:
+        """Start the counter over from 0."""
+        self.path.unlink(missing_ok=True)
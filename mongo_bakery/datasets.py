@@ -0,0 +1,214 @@
+import gzip
+import mmap
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
+from io import BufferedIOBase
+from pathlib import Path
+from typing import Any
+
+import bson
+from bson import json_util
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
+
+EXPORT_FORMATS = ("bson", "jsonl")
+
+DEFAULT_CODEC_OPTIONS: CodecOptions = CodecOptions(uuid_representation=UuidRepresentation.STANDARD)
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_OBJECT_ID_FIRST_ELEMENT = b"\x07_id\x00"
+
+
+def export_documents(
+    documents: Iterable[Any],
+    path: str | Path,
+    format: str = "bson",
+    compress: bool = False,
+    chunk_size: int | None = None,
+    codec_options: CodecOptions = DEFAULT_CODEC_OPTIONS,
+) -> list[Path]:
+    """
+    Stream documents to `.bson` (mongorestore) or Extended JSON lines (mongoimport) files.
+
+    Each document is encoded and written as soon as it's pulled from `documents`, so memory use stays flat
+    regardless of how many documents are exported.
+
+    Args:
+        documents: The documents to write, either MongoEngine documents or plain mappings.
+        path: The output file. With `chunk_size`, a zero-padded chunk number is inserted before the suffix
+            (`users.bson` -> `users.00000.bson`, `users.00001.bson`, ...).
+        format: Either `"bson"` or `"jsonl"`.
+        compress: Gzip the output (mongorestore/mongoimport read it with `--gzip`). Appends `.gz` to the
+            file name if it's not already there.
+        chunk_size: The maximum number of documents per file. Defaults to a single file.
+        codec_options: Used to encode values whose BSON representation is ambiguous, such as `uuid.UUID`.
+
+    Returns:
+        list[Path]: The files written, in order.
+
+    Raises:
+        ValueError: If `format` is not supported or `chunk_size` is not positive.
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {format!r}. Expected one of: {', '.join(EXPORT_FORMATS)}")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    path = Path(path)
+    if compress and path.suffix != ".gz":
+        path = path.with_name(f"{path.name}.gz")
+
+    json_options = json_util.CANONICAL_JSON_OPTIONS.with_options(
+        uuid_representation=codec_options.uuid_representation
+    )
+    written: list[Path] = []
+    with ExitStack() as stack:
+        handle = None
+        for index, document in enumerate(documents):
+            if handle is None or (chunk_size is not None and index % chunk_size == 0):
+                stack.close()
+                target = path if chunk_size is None else _chunk_path(path, index // chunk_size)
+                handle = stack.enter_context(_open(target, compress))
+                written.append(target)
+
+            son = document.to_mongo() if hasattr(document, "to_mongo") else document
+            if format == "bson":
+                handle.write(bson.encode(son, codec_options=codec_options))
+            else:
+                handle.write(json_util.dumps(son, json_options=json_options).encode())
+                handle.write(b"\n")
+
+    return written
+
+
+def _open(path: Path, compress: bool) -> BufferedIOBase:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if compress:
+        return gzip.open(path, "wb")
+    return path.open("wb")
+
+
+def _chunk_path(path: Path, chunk: int) -> Path:
+    """Insert `chunk` before the format and `.gz` suffixes of `path`, e.g. `users.v2.00001.bson.gz`."""
+    name, suffixes = path.name, ""
+    if name.endswith(".gz"):
+        name, suffixes = name[: -len(".gz")], ".gz"
+    for format in EXPORT_FORMATS:
+        if name.endswith(f".{format}"):
+            name, suffixes = name[: -len(format) - 1], f".{format}{suffixes}"
+            break
+    return path.with_name(f"{name}.{chunk:05d}{suffixes}")
+
+
+def load_documents(
+    collection: Any,
+    path: str | Path,
+    batch_size: int = 1000,
+    codec_options: CodecOptions = DEFAULT_CODEC_OPTIONS,
+    on_batch: Callable[[list[Any]], None] | None = None,
+) -> list[Any]:
+    """
+    Insert every document of a `.bson` dump into `collection`, without building MongoEngine documents.
+
+    The file is memory-mapped and sliced into raw documents by their length prefixes. Against a real server
+    (a `pymongo` collection), those slices are inserted as `RawBSONDocument` batches, so they're never decoded
+    into Python objects; other collection types (such as mongomock's) need plain dicts, so they're decoded first.
+
+    Args:
+        collection: The collection to insert into.
+        path: An uncompressed `.bson` file, as written by `export_documents` or `mongodump`.
+        batch_size: The number of documents sent per `insert_many` call.
+        codec_options: Used to decode values whose BSON representation is ambiguous, such as UUIDs.
+        on_batch: Called with the `_id`s of each batch as soon as it's inserted, so callers can track what was
+            written even if a later batch fails. When `insert_many` raises a `BulkWriteError`, it's called with
+            the `_id`s that did get inserted before the error is re-raised.
+
+    Returns:
+        list[Any]: The `_id` of every inserted document, in file order.
+
+    Raises:
+        ValueError: If the file is gzip-compressed or isn't a well-formed sequence of BSON documents.
+        BulkWriteError: If some documents of a batch couldn't be inserted, e.g. because their `_id` exists.
+    """
+    path = Path(path)
+    if path.stat().st_size == 0:
+        return []
+
+    raw = isinstance(collection, Collection)
+    raw_codec_options = codec_options.with_options(document_class=RawBSONDocument)
+    ids: list[Any] = []
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if buffer[:2] == _GZIP_MAGIC:
+            raise ValueError(f"{path} is gzip-compressed and can't be memory-mapped; decompress it first")
+
+        batch: list[Any] = []
+        for data in iter_raw_documents(buffer):
+            if raw:
+                document: Any = RawBSONDocument(data, codec_options=raw_codec_options)
+                ids.append(_raw_document_id(data, document))
+            else:
+                document = bson.decode(data, codec_options=codec_options)
+                ids.append(document["_id"])
+            batch.append(document)
+            if len(batch) >= batch_size:
+                _insert_batch(collection, batch, ids[-len(batch) :], on_batch)
+                batch = []
+        if batch:
+            _insert_batch(collection, batch, ids[-len(batch) :], on_batch)
+
+    return ids
+
+
+def _insert_batch(
+    collection: Any, batch: list[Any], ids: list[Any], on_batch: Callable[[list[Any]], None] | None
+) -> None:
+    """Insert `batch`, whose `_id`s are `ids`, reporting those that were inserted to `on_batch`."""
+    try:
+        collection.insert_many(batch, ordered=False)
+    except BulkWriteError as error:
+        failed = {write_error["index"] for write_error in error.details.get("writeErrors", [])}
+        if on_batch is not None:
+            on_batch([document_id for index, document_id in enumerate(ids) if index not in failed])
+        raise
+    if on_batch is not None:
+        on_batch(ids)
+
+
+def iter_raw_documents(buffer: Any) -> Iterator[bytes]:
+    """
+    Slice a buffer holding concatenated BSON documents into one `bytes` object per document.
+
+    Args:
+        buffer: Any object supporting slicing and `len()`, such as `bytes` or an `mmap.mmap`.
+
+    Yields:
+        bytes: Each encoded document, in order.
+
+    Raises:
+        ValueError: If a length prefix is invalid or runs past the end of the buffer.
+    """
+    offset = 0
+    size = len(buffer)
+    while offset < size:
+        if size - offset < 5:
+            raise ValueError(f"Truncated BSON document at offset {offset}")
+        (length,) = struct.unpack_from("<i", buffer, offset)
+        if length < 5 or offset + length > size:
+            raise ValueError(f"Invalid BSON document length {length} at offset {offset}")
+        yield buffer[offset : offset + length]
+        offset += length
+
+
+def _raw_document_id(data: bytes, document: RawBSONDocument) -> Any:
+    """
+    Read the `_id` of an encoded document, without inflating it when `_id` is a leading ObjectId.
+
+    `mongoengine` and `mongodump` both write `_id` first, so the common case is a fixed-size read.
+    """
+    if data[4:9] == _OBJECT_ID_FIRST_ELEMENT:
+        return bson.ObjectId(data[9:21])
+    return document["_id"]
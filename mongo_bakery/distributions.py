@@ -0,0 +1,307 @@
+import copy
+import itertools
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from mongo_bakery.bakery_fields_generators import faker
+from mongo_bakery.buffers import payload_size, pool
+from mongo_bakery.files import put_random_file
+
+# Integer field types whose values `Normal` rounds by default.
+_INTEGER_FIELD_TYPES = {"IntField", "LongField", "SequenceField"}
+
+
+class Distribution(ABC):
+    """
+    Base class for the distributions `make` accepts as field values, drawing one value per instance.
+
+    `make` binds a distribution to the field it's passed for, then draws every value it needs with a single
+    `take(quantity)`, so subclasses can generate values in bulk. All randomness comes from Faker's shared random
+    generator, so `baker.seed()` makes distributions reproducible too.
+    """
+
+    field: Any = None
+    baker: Any = None
+
+    def bind(self, field: Any, baker: Any) -> "Distribution":
+        """
+        Return a copy of the distribution bound to `field`, for distributions that depend on the field's type.
+
+        Args:
+            field: The field the values are for, or `None` if the document class doesn't declare it.
+            baker: The `Baker` generating the values.
+
+        Returns:
+            Distribution: The bound copy.
+        """
+        bound = copy.copy(self)
+        bound.field = field
+        bound.baker = baker
+        return bound
+
+    @abstractmethod
+    def take(self, n: int) -> list[Any]:
+        """Draw `n` values."""
+
+    def _generated(self, n: int) -> list[Any]:
+        """Draw `n` values from the bound field's own generator, as `make` would without a distribution."""
+        if self.field is None:
+            raise ValueError(f"{type(self).__name__} needs `of` for a field the document class doesn't declare")
+        return self.baker._generate_many(self.field, n)
+
+    def _rounded(self, values: list[float], integer: bool | None) -> list[Any]:
+        """Round `values` to ints if `integer` is set, or by default if the bound field is an integer field."""
+        if integer is None:
+            integer = type(self.field).__name__ in _INTEGER_FIELD_TYPES
+        return [round(value) for value in values] if integer else values
+
+
+class Weighted(Distribution):
+    """
+    Pick among fixed values with the given relative weights, e.g. for a skewed `choices` field.
+
+    Args:
+        weights (dict): Each value mapped to its relative weight.
+    """
+
+    def __init__(self, weights: dict[Any, float]):
+        self.values = list(weights)
+        self.cum_weights = list(itertools.accumulate(weights.values()))
+
+    def take(self, n: int) -> list[Any]:
+        return faker.random.choices(self.values, cum_weights=self.cum_weights, k=n)
+
+
+class Zipf(Distribution):
+    """
+    Draw ranks from 1 to `n` with probability proportional to `1 / rank ** s`: a few hot keys, a long tail.
+
+    Args:
+        n (int): The number of distinct ranks.
+        s (float, optional): The skew exponent; higher is more skewed. Defaults to 1.1.
+        values (Sequence, optional): Values to return instead of ranks, hottest first. Must hold `n` values.
+    """
+
+    def __init__(self, n: int, s: float = 1.1, values: Sequence[Any] | None = None):
+        if values is not None and len(values) != n:
+            raise ValueError(f"Zipf needs {n} values, got {len(values)}")
+        self.population = list(values) if values is not None else list(range(1, n + 1))
+        self.cum_weights = list(itertools.accumulate(1 / rank**s for rank in range(1, n + 1)))
+
+    def take(self, n: int) -> list[Any]:
+        return faker.random.choices(self.population, cum_weights=self.cum_weights, k=n)
+
+
+class Normal(Distribution):
+    """
+    Draw from a normal distribution, optionally clamped, rounded for integer fields.
+
+    Args:
+        mean (float): The mean.
+        stddev (float): The standard deviation.
+        min_value (float, optional): The lowest value returned; lower draws are clamped.
+        max_value (float, optional): The highest value returned; higher draws are clamped.
+        integer (bool, optional): Round values to ints. Defaults to whether the field is an integer field.
+    """
+
+    def __init__(
+        self,
+        mean: float,
+        stddev: float,
+        min_value: float | None = None,
+        max_value: float | None = None,
+        integer: bool | None = None,
+    ):
+        self.mean = mean
+        self.stddev = stddev
+        self.min_value = min_value
+        self.max_value = max_value
+        self.integer = integer
+
+    def take(self, n: int) -> list[Any]:
+        gauss, mean, stddev = faker.random.gauss, self.mean, self.stddev
+        values = [gauss(mean, stddev) for _ in range(n)]
+        if self.min_value is not None or self.max_value is not None:
+            low = self.min_value if self.min_value is not None else float("-inf")
+            high = self.max_value if self.max_value is not None else float("inf")
+            values = [min(max(value, low), high) for value in values]
+        return self._rounded(values, self.integer)
+
+
+class Pareto(Distribution):
+    """
+    Draw from a Pareto distribution: mostly values close to `scale`, with a heavy tail of much larger ones.
+
+    Args:
+        alpha (float): The shape; lower values make the tail heavier.
+        scale (float, optional): The lowest value drawn. Defaults to 1.
+        max_value (float, optional): The highest value returned; higher draws are clamped.
+        integer (bool, optional): Round values to ints. Defaults to whether the field is an integer field.
+    """
+
+    def __init__(self, alpha: float, scale: float = 1, max_value: float | None = None, integer: bool | None = None):
+        self.alpha = alpha
+        self.scale = scale
+        self.max_value = max_value
+        self.integer = integer
+
+    def take(self, n: int) -> list[Any]:
+        paretovariate, alpha, scale = faker.random.paretovariate, self.alpha, self.scale
+        values = [scale * paretovariate(alpha) for _ in range(n)]
+        if self.max_value is not None:
+            max_value = self.max_value
+            values = [min(value, max_value) for value in values]
+        return self._rounded(values, self.integer)
+
+
+class Cardinality(Distribution):
+    """
+    Draw from a fixed pool of `n` distinct values, to control how selective an index on the field is.
+
+    The pool is generated once per `make` call, by the field's own generator or by `of`.
+
+    Args:
+        n (int): The number of distinct values.
+        skew (float, optional): Zipf exponent for how often each pool value is drawn. Defaults to uniform.
+        of (Distribution | Callable, optional): Where pool values come from. Defaults to the field's generator.
+    """
+
+    # How many draws per distinct value to try before giving up on a generator with too few possible values.
+    ATTEMPTS_PER_VALUE = 20
+
+    def __init__(self, n: int, skew: float | None = None, of: Distribution | Callable[[], Any] | None = None):
+        self.n = n
+        self.skew = skew
+        self.of = of
+
+    def take(self, n: int) -> list[Any]:
+        pool = self._pool()
+        if self.skew is None:
+            return faker.random.choices(pool, k=n)
+        return Zipf(len(pool), s=self.skew, values=pool).take(n)
+
+    def _pool(self) -> list[Any]:
+        pool: dict[Any, None] = {}
+        for _ in range(self.ATTEMPTS_PER_VALUE):
+            for value in _draw(self.of, self, self.n - len(pool)):
+                pool.setdefault(_hashable(value), value)
+            if len(pool) >= self.n:
+                return list(pool.values())
+        raise ValueError(f"Could only generate {len(pool)} distinct values, fewer than the {self.n} requested")
+
+
+class NullRatio(Distribution):
+    """
+    Leave a share of values `None`, e.g. to populate a sparse optional field.
+
+    Args:
+        ratio (float): The share of `None` values, from 0 to 1.
+        of (Distribution | Callable, optional): Where the other values come from. Defaults to the field's generator.
+    """
+
+    def __init__(self, ratio: float, of: Distribution | Callable[[], Any] | None = None):
+        if not 0 <= ratio <= 1:
+            raise ValueError(f"NullRatio ratio must be between 0 and 1, got {ratio}")
+        self.ratio = ratio
+        self.of = of
+
+    def take(self, n: int) -> list[Any]:
+        random, ratio = faker.random.random, self.ratio
+        nulls = [random() < ratio for _ in range(n)]
+        values = iter(_draw(self.of, self, nulls.count(False)))
+        return [None if null else next(values) for null in nulls]
+
+
+class Length(Distribution):
+    """
+    Give `ListField`, `MapField`, `DictField`, `BinaryField` or `FileField` values a chosen number of items.
+
+    Items come from the container's inner field generator, drawn for every instance at once. `DictField`s have no
+    inner field, so their values are words, or dicts nested `depth` levels deep. Map and dict keys are words made
+    unique with a suffix, so each container has exactly the drawn number of items. For binary and file fields, the
+    items are bytes: binary payloads are sliced from the shared `mongo_bakery.buffers.pool` and capped at the
+    field's `max_bytes`, and files are streamed into GridFS (see `mongo_bakery.files.put_random_file`).
+
+    Args:
+        size (int | tuple | Distribution): Items per container: a fixed count, an inclusive `(min, max)` range
+            drawn uniformly, or a distribution of counts like `Pareto` or `Zipf`, rounded and floored at 0.
+        depth (int, optional): How many levels of dicts a `DictField` value nests; each nested dict's size is
+            drawn from `size` too. Defaults to 1, a flat dict.
+    """
+
+    def __init__(self, size: "int | tuple[int, int] | Distribution", depth: int = 1):
+        if isinstance(size, tuple):
+            low, high = size
+            if not 0 <= low <= high:
+                raise ValueError(f"Length range must satisfy 0 <= min <= max, got {size}")
+        elif isinstance(size, int) and size < 0:
+            raise ValueError(f"Length must be at least 0, got {size}")
+        if depth < 1:
+            raise ValueError(f"Length depth must be at least 1, got {depth}")
+        self.size = size
+        self.depth = depth
+
+    def take(self, n: int) -> list[Any]:
+        field_type = type(self.field).__name__
+        if field_type in ("ListField", "EmbeddedDocumentListField"):
+            lengths = self._lengths(n)
+            items = iter(self._items(self.field.field, sum(lengths)))
+            return [list(itertools.islice(items, length)) for length in lengths]
+        if field_type == "MapField":
+            lengths = self._lengths(n)
+            return _mappings(lengths, self._items(self.field.field, sum(lengths)))
+        if field_type == "DictField":
+            return self._dicts(n, self.depth)
+        if field_type == "BinaryField":
+            return [bytes(pool.take(payload_size(self.field, length))) for length in self._lengths(n)]
+        if field_type == "FileField":
+            return [put_random_file(self.field, length, self.baker) for length in self._lengths(n)]
+        raise ValueError(
+            f"Length only applies to ListField, MapField, DictField, BinaryField and FileField values, not {field_type}"
+        )
+
+    def _lengths(self, n: int) -> list[int]:
+        size = self.size
+        if isinstance(size, int):
+            return [size] * n
+        if isinstance(size, tuple):
+            low, high = size
+            return faker.random.choices(range(low, high + 1), k=n)
+        return [max(0, round(length)) for length in size.bind(None, self.baker).take(n)]
+
+    def _items(self, inner_field: Any, n: int) -> list[Any]:
+        if inner_field is None:
+            return faker.words(nb=n)
+        return self.baker._generate_many(inner_field, n)
+
+    def _dicts(self, n: int, depth: int) -> list[dict[str, Any]]:
+        lengths = self._lengths(n)
+        total = sum(lengths)
+        return _mappings(lengths, faker.words(nb=total) if depth == 1 else self._dicts(total, depth - 1))
+
+
+def _mappings(lengths: list[int], values: list[Any]) -> list[dict[str, Any]]:
+    """Split `values` into dicts of the given `lengths`, keyed by unique words."""
+    keys, items = iter(faker.words(nb=sum(lengths))), iter(values)
+    return [
+        {f"{key}_{index}": next(items) for index, key in enumerate(itertools.islice(keys, length))}
+        for length in lengths
+    ]
+
+
+def _draw(source: Distribution | Callable[[], Any] | None, bound: Distribution, n: int) -> list[Any]:
+    """Draw `n` values from a wrapped distribution or callable, or from `bound`'s field generator if it's `None`."""
+    if source is None:
+        return bound._generated(n)
+    if isinstance(source, Distribution):
+        return source.bind(bound.field, bound.baker).take(n)
+    return [source() for _ in range(n)]
+
+
+def _hashable(value: Any) -> Any:
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
@@ -0,0 +1,109 @@
+from io import BytesIO
+from typing import Any
+
+from mongo_bakery.bakery_fields_generators import faker
+from mongo_bakery.buffers import pool
+
+# Size of the files `mock_FileField` generates, unless a `Length` says otherwise.
+DEFAULT_FILE_BYTES = 16 * 1024
+
+# Width and height of the images `mock_ImageField` generates for fields without a `size`.
+DEFAULT_IMAGE_SIZE = (64, 64)
+
+
+class RandomStream:
+    """
+    A read-only file of `size` random bytes, sliced from the shared buffer pool as it's read.
+
+    GridFS reads the files it stores one chunk at a time, so `put_random_file` can store files of any size while
+    only ever holding one chunk of bytes.
+
+    Args:
+        size (int): The number of bytes the stream yields before reaching its end.
+    """
+
+    def __init__(self, size: int):
+        self.remaining = size
+
+    def read(self, size: int = -1) -> bytes:
+        """Return the next `size` bytes, or everything left if `size` is negative, and `b""` at the end."""
+        count = self.remaining if size < 0 else min(size, self.remaining)
+        self.remaining -= count
+        return bytes(pool.take(count))
+
+
+def put_random_file(field: Any, size: int, baker: Any) -> Any:
+    """
+    Stream `size` random bytes into `field`'s GridFS bucket, tracking the file for `baker.cleanup()`.
+
+    Args:
+        field: The `FileField` the file is for, which names its connection alias and GridFS collection.
+        size (int): The file size in bytes.
+        baker: The `Baker` that tracks the file.
+
+    Returns:
+        GridFSProxy: The field value pointing to the stored file.
+    """
+    proxy = field.get_proxy_obj(key=field.name, instance=None)
+    proxy.grid_id = proxy.fs.put(
+        RandomStream(size), filename=faker.file_name(extension="bin"), content_type="application/octet-stream"
+    )
+    baker._track_file(proxy.db_alias, proxy.collection_name, proxy.grid_id)
+    return proxy
+
+
+def put_random_image(field: Any, baker: Any) -> Any:
+    """
+    Store a random PNG image in `field`'s GridFS bucket, with a thumbnail if the field declares a `thumbnail_size`.
+
+    The image is generated at the field's `size` (or `DEFAULT_IMAGE_SIZE`), and stored with the same metadata
+    `ImageField` records for uploaded images, so it reads back like one. Needs Pillow, as `ImageField` itself does.
+
+    Args:
+        field: The `ImageField` the image is for.
+        baker: The `Baker` that tracks the image and its thumbnail.
+
+    Returns:
+        ImageGridFsProxy: The field value pointing to the stored image.
+    """
+    proxy = field.get_proxy_obj(key=field.name, instance=None)
+    image = _random_image(_dimensions(field.size, DEFAULT_IMAGE_SIZE))
+
+    thumbnail_id = None
+    if field.thumbnail_size:
+        thumbnail = image.copy()
+        thumbnail.thumbnail(_dimensions(field.thumbnail_size, DEFAULT_IMAGE_SIZE))
+        thumbnail_id = proxy.fs.put(_png(thumbnail), width=thumbnail.width, height=thumbnail.height, format="PNG")
+        baker._track_file(proxy.db_alias, proxy.collection_name, thumbnail_id)
+
+    proxy.grid_id = proxy.fs.put(
+        _png(image),
+        filename=faker.file_name(extension="png"),
+        content_type="image/png",
+        width=image.width,
+        height=image.height,
+        format="PNG",
+        thumbnail_id=thumbnail_id,
+    )
+    baker._track_file(proxy.db_alias, proxy.collection_name, proxy.grid_id)
+    return proxy
+
+
+def _dimensions(size: dict[str, Any] | None, default: tuple[int, int]) -> tuple[int, int]:
+    if not size:
+        return default
+    return size["width"], size["height"]
+
+
+def _random_image(dimensions: tuple[int, int]) -> Any:
+    from PIL import Image
+
+    width, height = dimensions
+    return Image.frombytes("RGB", dimensions, faker.random.randbytes(width * height * 3))
+
+
+def _png(image: Any) -> BytesIO:
+    buffer = BytesIO()
+    image.save(buffer, "PNG")
+    buffer.seek(0)
+    return buffer
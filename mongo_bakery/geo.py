@@ -0,0 +1,156 @@
+import math
+from collections.abc import Sequence
+from typing import Any
+
+from mongo_bakery.bakery_fields_generators import faker
+from mongo_bakery.distributions import Distribution
+
+# The whole world, as a `(min_lng, min_lat, max_lng, max_lat)` bounding box.
+WORLD = (-180.0, -90.0, 180.0, 90.0)
+
+# Radius of generated lines and polygons around their center, in degrees (about 1 km at the equator).
+DEFAULT_SHAPE_SIZE = 0.01
+
+# Inclusive ranges for how many points a line has, how many vertices a polygon has, and how many parts a `Multi*`
+# geometry has.
+LINE_POINTS = (2, 6)
+POLYGON_VERTICES = (3, 8)
+MULTI_PARTS = (2, 4)
+
+# How far the parts of a `Multi*` geometry are from its center, in shape sizes. Parts are evenly spaced around the
+# center, far enough apart that they never overlap.
+MULTI_SPREAD = 3
+
+
+class Spatial(Distribution):
+    """
+    Place generated geometries within a bounding box, spread uniformly or clustered around hotspots.
+
+    Applies to `PointField`, `LineStringField`, `PolygonField`, their `Multi*` variants and `GeoPointField`.
+
+    Every center is drawn for the whole `make` call at once; lines and polygons are built around them. Polygons are
+    star-shaped around their center, with vertices in counterclockwise order, and the parts of `Multi*` geometries
+    never overlap, so `2dsphere` indexes accept them. Shapes stay inside the bounding box.
+
+    Args:
+        bbox (tuple, optional): `(min_lng, min_lat, max_lng, max_lat)`. Defaults to the whole world.
+        hotspots (Sequence, optional): `(lng, lat, spread)` tuples; centers are drawn from a normal distribution
+            around a hotspot, with `spread` degrees of standard deviation. Defaults to uniform over `bbox`.
+        weights (Sequence, optional): Relative weights of the hotspots. Defaults to equal weights.
+        background (float, optional): Share of centers drawn uniformly over `bbox` instead of around hotspots,
+            from 0 to 1. Defaults to 0.
+        size (float, optional): Radius of lines and polygons around their center, in degrees.
+            Defaults to `DEFAULT_SHAPE_SIZE`.
+    """
+
+    def __init__(
+        self,
+        bbox: tuple[float, float, float, float] = WORLD,
+        hotspots: Sequence[tuple[float, float, float]] | None = None,
+        weights: Sequence[float] | None = None,
+        background: float = 0.0,
+        size: float = DEFAULT_SHAPE_SIZE,
+    ):
+        min_lng, min_lat, max_lng, max_lat = bbox
+        if not (WORLD[0] <= min_lng < max_lng <= WORLD[2] and WORLD[1] <= min_lat < max_lat <= WORLD[3]):
+            raise ValueError(f"Spatial bbox must be (min_lng, min_lat, max_lng, max_lat) within {WORLD}, got {bbox}")
+        if weights is not None and (hotspots is None or len(weights) != len(hotspots)):
+            raise ValueError("Spatial weights need one weight per hotspot")
+        if not 0 <= background <= 1:
+            raise ValueError(f"Spatial background must be between 0 and 1, got {background}")
+        self.bbox = bbox
+        self.hotspots = list(hotspots or [])
+        self.weights = weights
+        self.background = background
+        self.size = size
+
+    def take(self, n: int) -> list[Any]:
+        field_type = type(self.field).__name__
+        shape = _SHAPES.get(field_type)
+        if shape is None:
+            raise ValueError(f"Spatial only applies to GeoJSON and GeoPointField values, not {field_type}")
+        return [shape(self, center) for center in self.centers(n)]
+
+    def centers(self, n: int) -> list[list[float]]:
+        """
+        Draw `n` `[lng, lat]` centers, kept far enough inside the bounding box for a shape to fit around them.
+
+        Args:
+            n (int): The number of centers.
+
+        Returns:
+            list[list[float]]: The centers.
+        """
+        random = faker.random
+        min_lng, min_lat, max_lng, max_lat = self._inner_bbox()
+        if not self.hotspots:
+            return [[random.uniform(min_lng, max_lng), random.uniform(min_lat, max_lat)] for _ in range(n)]
+
+        gauss = random.gauss
+        centers = [
+            [min(max(gauss(lng, spread), min_lng), max_lng), min(max(gauss(lat, spread), min_lat), max_lat)]
+            for lng, lat, spread in random.choices(self.hotspots, weights=self.weights, k=n)
+        ]
+        for index in random.sample(range(n), round(n * self.background)):
+            centers[index] = [random.uniform(min_lng, max_lng), random.uniform(min_lat, max_lat)]
+        return centers
+
+    def _inner_bbox(self) -> tuple[float, float, float, float]:
+        min_lng, min_lat, max_lng, max_lat = self.bbox
+        margin = self.size * (MULTI_SPREAD + 1) if type(self.field).__name__.startswith("Multi") else self.size
+        margin_lng = min(margin, (max_lng - min_lng) / 2)
+        margin_lat = min(margin, (max_lat - min_lat) / 2)
+        return min_lng + margin_lng, min_lat + margin_lat, max_lng - margin_lng, max_lat - margin_lat
+
+
+def shapes(field: Any, n: int) -> list[Any]:
+    """Generate `n` values for a geo field, uniformly over the whole world, for the field's default generators."""
+    return Spatial().bind(field, None).take(n)
+
+
+def _point(spatial: Spatial, center: list[float]) -> list[float]:
+    return center
+
+
+def _line(spatial: Spatial, center: list[float]) -> list[list[float]]:
+    random, size = faker.random, spatial.size
+    lng, lat = center
+    points = []
+    for _ in range(random.randint(*LINE_POINTS)):
+        angle, radius = random.uniform(0, math.tau), random.uniform(0, size)
+        points.append([lng + radius * math.cos(angle), lat + radius * math.sin(angle)])
+    return points
+
+
+def _polygon(spatial: Spatial, center: list[float]) -> list[list[list[float]]]:
+    random, size = faker.random, spatial.size
+    lng, lat = center
+    angles = sorted(random.uniform(0, math.tau) for _ in range(random.randint(*POLYGON_VERTICES)))
+    ring = []
+    for angle in angles:
+        radius = random.uniform(size / 2, size)
+        ring.append([lng + radius * math.cos(angle), lat + radius * math.sin(angle)])
+    ring.append(ring[0])
+    return [ring]
+
+
+def _multi(part: Any) -> Any:
+    def build(spatial: Spatial, center: list[float]) -> list[Any]:
+        random, distance = faker.random, spatial.size * MULTI_SPREAD
+        lng, lat = center
+        count, rotation = random.randint(*MULTI_PARTS), random.uniform(0, math.tau)
+        angles = [rotation + math.tau * index / count for index in range(count)]
+        return [part(spatial, [lng + distance * math.cos(a), lat + distance * math.sin(a)]) for a in angles]
+
+    return build
+
+
+_SHAPES = {
+    "GeoPointField": _point,
+    "PointField": _point,
+    "LineStringField": _line,
+    "PolygonField": _polygon,
+    "MultiPointField": _multi(_point),
+    "MultiLineStringField": _multi(_line),
+    "MultiPolygonField": _multi(_polygon),
+}
@@ -0,0 +1,81 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from bson import ObjectId
+
+from mongo_bakery.bakery_fields_generators import faker
+from mongo_bakery.distributions import Distribution
+
+# ObjectIds hold a 3-byte counter, which orders ObjectIds sharing a timestamp second.
+_OBJECT_ID_COUNTER_SPAN = 1 << 24
+
+
+class OrderedKeys(Distribution):
+    """
+    Generate insertion-ordered keys for a `UUIDField` or `ObjectIdField`, e.g. `_id`, instead of random ones.
+
+    Each key embeds a synthetic creation time: the `make` call's keys advance monotonically from `start` to
+    `start + period`, so their sort order matches the order documents are built in, and B-tree inserts append
+    instead of landing at random. UUIDs follow the version 7 layout (a millisecond Unix timestamp, then random
+    bits, kept increasing within a millisecond); ObjectIds get a timestamp second, random bytes shared by the
+    call, and an increasing counter.
+
+    Args:
+        period (timedelta, optional): How long the keys' timestamps span. Defaults to 30 days.
+        start (datetime, optional): The first key's timestamp. Defaults to `period` ago, so the last key is
+            about now.
+    """
+
+    def __init__(self, period: timedelta = timedelta(days=30), start: datetime | None = None):
+        if period <= timedelta(0):
+            raise ValueError(f"OrderedKeys period must be positive, got {period}")
+        self.period = period
+        self.start = start
+
+    def take(self, n: int) -> list[Any]:
+        field_type = type(self.field).__name__
+        if field_type == "UUIDField":
+            return _uuid7s(self._timestamps(n))
+        if field_type == "ObjectIdField":
+            return _object_ids(self._timestamps(n))
+        raise ValueError(f"OrderedKeys only applies to UUIDField and ObjectIdField values, not {field_type}")
+
+    def _timestamps(self, n: int) -> list[float]:
+        """`n` non-decreasing Unix timestamps, one at a random point of each of `n` equal slices of the period."""
+        start = self.start or datetime.now(timezone.utc) - self.period
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        first, slot, random = start.timestamp(), self.period.total_seconds() / max(n, 1), faker.random.random
+        return [first + (index + random()) * slot for index in range(n)]
+
+
+def _uuid7s(timestamps: list[float]) -> list[uuid.UUID]:
+    """Version 7 UUIDs for `timestamps`, whose 74 random bits are bumped when needed to keep them increasing."""
+    getrandbits = faker.random.getrandbits
+    keys = []
+    last_ms, last_random = -1, -1
+    for timestamp in timestamps:
+        ms, random_bits = int(timestamp * 1000), getrandbits(74)
+        if ms == last_ms and random_bits <= last_random:
+            random_bits = last_random + 1
+        last_ms, last_random = ms, random_bits
+        value = ms << 80 | 0x7 << 76 | (random_bits >> 62) << 64 | 0b10 << 62 | random_bits & ((1 << 62) - 1)
+        keys.append(uuid.UUID(int=value))
+    return keys
+
+
+def _object_ids(timestamps: list[float]) -> list[ObjectId]:
+    """ObjectIds for `timestamps`, with shared random bytes and a counter that orders those sharing a second."""
+    random_bytes = faker.random.randbytes(5)
+    keys = []
+    last_second, counter = -1, 0
+    for timestamp in timestamps:
+        # A second whose counter overflowed spills into the next one, so keys never go backwards.
+        second = max(int(timestamp), last_second)
+        counter = counter + 1 if second == last_second else 0
+        if counter == _OBJECT_ID_COUNTER_SPAN:
+            second, counter = second + 1, 0
+        last_second = second
+        keys.append(ObjectId(second.to_bytes(4, "big") + random_bytes + counter.to_bytes(3, "big")))
+    return keys
@@ -0,0 +1,69 @@
+from collections.abc import Callable
+from typing import Any
+
+
+class LazyFaker:
+    """
+    A stand-in for a `Faker` instance that imports faker and builds the instance on first use.
+
+    Importing faker and loading its providers takes longer than everything else mongo_bakery imports, and the
+    pytest plugin is imported by every test run, whether or not it bakes anything.
+    """
+
+    def __init__(self):
+        self._faker: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def _load(self) -> Any:
+        # Underscored, like `_faker`, so it never shadows a provider a field is named after.
+        if self._faker is None:
+            from faker import Faker
+
+            self._faker = Faker()
+        return self._faker
+
+
+class LazyFieldData(dict):
+    """
+    A document's `_data` whose pending fields are generated the first time they're read.
+
+    MongoEngine reads field values through `_data.get()` and `_data[...]` (attribute access, `validate`,
+    `to_mongo`) or `_data.items()`, so overriding those is enough to generate values on demand, and to generate
+    every remaining one before a document is validated, saved or serialized.
+    """
+
+    def __init__(self, data: dict[str, Any], pending: dict[str, Callable[[], Any]]):
+        super().__init__(data)
+        self._pending = pending
+
+    def __getitem__(self, name: str) -> Any:
+        self._resolve(name)
+        return super().__getitem__(name)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        self._resolve(name)
+        return super().get(name, default)
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._pending.pop(name, None)
+        super().__setitem__(name, value)
+
+    def items(self) -> Any:
+        self.materialize()
+        return super().items()
+
+    def values(self) -> Any:
+        self.materialize()
+        return super().values()
+
+    def materialize(self) -> None:
+        """Generate every field that hasn't been read yet."""
+        for name in list(self._pending):
+            self._resolve(name)
+
+    def _resolve(self, name: str) -> None:
+        generate = self._pending.pop(name, None)
+        if generate is not None:
+            super().__setitem__(name, generate())
@@ -0,0 +1,73 @@
+import io
+from collections.abc import Callable, Iterator
+from itertools import islice
+from typing import Any
+
+from mongoengine.queryset.base import BaseQuerySet
+from pymongo.command_cursor import CommandCursor
+from pymongo.cursor import Cursor
+
+
+class GenerationPlan:
+    """
+    What `Baker` does to build each instance of a document class for one `make` call, worked out up front.
+
+    Built by `Baker._plan`, which caches the part that only depends on the document class and the names of the
+    explicit field values, so repeated calls of the same shape (e.g. through a `Recipe`) don't walk the class's
+    fields again.
+
+    Attributes:
+        generated (list[tuple[str, Any]]): The `(name, field)` pairs that get their default or mock data: required
+            fields without an explicit value.
+        values (dict[str, Any]): Explicit field values used as they are.
+        resolvers (dict[str, Callable[[], Any]]): Explicit field values computed anew for each instance.
+    """
+
+    __slots__ = ("generated", "resolvers", "values")
+
+    def __init__(
+        self, generated: list[tuple[str, Any]], values: dict[str, Any], resolvers: dict[str, Callable[[], Any]]
+    ):
+        self.generated = generated
+        self.values = values
+        self.resolvers = resolvers
+
+
+def column_values(field_name: str, value: Any, quantity: int) -> list[Any] | None:
+    """
+    Return the per-instance values of a column-like `make` kwarg, or `None` if `value` is a plain value.
+
+    Iterators (generators included) supply their next `quantity` values. `range`s and array-likes such as NumPy
+    arrays (anything with `__array__` and `tolist`, converted with `tolist()` so values are plain Python types)
+    must hold exactly `quantity` values. Lists and tuples are values in their own right, e.g. for a `ListField`,
+    so they're never columns. Neither are file objects, which iterate over lines but are `FileField` values, nor
+    query results (MongoEngine `QuerySet`s, PyMongo cursors), which are values for list fields like lists are.
+
+    Args:
+        field_name: The kwarg's name, for error messages.
+        value: The kwarg's value.
+        quantity: The number of instances being built.
+
+    Returns:
+        list[Any] | None: The value for each instance, in order, or `None`.
+
+    Raises:
+        ValueError: If a column holds fewer (or, when sized, more) values than `quantity`.
+    """
+    if isinstance(value, io.IOBase | BaseQuerySet | Cursor | CommandCursor) or hasattr(value, "read"):
+        return None
+    if isinstance(value, Iterator):
+        values = list(islice(value, quantity))
+        if len(values) < quantity:
+            raise ValueError(f"`{field_name}` ran out after {len(values)} values, but _quantity is {quantity}")
+        return values
+
+    if isinstance(value, range):
+        values = list(value)
+    elif hasattr(value, "__array__") and hasattr(value, "tolist"):
+        values = value.tolist()
+    else:
+        return None
+    if len(values) != quantity:
+        raise ValueError(f"`{field_name}` has {len(values)} values, but _quantity is {quantity}")
+    return values
@@ -1,13 +1,237 @@
+import importlib
+import os
+import re
 from collections.abc import Generator
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from mongo_bakery import baker as _baker
-from mongo_bakery.bakery import Baker
+if TYPE_CHECKING:
+    from mongo_bakery.bakery import Baker
+
+# pytest imports this module for every test run once mongo_bakery is installed, so mongoengine and the baker
+# (which pull in pymongo, faker and mongomock) are only imported by the fixtures and hooks that need them.
+
+# The worker id pytest-xdist reports when tests aren't distributed, matching its `worker_id` fixture.
+XDIST_CONTROLLER_ID = "master"
+# How many tests the `--bakery-report` summary lists.
+REPORT_SLOWEST = 10
+# The `user_properties` key carrying a test's baking stats from the (xdist worker) process that ran it to the report.
+_REPORT_PROPERTY = "mongo_bakery_stats"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """
+    Register the plugin's options.
+
+    Ini options let the plugin own the test database connection, one per xdist worker; command line options
+    report and limit what tests using the `baker` fixture bake.
+    """
+    group = parser.getgroup("mongo_bakery")
+    group.addoption(
+        "--bakery-report",
+        action="store_true",
+        help=f"Show the {REPORT_SLOWEST} slowest tests to bake, with the documents they created per class.",
+    )
+    group.addoption(
+        "--bakery-max-documents",
+        type=int,
+        metavar="N",
+        help="Fail tests whose `baker` fixture creates more than N documents, references included.",
+    )
+    parser.addini(
+        "mongo_bakery_db",
+        "Database the plugin connects to for the session, suffixed with the xdist worker id (e.g. `testdb_gw3`) "
+        "under pytest-xdist. Leave unset to manage the connection yourself.",
+    )
+    parser.addini("mongo_bakery_db_host", "Host URI for `mongo_bakery_db`.", default="mongodb://localhost")
+    parser.addini("mongo_bakery_db_alias", "MongoEngine connection alias for `mongo_bakery_db`.", default="default")
+    parser.addini(
+        "mongo_bakery_mongo_client_class",
+        "Dotted path to the client class used for `mongo_bakery_db`, e.g. `mongomock.MongoClient`.",
+    )
+    parser.addini(
+        "mongo_bakery_seed",
+        "Integer seed for the shared baker. Each xdist worker is seeded with it plus its worker number, so "
+        "workers generate reproducible but distinct data.",
+    )
+
+
+def worker_id() -> str:
+    """
+    Return the current pytest-xdist worker id (`gw0`, `gw1`, ...), or `"master"` when tests aren't distributed.
+
+    Returns:
+        str: The worker id.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", XDIST_CONTROLLER_ID)
+
+
+def worker_db_name(db_name: str, worker: str) -> str:
+    """
+    Derive a database name private to one xdist worker, so workers never see or delete each other's data.
+
+    Args:
+        db_name: The configured database name.
+        worker: The worker id, as returned by `worker_id()`.
+
+    Returns:
+        str: `db_name` suffixed with the worker id, or `db_name` itself when tests aren't distributed.
+    """
+    return db_name if worker == XDIST_CONTROLLER_ID else f"{db_name}_{worker}"
+
+
+def worker_seed(seed: int, worker: str) -> int:
+    """
+    Derive a per-worker seed, so each worker's data is reproducible without colliding with another worker's.
+
+    Args:
+        seed: The configured seed.
+        worker: The worker id, as returned by `worker_id()`.
+
+    Returns:
+        int: `seed` plus the worker number (`gw3` -> `seed + 3`), or `seed` itself when tests aren't distributed.
+    """
+    match = re.fullmatch(r"gw(\d+)", worker)
+    return seed + int(match.group(1)) if match else seed
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Enable per-test baking stats when `--bakery-report` or `--bakery-max-documents` is given."""
+    report = config.getoption("bakery_report")
+    max_documents = config.getoption("bakery_max_documents")
+    if report or max_documents is not None:
+        config.pluginmanager.register(BakeryReport(report, max_documents), "mongo_bakery_report")
+
+
+class BakeryReport:
+    """
+    Track what the shared baker bakes for each test using the `baker` fixture.
+
+    Registered by `pytest_configure` only when asked for, so tests pay nothing for it otherwise. Stats are collected
+    from the start of the test's setup to the end of its teardown, so baking done by other fixtures through the
+    shared baker, and its `cleanup()`, count towards the test. They travel in the teardown report's
+    `user_properties`, so the summary also covers tests run by pytest-xdist workers.
+    """
+
+    def __init__(self, report: bool, max_documents: int | None):
+        self.report = report
+        self.max_documents = max_documents
+        self.results: list[tuple[str, Any]] = []
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_setup(self, item: pytest.Item) -> Generator[None, None, None]:
+        if "baker" in getattr(item, "fixturenames", ()):
+            shared_baker = _shared_baker()
+            shared_baker.collect_stats()
+            shared_baker.reset_stats()
+        return (yield)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Generator[None, None, None]:
+        result = yield
+        if self.max_documents is not None and "baker" in getattr(item, "fixturenames", ()):
+            documents = _shared_baker().stats()["documents"]
+            created = sum(counters["created"] for counters in documents.values())
+            if created > self.max_documents:
+                pytest.fail(
+                    f"baked {created} documents, more than --bakery-max-documents={self.max_documents} "
+                    f"({_per_class(documents)})",
+                    pytrace=False,
+                )
+        return result
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_teardown(self, item: pytest.Item) -> Generator[None, None, None]:
+        try:
+            return (yield)
+        finally:
+            if "baker" in getattr(item, "fixturenames", ()):
+                item.user_properties.append((_REPORT_PROPERTY, _shared_baker().stats()))
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == _REPORT_PROPERTY:
+                self.results.append((report.nodeid, value))
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        if not self.report:
+            return
+        terminalreporter.write_sep("=", "slowest baked tests")
+        slowest = sorted(self.results, key=lambda result: _baking_seconds(result[1]), reverse=True)
+        for nodeid, stats in slowest[:REPORT_SLOWEST]:
+            documents = stats["documents"]
+            created = sum(counters["created"] for counters in documents.values())
+            total = stats["total"]
+            phases = ", ".join(
+                f"{phase} {seconds:.2f}s"
+                for phase, seconds in (
+                    ("generate", total.get("generate_seconds", 0.0)),
+                    ("save", total.get("save_seconds", 0.0) + total.get("write_seconds", 0.0)),
+                    ("cleanup", stats["cleanup"].get("seconds", 0.0)),
+                )
+            )
+            terminalreporter.write_line(
+                f"{_baking_seconds(stats):.2f}s {created} documents {nodeid} ({phases}) {_per_class(documents)}"
+            )
+        if not slowest:
+            terminalreporter.write_line("no tests used the baker fixture")
+
+
+def _baking_seconds(stats: dict[str, Any]) -> float:
+    return sum(stats["total"].values()) + stats["cleanup"].get("seconds", 0.0)
+
+
+def _per_class(documents: dict[str, dict[str, Any]]) -> str:
+    return ", ".join(f"{name}: {counters['created']}" for name, counters in documents.items())
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _bakery_worker_setup(pytestconfig: pytest.Config) -> Generator[None, None, None]:
+    """
+    Connect to a per-worker database and seed the shared baker per worker, when configured via ini options.
+
+    Does nothing unless `mongo_bakery_db` and/or `mongo_bakery_seed` are set. A database the plugin derived
+    for an xdist worker is dropped once the session ends; the configured database itself never is.
+    """
+    seed = pytestconfig.getini("mongo_bakery_seed")
+    if seed:
+        _shared_baker().seed(worker_seed(int(seed), worker_id()))
+
+    db_name = pytestconfig.getini("mongo_bakery_db")
+    if not db_name:
+        yield
+        return
+
+    import mongoengine
+
+    alias = pytestconfig.getini("mongo_bakery_db_alias")
+    connection_options = {}
+    client_class_path = pytestconfig.getini("mongo_bakery_mongo_client_class")
+    if client_class_path:
+        module_name, _, class_name = client_class_path.rpartition(".")
+        connection_options["mongo_client_class"] = getattr(importlib.import_module(module_name), class_name)
+
+    worker_db = worker_db_name(db_name, worker_id())
+    client = mongoengine.connect(
+        db=worker_db,
+        host=pytestconfig.getini("mongo_bakery_db_host"),
+        alias=alias,
+        uuidRepresentation="standard",
+        **connection_options,
+    )
+    try:
+        yield
+    finally:
+        if worker_db != db_name:
+            client.drop_database(worker_db)
+        mongoengine.disconnect(alias)
 
 
 @pytest.fixture
-def baker() -> Generator[Baker, None, None]:
+def baker() -> Generator["Baker", None, None]:
     """
     Yield the shared `mongo_bakery` baker and clean up any instances it created after the test.
 
@@ -17,5 +241,56 @@ def baker() -> Generator[Baker, None, None]:
     Yields:
         Baker: The shared `mongo_bakery` baker instance.
     """
-    yield _baker
-    _baker.cleanup()
+    shared_baker = _shared_baker()
+    yield shared_baker
+    shared_baker.cleanup()
+
+
+@pytest.fixture(scope="session")
+def baker_session() -> Generator["Baker", None, None]:
+    """
+    Yield a `Baker` shared by the whole test session, cleaned up once the session ends.
+
+    Use it for expensive reference data that every test can read. It's a separate instance from the
+    function-scoped `baker` fixture, so the per-test `cleanup()` never deletes what it baked.
+
+    Yields:
+        Baker: A baker dedicated to the session.
+    """
+    yield from _scoped_baker()
+
+
+@pytest.fixture(scope="module")
+def baker_module() -> Generator["Baker", None, None]:
+    """
+    Yield a `Baker` shared by the tests of one module, cleaned up once the module's tests are done.
+
+    Yields:
+        Baker: A baker dedicated to the current module.
+    """
+    yield from _scoped_baker()
+
+
+@pytest.fixture(scope="class")
+def baker_class() -> Generator["Baker", None, None]:
+    """
+    Yield a `Baker` shared by the tests of one class, cleaned up once the class's tests are done.
+
+    Yields:
+        Baker: A baker dedicated to the current test class.
+    """
+    yield from _scoped_baker()
+
+
+def _shared_baker() -> "Baker":
+    from mongo_bakery import baker
+
+    return baker
+
+
+def _scoped_baker() -> Generator["Baker", None, None]:
+    from mongo_bakery.bakery import Baker
+
+    scoped_baker = Baker()
+    yield scoped_baker
+    scoped_baker.cleanup()
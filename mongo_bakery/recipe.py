@@ -0,0 +1,78 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mongoengine import Document
+
+    from mongo_bakery.bakery import Baker
+
+
+class Recipe:
+    """
+    A reusable shape of document: a document class plus field values, baked as many times as needed.
+
+    Field values can be static values, callables (called for each instance), `Sequence`s from `baker.seq()`, or
+    other recipes, which are made for each instance, e.g. to fill a `ReferenceField`. Every call with the same set
+    of field names reuses the generation plan the baker compiled for the first one.
+
+    Example:
+        ```python
+        customer = Recipe(Customer, country="BR")
+        order = Recipe(Order, customer=customer, number=baker.seq(1000))
+
+        order.make(_quantity=10)
+        order.extend(status="shipped").make()
+        ```
+    """
+
+    def __init__(self, document_class: type["Document"], **attrs: Any):
+        self.document_class = document_class
+        self.attrs = attrs
+
+    def make(self, _quantity: int = 1, _baker: "Baker | None" = None, **attrs: Any) -> Any:
+        """
+        Create and save instances of the recipe, like `Baker.make`.
+
+        Args:
+            _quantity (int, optional): The number of instances to create. Defaults to 1.
+            _baker (Baker, optional): The baker that creates (and later cleans up) the instances.
+                Defaults to the shared `mongo_bakery.baker`.
+            **attrs: Field values overriding the recipe's for this call.
+
+        Returns:
+            Document or list[Document]: A single instance if `_quantity` is 1, otherwise a list of instances.
+        """
+        return _baker_or_shared(_baker).make(self.document_class, _quantity=_quantity, **{**self.attrs, **attrs})
+
+    def prepare(self, _quantity: int = 1, _baker: "Baker | None" = None, **attrs: Any) -> Any:
+        """
+        Build instances of the recipe without saving them, like `Baker.prepare`.
+
+        Args:
+            _quantity (int, optional): The number of instances to build. Defaults to 1.
+            _baker (Baker, optional): The baker that builds the instances. Defaults to the shared `mongo_bakery.baker`.
+            **attrs: Field values overriding the recipe's for this call.
+
+        Returns:
+            Document or list[Document]: A single instance if `_quantity` is 1, otherwise a list of instances.
+        """
+        return _baker_or_shared(_baker).prepare(self.document_class, _quantity=_quantity, **{**self.attrs, **attrs})
+
+    def extend(self, **attrs: Any) -> "Recipe":
+        """
+        Build a new recipe for the same document class, with some field values added or replaced.
+
+        Args:
+            **attrs: Field values added to, or overriding, this recipe's.
+
+        Returns:
+            Recipe: The new recipe. This one is left unchanged.
+        """
+        return Recipe(self.document_class, **{**self.attrs, **attrs})
+
+
+def _baker_or_shared(baker: "Baker | None") -> "Baker":
+    if baker is not None:
+        return baker
+    from mongo_bakery import baker as shared_baker
+
+    return shared_baker
@@ -2,20 +2,105 @@ import datetime
 
 
 class Sequence:
-    """Produces an incrementing value on each call, for use as a `baker.make` kwarg."""
+    """
+    Produces an incrementing value on each call, for use as a `baker.make` kwarg.
+
+    The `i`-th value (counting from 0) is `value` combined with `start + i * increment_by`: appended for strings,
+    added otherwise. How to combine them is picked once, when the sequence is built.
+
+    With a `counter` (see `mongo_bakery.counters`), indexes are leased from it in blocks instead of counted
+    locally, so sequences in different processes sharing the counter never produce the same value.
+    """
+
+    def __init__(self, value, increment_by=1, start=None, counter=None):
+        if isinstance(value, str):
+            self._combine = _append
+        elif isinstance(value, (int, float, datetime.date, datetime.datetime)):
+            self._combine = _add
+        else:
+            raise ValueError(f"No sequence strategy defined for value type: {type(value).__name__}")
 
-    def __init__(self, value, increment_by=1, start=None):
         self.value = value
         self.increment_by = increment_by
-        self._step = start if start is not None else increment_by
+        self._start = start if start is not None else increment_by
+        self._index = 0
+        self.counter = counter
+        self._leased = range(0)
 
     def __call__(self):
-        if isinstance(self.value, str):
-            result = f"{self.value}{self._step}"
-        elif isinstance(self.value, (int, float, datetime.date, datetime.datetime)):
-            result = self.value + self._step
-        else:
-            raise ValueError(f"No sequence strategy defined for value type: {type(self.value).__name__}")
+        (indexes,) = self._reserve(1)
+        return self._combine(self.value, self._start + indexes[0] * self.increment_by)
+
+    def take(self, n):
+        """
+        Return the next `n` values at once, advancing the sequence past them.
+
+        Args:
+            n (int): The number of values to return.
+
+        Returns:
+            list: The values the next `n` calls would have returned, in order.
+        """
+        value, start, increment_by, combine = self.value, self._start, self.increment_by, self._combine
+        values = []
+        for indexes in self._reserve(n):
+            steps: range | list
+            if isinstance(start, int) and isinstance(increment_by, int) and increment_by:
+                steps = range(start + indexes.start * increment_by, start + indexes.stop * increment_by, increment_by)
+            else:
+                steps = [start + index * increment_by for index in indexes]
+            values.extend(combine(value, step) for step in steps)
+        return values
+
+    def partition(self, index, count):
+        """
+        Split the sequence's remaining values into `count` disjoint sequences, and return the `index`-th one.
+
+        Partitions interleave: partition 0 gets the next value, then every `count`-th one after it. Parallel
+        workers that each take a different partition of the same sequence never produce the same value.
+
+        Args:
+            index (int): Which partition to return, from 0 to `count - 1`.
+            count (int): How many partitions to split the sequence into.
+
+        Returns:
+            Sequence: A new sequence. This one is left unchanged.
+
+        Raises:
+            ValueError: If `index` isn't between 0 and `count - 1`, or the sequence uses a shared counter,
+                which already keeps processes from producing the same value.
+        """
+        if self.counter is not None:
+            raise ValueError("A sequence with a shared counter can't be partitioned")
+        if not 0 <= index < count:
+            raise ValueError(f"Partition index must be between 0 and {count - 1}, got {index}")
+        return Sequence(
+            self.value,
+            increment_by=self.increment_by * count,
+            start=self._start + (self._index + index) * self.increment_by,
+        )
+
+    def _reserve(self, n):
+        """Reserve the next `n` indexes, as contiguous ranges: one, unless leased blocks run out midway."""
+        if self.counter is None:
+            first, self._index = self._index, self._index + n
+            return [range(first, first + n)]
+
+        reserved = []
+        while n:
+            if not self._leased:
+                size = max(self.counter.block_size, n)
+                first = self.counter.lease(size)
+                self._leased = range(first, first + size)
+            indexes, self._leased = self._leased[:n], self._leased[n:]
+            reserved.append(indexes)
+            n -= len(indexes)
+        return reserved
+
+
+def _append(value, step):
+    return f"{value}{step}"
+
 
-        self._step += self.increment_by
-        return result
+def _add(value, step):
+    return value + step
@@ -0,0 +1,163 @@
+from collections.abc import Callable
+from itertools import repeat
+from typing import Any
+
+import bson
+
+from mongo_bakery.bakery_fields_generators import faker
+from mongo_bakery.buffers import pool
+from mongo_bakery.datasets import DEFAULT_CODEC_OPTIONS
+from mongo_bakery.distributions import Distribution
+
+# How far below its target a padded document may end up, as a share of the target, before padding gives up.
+TOLERANCE = 0.01
+
+# Encoded size of the `_id: ObjectId` pair `save()` adds to a document that doesn't have one yet.
+OBJECT_ID_BYTES = 17
+
+# Longest string appended to a list at a time when padding a `ListField`.
+LIST_ITEM_CHARS = 64
+
+
+class Padding:
+    """
+    Pads instances of one document class up to a target encoded size, for `make(..., _target_bytes=...)`.
+
+    Only generated fields are padded, never explicit `make` values: free-text `StringField`s first, then
+    `BinaryField`s, then lists of strings, and `StringField`s filled by a Faker provider (e.g. `email`) only as a
+    last resort, each up to its `max_length`/`max_bytes`. Appending ASCII text or bytes grows the encoding by
+    exactly as many bytes, so documents land on their target unless their fields run out of room. Documents
+    already larger than their target are left as they are.
+
+    Args:
+        generated (list[tuple[str, Any]]): The `(name, field)` pairs the baker generates values for.
+        targets (Callable[[], int]): Returns the target size of the next instance, in bytes.
+
+    Raises:
+        ValueError: If none of the generated fields can be padded.
+    """
+
+    def __init__(self, generated: list[tuple[str, Any]], targets: Callable[[], int]):
+        kinds = {name: _padding_kind(field) for name, field in generated}
+        self.fields = [
+            (name, field, _PADDERS[kind])
+            for kind in _PADDING_ORDER
+            for name, field in generated
+            if kinds[name] == kind
+        ]
+        if not self.fields:
+            raise ValueError(
+                "_target_bytes needs a generated StringField, BinaryField or ListField of strings to pad, "
+                "without choices or a regex"
+            )
+        self.targets = targets
+
+    def pad(self, instance: Any) -> None:
+        """
+        Pad `instance` in place up to the next target size.
+
+        Raises:
+            ValueError: If its padding fields don't have room for the target, within `TOLERANCE`.
+        """
+        target = self.targets()
+        missing = target - encoded_size(instance)
+        for name, field, pad_field in self.fields:
+            if missing <= 0:
+                return
+            missing -= pad_field(instance, name, field, missing)
+
+        size = encoded_size(instance)
+        if size < target * (1 - TOLERANCE):
+            raise ValueError(
+                f"Could only pad {type(instance).__name__} to {size} bytes, short of the {target} requested; "
+                "its fields' max_length/max_bytes leave no more room"
+            )
+
+
+def target_sizes(target_bytes: "int | Distribution", quantity: int) -> Callable[[], int]:
+    """
+    Return a callable giving each of `quantity` instances its target size, from `make`'s `_target_bytes`.
+
+    Args:
+        target_bytes (int | Distribution): A fixed size in bytes, or a distribution of sizes, drawn all at once.
+        quantity (int): The number of instances that will be built.
+    """
+    if isinstance(target_bytes, Distribution):
+        return iter([max(0, round(size)) for size in target_bytes.bind(None, None).take(quantity)]).__next__
+    return repeat(target_bytes).__next__
+
+
+def encoded_size(instance: Any) -> int:
+    """The BSON size of `instance` as `save()` would write it, including the `_id` it would be given."""
+    size = len(bson.encode(instance.to_mongo(), codec_options=DEFAULT_CODEC_OPTIONS))
+    if instance._meta.get("id_field") and instance.pk is None:
+        size += OBJECT_ID_BYTES
+    return size
+
+
+def _padding_kind(field: Any) -> str | None:
+    field_type = type(field).__name__
+    if field.choices or (field.default is not None and field_type != "ListField"):
+        return None
+    if field_type == "StringField" and not field.regex:
+        # Padding would spoil values shaped by a Faker provider, like an email address, so they're padded last.
+        return "provider" if field.name and hasattr(faker, field.name) else "text"
+    if field_type == "BinaryField":
+        return "binary"
+    if field_type == "ListField" and (field.field is None or _padding_kind(field.field) == "text"):
+        return "list"
+    return None
+
+
+def _pad_text(instance: Any, name: str, field: Any, missing: int) -> int:
+    value = getattr(instance, name) or ""
+    room = missing if field.max_length is None else min(missing, field.max_length - len(value))
+    if room <= 0:
+        return 0
+    setattr(instance, name, value + _text(room))
+    return room
+
+
+def _pad_binary(instance: Any, name: str, field: Any, missing: int) -> int:
+    value = bytes(getattr(instance, name) or b"")
+    room = missing if field.max_bytes is None else min(missing, field.max_bytes - len(value))
+    if room <= 0:
+        return 0
+    setattr(instance, name, value + pool.take(room))
+    return room
+
+
+def _pad_list(instance: Any, name: str, field: Any, missing: int) -> int:
+    items = list(getattr(instance, name) or [])
+    max_chars = LIST_ITEM_CHARS
+    if field.field is not None and field.field.max_length is not None:
+        max_chars = min(max_chars, field.field.max_length)
+
+    added = 0
+    while True:
+        # Each item is a type byte, its index as a key, a length prefix and a trailing NUL around its text.
+        overhead = len(str(len(items))) + 7
+        chars = min(missing - added - overhead, max_chars)
+        if chars <= 0:
+            break
+        items.append(_text(chars).lstrip() or "x")
+        added += overhead + len(items[-1])
+    setattr(instance, name, items)
+    return added
+
+
+def _text(length: int) -> str:
+    """Random words, starting with a space so they can be appended to existing text, exactly `length` chars long."""
+    text = ""
+    while len(text) < length:
+        text += " " + " ".join(faker.words(nb=length // 4 + 1))
+    return text[:length]
+
+
+_PADDING_ORDER = ("text", "binary", "list", "provider")
+_PADDERS: dict[str, Callable[[Any, str, Any, int], int]] = {
+    "text": _pad_text,
+    "binary": _pad_binary,
+    "list": _pad_list,
+    "provider": _pad_text,
+}
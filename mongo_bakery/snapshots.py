@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from collections.abc import Iterator
+from copy import deepcopy
+from typing import Any
+
+from bson.raw_bson import RawBSONDocument
+from mongomock.collection import Collection as MongomockCollection
+
+from mongo_bakery.datasets import iter_raw_documents
+
+
+class Snapshot:
+    """
+    The contents of the collections a `Baker` touched, and what it was tracking for `cleanup()`, at one point in time.
+
+    Built by `Baker.snapshot()` and consumed by `Baker.restore()`; it has no public API of its own.
+    """
+
+    def __init__(
+        self,
+        collections: list[tuple[Any, Any]],
+        created_instances: list[Any],
+        created_ids: dict[type, list[Any]],
+    ):
+        self.collections = collections
+        self.created_instances = created_instances
+        self.created_ids = created_ids
+
+    def covers(self, collection: Any) -> bool:
+        """Whether `collection`'s contents were captured by this snapshot."""
+        key = collection_key(collection)
+        return any(collection_key(captured) == key for captured, _ in self.collections)
+
+
+def collection_key(collection: Any) -> tuple[str, str]:
+    """Identify a collection by database and name, since different document classes can share one."""
+    return collection.database.name, collection.name
+
+
+def capture_collection(collection: Any) -> Any:
+    """
+    Capture a collection's documents, so `restore_collection` can put them back later.
+
+    For mongomock collections this is copy-on-write: the stored documents are shared with the snapshot, and only
+    copied once the live collection accesses them again, so capturing (and later restoring) a collection costs a
+    pointer copy per document plus a deep copy of just the documents a test actually reads or changes. Other
+    collections are dumped as raw BSON batches.
+
+    Args:
+        collection: The collection to capture.
+
+    Returns:
+        An opaque state for `restore_collection`.
+    """
+    if isinstance(collection, MongomockCollection):
+        store = collection._store
+        frozen = OrderedDict(store._documents)
+        store._documents = _CopyOnAccessDocuments(frozen)
+        return frozen
+    return list(collection.find_raw_batches())
+
+
+def restore_collection(collection: Any, state: Any) -> None:
+    """
+    Replace a collection's documents with those captured by `capture_collection`.
+
+    Args:
+        collection: The collection to restore.
+        state: The state returned by `capture_collection` for the same collection.
+    """
+    if isinstance(collection, MongomockCollection):
+        collection._store._documents = _CopyOnAccessDocuments(state)
+        return
+
+    collection.delete_many({})
+    for batch in state:
+        documents = [RawBSONDocument(data) for data in iter_raw_documents(batch)]
+        if documents:
+            collection.insert_many(documents, ordered=False)
+
+
+class _CopyOnAccessDocuments(OrderedDict):
+    """
+    A mongomock document store that shares its documents with a snapshot until they're first accessed.
+
+    mongomock updates the stored documents in place, so every path that hands a stored document out
+    (`[key]` and `values()`, the only ones mongomock uses) replaces a shared one with a private deep copy first.
+    """
+
+    def __init__(self, frozen: OrderedDict):
+        self._shared: set[Any] = set()
+        super().__init__(frozen)
+        self._shared.update(frozen)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        if key in self._shared:
+            value = deepcopy(value)
+            super().__setitem__(key, value)
+            self._shared.discard(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._shared.discard(key)
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._shared.discard(key)
+
+    def values(self) -> Iterator[Any]:  # type: ignore[override]
+        return (self[key] for key in list(self))
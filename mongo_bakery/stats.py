@@ -0,0 +1,78 @@
+from collections import defaultdict
+from typing import Any
+
+
+class BakeryStats:
+    """
+    Counters and timings collected by a `Baker` while `collect_stats()` is enabled.
+
+    Timings are inclusive: generating a `ReferenceField` includes baking the referenced document, which is also
+    recorded under its own class. The `total` counters only add up top-level documents, so they don't double count.
+    """
+
+    def __init__(self):
+        self.total: defaultdict[str, float] = defaultdict(float)
+        self.documents: defaultdict[str, defaultdict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.fields: defaultdict[str, defaultdict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.cleanup: defaultdict[str, float] = defaultdict(float)
+
+    def record_field(self, field_type: str, seconds: float, count: int = 1) -> None:
+        """Record `count` values generated for a field of type `field_type`, taking `seconds` in total."""
+        counters = self.fields[field_type]
+        counters["generated"] += count
+        counters["seconds"] += seconds
+
+    def record_document(self, class_name: str, nested: bool = False, **timings: float) -> None:
+        """
+        Record one document of `class_name` created, with the time spent in each `timings` phase.
+
+        `nested` documents were created to fill a reference or embedded field of another document.
+        """
+        counters = self.documents[class_name]
+        counters["created"] += 1
+        if nested:
+            counters["references"] += 1
+        self.record_timings(class_name, nested, **timings)
+
+    def record_timings(self, class_name: str, nested: bool = False, **timings: float) -> None:
+        """Record time spent in each `timings` phase for documents of `class_name`, without counting a document."""
+        counters = self.documents[class_name]
+        for phase, seconds in timings.items():
+            counters[f"{phase}_seconds"] += seconds
+            if not nested:
+                self.total[f"{phase}_seconds"] += seconds
+
+    def record_bulk_write(self, class_name: str, count: int, seconds: float) -> None:
+        """Record `count` documents of `class_name` written in bulk, without being built one at a time."""
+        self.documents[class_name]["created"] += count
+        self.record_write(class_name, seconds)
+
+    def record_write(self, class_name: str, seconds: float) -> None:
+        """Record a bulk insert of documents of `class_name` already recorded as created."""
+        self.documents[class_name]["write_seconds"] += seconds
+        self.total["write_seconds"] += seconds
+
+    def record_cleanup(self, deleted: int, seconds: float) -> None:
+        """Record one `cleanup()` call."""
+        self.cleanup["calls"] += 1
+        self.cleanup["deleted"] += deleted
+        self.cleanup["seconds"] += seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Return a plain, independent copy of the collected stats.
+
+        Returns:
+            dict[str, Any]: `{"total": counters, "documents": {class name: counters},
+            "fields": {field type: counters}, "cleanup": counters}`. Counts are ints and timings are seconds.
+        """
+        return {
+            "total": _plain(self.total),
+            "documents": {name: _plain(counters) for name, counters in self.documents.items()},
+            "fields": {name: _plain(counters) for name, counters in self.fields.items()},
+            "cleanup": _plain(self.cleanup),
+        }
+
+
+def _plain(counters: dict[str, float]) -> dict[str, Any]:
+    return {name: value if name.endswith("seconds") else int(value) for name, value in counters.items()}
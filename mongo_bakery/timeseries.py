@@ -0,0 +1,112 @@
+import itertools
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from mongo_bakery.bakery_fields_generators import faker
+
+
+class TimeSeries:
+    """
+    Shape `make`'s documents into event streams, with `make(..., _timeseries=TimeSeries(...))`.
+
+    Each series gets one reading every `interval`, give or take `jitter`, with occasional `gaps` (outages) and
+    `bursts` (extra readings packed into one interval). With several series, every series reads at each step, and
+    documents are built, and saved or inserted, in timestamp order across all of them, as a MongoDB time-series
+    collection ingests them. All timestamps are drawn at once, from Faker's shared random generator.
+
+    Args:
+        time_field (str): The `DateTimeField` that receives the timestamps.
+        start (datetime, optional): The first timestamp. Defaults to now, to the second, in UTC.
+        interval (timedelta, optional): Time between readings of a series. Defaults to one minute.
+        jitter (float, optional): How much each step may randomly shrink or grow, as a share of `interval`, from 0
+            to less than 1 so timestamps keep increasing. Defaults to 0.
+        gaps (tuple, optional): `(chance, duration)`: before each reading, the chance of a gap lasting up to
+            `duration`. Defaults to no gaps.
+        bursts (tuple, optional): `(chance, size)`: after each reading, the chance that the next `size` readings
+            come in one interval. Defaults to no bursts.
+        series (dict, optional): Metadata fields mapped to one value per series, e.g. `{"sensor_id": [1, 2, 3]}`.
+            Readings cycle through the series in order at each step. Defaults to a single series without
+            metadata.
+
+    Raises:
+        ValueError: If `jitter`, a chance or a size is out of range, or `series` lists are empty or differ in length.
+    """
+
+    def __init__(
+        self,
+        time_field: str,
+        start: datetime | None = None,
+        interval: timedelta = timedelta(minutes=1),
+        jitter: float = 0.0,
+        gaps: tuple[float, timedelta] | None = None,
+        bursts: tuple[float, int] | None = None,
+        series: dict[str, Sequence[Any]] | None = None,
+    ):
+        if not 0 <= jitter < 1:
+            raise ValueError(f"TimeSeries jitter must be at least 0 and less than 1, got {jitter}")
+        for name, spec in (("gaps", gaps), ("bursts", bursts)):
+            if spec is not None and not 0 <= spec[0] <= 1:
+                raise ValueError(f"TimeSeries {name} chance must be between 0 and 1, got {spec[0]}")
+        if bursts is not None and bursts[1] < 1:
+            raise ValueError(f"TimeSeries bursts size must be at least 1, got {bursts[1]}")
+        series = dict(series or {})
+        lengths = {len(values) for values in series.values()}
+        if len(lengths) > 1 or 0 in lengths:
+            raise ValueError("TimeSeries series values must be non-empty and as many for every metadata field")
+
+        self.time_field = time_field
+        self.start = start
+        self.interval = interval
+        self.jitter = jitter
+        self.gaps = gaps
+        self.bursts = bursts
+        self.series = series
+
+    def columns(self, quantity: int) -> dict[str, Any]:
+        """
+        Return the timestamps and metadata of `quantity` readings, in time order, as `make` kwargs.
+
+        Args:
+            quantity (int): The number of documents `make` builds.
+
+        Returns:
+            dict[str, Any]: An iterator of values per field, which `make` treats as columns.
+        """
+        series_count = len(next(iter(self.series.values()), [None]))
+        steps = -(-quantity // series_count)
+        start = self.start or datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+        offsets = self._offsets(steps)
+
+        columns: dict[str, Any] = {
+            self.time_field: iter(
+                [start + timedelta(seconds=offset) for offset in offsets for _ in range(series_count)][:quantity]
+            )
+        }
+        for field_name, values in self.series.items():
+            columns[field_name] = iter(list(itertools.islice(itertools.cycle(values), quantity)))
+        return columns
+
+    def _offsets(self, steps: int) -> list[float]:
+        """Seconds from `start` of each of `steps` readings: increasing, with jitter, gaps and bursts applied."""
+        random = faker.random.random
+        interval, jitter = self.interval.total_seconds(), self.jitter
+        durations = [interval * (1 + jitter * (2 * random() - 1)) for _ in range(steps)]
+
+        if self.bursts is not None:
+            chance, size = self.bursts
+            index = 0
+            while index < steps:
+                if random() < chance:
+                    packed = durations[index + 1 : index + 1 + size]
+                    durations[index + 1 : index + 1 + size] = [step / size for step in packed]
+                    index += size
+                index += 1
+
+        if self.gaps is not None:
+            chance, duration = self.gaps[0], self.gaps[1].total_seconds()
+            durations = [step + duration * random() if random() < chance else step for step in durations]
+
+        if durations:
+            durations[0] = 0.0
+        return list(itertools.accumulate(durations))
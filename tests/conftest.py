@@ -2,6 +2,8 @@ import mongoengine
 import mongomock
 import pytest
 
+pytest_plugins = ["pytester"]
+
 
 @pytest.fixture(scope="session", autouse=True)
 def mock_mongo_connection():
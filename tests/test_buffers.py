@@ -0,0 +1,71 @@
+from mongoengine import BinaryField, Document
+
+from mongo_bakery.bakery import Baker
+from mongo_bakery.buffers import DEFAULT_PAYLOAD_BYTES, BufferPool
+from mongo_bakery.distributions import Length, Pareto
+
+
+class EncryptedPayloadDocument(Document):
+    """
+    EncryptedPayloadDocument exercises `BinaryField` generation from the shared buffer pool.
+
+    Attributes:
+        payload (BinaryField): An unbounded binary payload.
+        digest (BinaryField): A binary value capped at 32 bytes by `max_bytes`.
+
+    Meta:
+        collection (str): The name of the MongoDB collection where the documents are stored.
+    """
+
+    payload = BinaryField(required=True)
+    digest = BinaryField(required=True, max_bytes=32)
+
+    meta = {"collection": "test_documents"}
+
+
+def test_buffer_pool_slices_without_copying():
+    """
+    Test that `BufferPool.take` returns views into one pool, and stitches payloads larger than the pool.
+
+    Asserts:
+    - Small payloads are views of the requested size sharing the pool's memory.
+    - Payloads larger than the pool still have the requested size.
+    """
+    pool = BufferPool(size=1024)
+    first, second = pool.take(100), pool.take(100)
+    assert len(first) == len(second) == 100
+    assert first.obj is second.obj
+    assert len(pool.take(5000)) == 5000
+
+
+def test_make_fills_binary_fields_within_max_bytes():
+    """
+    Test that `BinaryField`s get random bytes of the default size, a `Length`, and never more than `max_bytes`.
+
+    Asserts:
+    - Values are `bytes`, so they pass validation and are saved.
+    - Default payloads are `DEFAULT_PAYLOAD_BYTES` long, capped at `max_bytes`; `Length` sizes vary per document.
+    - The same seed produces the same payloads.
+    """
+    baker = Baker()
+    try:
+        document = baker.make(EncryptedPayloadDocument)
+        assert isinstance(document.payload, bytes)
+        assert len(document.payload) == DEFAULT_PAYLOAD_BYTES
+        assert len(document.digest) == 32
+
+        documents = baker.make(
+            EncryptedPayloadDocument,
+            _quantity=50,
+            payload=Length(Pareto(1.5, scale=1024, max_value=1_000_000)),
+            digest=Length(1000),
+        )
+        assert len({len(document.payload) for document in documents}) > 10
+        assert all(len(document.digest) == 32 for document in documents)
+
+        baker.seed(99)
+        first = baker.prepare(EncryptedPayloadDocument).payload
+        baker.seed(99)
+        assert baker.prepare(EncryptedPayloadDocument).payload == first
+    finally:
+        baker.cleanup()
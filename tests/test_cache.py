@@ -0,0 +1,181 @@
+from unittest.mock import patch
+
+import mongomock.gridfs
+import pytest
+from mongoengine import Document, IntField, ListField, ReferenceField, StringField
+
+from mongo_bakery import baker
+from mongo_bakery.bakery import Baker
+from mongo_bakery.cache import DatasetCache, schema_hash
+from tests.test_files import AttachmentDocument
+from tests.test_mongo_bakery_basics import (
+    NonCyclicDualReferenceDocument,
+    ReferencedDocument,
+    SeedableDocument,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Enable the dataset cache on the shared baker for one test, disabling it and cleaning up afterwards."""
+    baker.use_cache(tmp_path / "cache")
+    yield tmp_path / "cache"
+    baker.use_cache(None)
+    baker.cleanup()
+
+
+def _product_class(max_length):
+    """Define a `Product` document whose only difference between calls is the `name` field's `max_length`."""
+
+    class Product(Document):
+        name = StringField(required=True, max_length=max_length)
+        stock = IntField(required=True)
+
+        meta = {"collection": "test_documents"}
+
+    return Product
+
+
+def test_cache_hit_reloads_documents_without_running_generators(cache_dir):
+    """
+    Test that a seeded `make` is stored on the first run and reloaded, not regenerated, on the next one.
+
+    Asserts:
+    - The second run returns documents equal to what the first one saved, including their ids.
+    - The generators aren't invoked on the second run.
+    """
+    baker.seed(42)
+    first = baker.make(SeedableDocument, _quantity=3)
+    first_data = [SeedableDocument.objects.get(id=document.id).to_mongo().to_dict() for document in first]
+    baker.cleanup()
+
+    baker.seed(42)
+    with patch.object(Baker, "_bake", side_effect=AssertionError("generators should not run on a cache hit")):
+        second = baker.make(SeedableDocument, _quantity=3)
+
+    assert [document.to_mongo().to_dict() for document in second] == first_data
+    assert SeedableDocument.objects.count() == 3
+
+
+def test_cache_hit_restores_nested_references_and_random_state(cache_dir):
+    """
+    Test that a hit reinserts referenced documents and leaves the random generator where generation did.
+
+    Asserts:
+    - Referenced documents created by the original call exist again after a hit.
+    - An uncached `make` following the hit produces the same data as it did following the original call.
+    """
+    baker.seed(7)
+    baker.make(NonCyclicDualReferenceDocument)
+    follow_up = baker.make(SeedableDocument, name=baker.seq("uncached")).to_mongo().to_dict()
+    baker.cleanup()
+
+    baker.seed(7)
+    instance = baker.make(NonCyclicDualReferenceDocument)
+    assert isinstance(instance.primary_ref, ReferencedDocument)
+    assert ReferencedDocument.objects(id=instance.secondary_ref.id).count() == 1
+
+    replayed = baker.make(SeedableDocument, name=baker.seq("uncached")).to_mongo().to_dict()
+    assert {**replayed, "_id": None} == {**follow_up, "_id": None}
+
+
+def test_cache_is_bypassed_without_a_seed(cache_dir):
+    """
+    Test that nothing is cached while `baker.seed()` hasn't been called, since that data isn't reproducible.
+
+    Asserts:
+    - The cache directory is never created.
+    """
+    unseeded = Baker()
+    unseeded.use_cache(cache_dir)
+    unseeded.make(SeedableDocument)
+    unseeded.cleanup()
+
+    assert not cache_dir.exists()
+
+
+def test_cache_is_bypassed_for_documents_with_files(cache_dir):
+    """
+    Test that documents storing GridFS files aren't cached, since entries don't hold the files `cleanup()` deletes.
+
+    Asserts:
+    - A document class with a `FileField`, directly or through a referenced document, has no cache key.
+    - A seeded `make` repeated after `cleanup()` regenerates the file, which reads back.
+    """
+
+    class Folder(Document):
+        attachments = ListField(ReferenceField(AttachmentDocument), required=True)
+
+        meta = {"collection": "test_documents"}
+
+    mongomock.gridfs.enable_gridfs_integration()
+    cache = DatasetCache(cache_dir)
+    assert cache.key(AttachmentDocument, 1, {}, 42, 0) is None
+    assert cache.key(Folder, 1, {}, 42, 0) is None
+    assert cache.key(SeedableDocument, 1, {}, 42, 0) is not None
+
+    baker.seed(42)
+    baker.make(AttachmentDocument)
+    baker.cleanup()
+
+    baker.seed(42)
+    attachment = baker.make(AttachmentDocument)
+    assert attachment.content.read() is not None
+
+
+def test_schema_change_invalidates_only_the_affected_class():
+    """
+    Test that `schema_hash` changes with a field constraint, and only for the class that declares it.
+
+    Asserts:
+    - Two otherwise identical classes differing only in `max_length` hash differently.
+    - An unrelated class's hash is stable across calls.
+    """
+    assert schema_hash(_product_class(10)) != schema_hash(_product_class(20))
+    assert schema_hash(_product_class(10)) == schema_hash(_product_class(10))
+    assert schema_hash(SeedableDocument) == schema_hash(SeedableDocument)
+
+
+def test_schema_hash_is_stable_once_references_resolve():
+    """
+    Test that a reference declared by class name hashes the same before and after it's resolved to the class.
+
+    Asserts:
+    - Hashing a class referencing another by name twice gives the same digest, though the first call resolves it.
+    """
+
+    class HashedAuthor(Document):
+        name = StringField(required=True)
+
+        meta = {"collection": "test_documents"}
+
+    class HashedPost(Document):
+        author = ReferenceField("HashedAuthor", required=True)
+
+        meta = {"collection": "test_documents"}
+
+    assert isinstance(HashedPost._fields["author"].document_type_obj, str)
+    unresolved = schema_hash(HashedPost)
+    assert HashedPost._fields["author"].document_type is HashedAuthor
+    assert schema_hash(HashedPost) == unresolved
+
+
+def test_cache_entries_are_written_whole_and_torn_ones_are_misses(cache_dir):
+    """
+    Test that entries are moved into place complete, and that a truncated entry is treated as a miss.
+
+    Asserts:
+    - After a `make`, the entry's directory holds only its data file and manifest, no temporary files.
+    - A data file cut short, as another process might have left it, makes `get` return `None`.
+    """
+    baker.seed(42)
+    baker.make(SeedableDocument, _quantity=3)
+    [directory] = cache_dir.iterdir()
+    assert sorted(path.suffix for path in directory.iterdir()) == [".bson", ".json"]
+
+    cache = DatasetCache(cache_dir)
+    [data_path] = directory.glob("*.bson")
+    key = data_path.stem
+    assert cache.get(SeedableDocument, key) is not None
+    data_path.write_bytes(data_path.read_bytes()[:-10])
+    assert cache.get(SeedableDocument, key) is None
@@ -0,0 +1,62 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import mongoengine
+import pytest
+
+from mongo_bakery.bakery import Baker
+from mongo_bakery.counters import FileCounter, MongoCounter
+
+
+def test_sequences_sharing_a_mongo_counter_never_collide():
+    """
+    Test that sequences sharing a `MongoCounter`, as separate processes would, lease disjoint blocks of values.
+
+    Asserts:
+    - Interleaved calls and `take`s on two sequences produce no value twice.
+    - Each sequence only hits the database once per block, recorded in the counter document.
+    - `reset()` starts the counter over.
+    """
+    counter = MongoCounter("test-users", block_size=4)
+    counter.reset()
+    first, second = Baker().seq("user-", counter=counter), Baker().seq("user-", counter=counter)
+
+    values = [first(), second(), *first.take(5), *second.take(2), second()]
+
+    assert len(values) == len(set(values)) == 10
+    assert values[:3] == ["user-1", "user-5", "user-2"]
+    counters = mongoengine.get_db()["mongo_bakery_counters"]
+    assert counters.find_one({"_id": "test-users"})["next"] == 12
+
+    counter.reset()
+    assert counters.find_one({"_id": "test-users"}) is None
+
+
+def _take_from_file_counter(path):
+    return Baker().seq(0, counter=FileCounter(path, block_size=10)).take(250)
+
+
+def test_sequences_in_separate_processes_share_a_file_counter(tmp_path):
+    """
+    Test that processes sharing a `FileCounter` produce disjoint values without talking to each other.
+
+    Asserts:
+    - Four processes taking 250 values each produce 1000 distinct values, covering 1 to 1000.
+    """
+    path = tmp_path / "counter"
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        values = [value for batch in executor.map(_take_from_file_counter, [path] * 4) for value in batch]
+
+    assert sorted(values) == list(range(1, 1001))
+
+
+def test_sequences_with_a_shared_counter_cannot_be_partitioned(tmp_path):
+    """
+    Test that `partition` refuses sequences backed by a shared counter.
+
+    Asserts:
+    - A `ValueError` is raised.
+    """
+    sequence = Baker().seq("order-", counter=FileCounter(tmp_path / "counter"))
+
+    with pytest.raises(ValueError, match="shared counter"):
+        sequence.partition(0, 2)
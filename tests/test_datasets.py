@@ -0,0 +1,145 @@
+import gzip
+from unittest.mock import MagicMock
+
+import bson
+import pytest
+from bson import json_util
+from bson.raw_bson import RawBSONDocument
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
+
+from mongo_bakery import baker
+from mongo_bakery.datasets import load_documents
+from tests.test_mongo_bakery_basics import DocumentToTest, MiscFieldsDocument
+
+
+def test_export_writes_mongorestore_compatible_bson(tmp_path):
+    """
+    Test that `baker.export()` writes generated documents to a `.bson` file instead of the database.
+
+    Asserts:
+    - A single file is written, containing exactly `_quantity` BSON documents.
+    - Each document has an `_id` and honors the kwargs passed to `export`.
+    - Nothing was saved to the collection.
+    """
+    written = baker.export(DocumentToTest, tmp_path / "people.bson", _quantity=3, company="Acme")
+
+    assert written == [tmp_path / "people.bson"]
+    with written[0].open("rb") as handle:
+        documents = list(bson.decode_file_iter(handle))
+    assert len(documents) == 3
+    assert all(isinstance(document["_id"], bson.ObjectId) for document in documents)
+    assert all(document["company"] == "Acme" for document in documents)
+    assert DocumentToTest.objects.count() == 0
+
+
+def test_export_writes_compressed_extended_json_lines(tmp_path):
+    """
+    Test that `baker.export()` writes gzipped Extended JSON lines, preserving BSON types such as UUIDs.
+
+    Asserts:
+    - The file name gets a `.gz` suffix.
+    - Each line decodes back to a document with the original value types.
+    """
+    written = baker.export(MiscFieldsDocument, tmp_path / "misc.jsonl", _quantity=2, _format="jsonl", _compress=True)
+
+    assert written == [tmp_path / "misc.jsonl.gz"]
+    with gzip.open(written[0], "rt") as handle:
+        documents = [json_util.loads(line) for line in handle]
+    assert len(documents) == 2
+    assert all(isinstance(document["views"], int) for document in documents)
+
+
+def test_export_splits_output_into_chunks(tmp_path):
+    """
+    Test that `baker.export()` honors `_chunk_size` by spreading documents across numbered files.
+
+    Asserts:
+    - 5 documents with a chunk size of 2 produce 3 files, numbered before the suffix.
+    - The last file holds the remainder.
+    - Only the format and `.gz` suffixes follow the number; other dots are part of the name.
+    """
+    written = baker.export(DocumentToTest, tmp_path / "people.bson", _quantity=5, _chunk_size=2)
+
+    assert [path.name for path in written] == ["people.00000.bson", "people.00001.bson", "people.00002.bson"]
+    with written[-1].open("rb") as handle:
+        assert len(list(bson.decode_file_iter(handle))) == 1
+
+    versioned = baker.export(
+        DocumentToTest, tmp_path / "people.v2.jsonl", _quantity=2, _format="jsonl", _compress=True, _chunk_size=1
+    )
+    assert [path.name for path in versioned] == ["people.v2.00000.jsonl.gz", "people.v2.00001.jsonl.gz"]
+
+
+def test_load_inserts_a_bson_dump_and_tracks_it_for_cleanup(tmp_path):
+    """
+    Test that `baker.load()` inserts every document of a `.bson` dump and `cleanup()` deletes them again.
+
+    Asserts:
+    - `load` returns the number of documents in the file, and they're all in the collection.
+    - `cleanup()` removes them, even though they were never built as `Document` instances.
+    """
+    [path] = baker.export(DocumentToTest, tmp_path / "people.bson", _quantity=5)
+
+    assert baker.load(DocumentToTest, path, _batch_size=2) == 5
+    assert DocumentToTest.objects.count() == 5
+
+    baker.cleanup()
+    assert DocumentToTest.objects.count() == 0
+
+
+def test_load_tracks_batches_inserted_before_a_failing_one(tmp_path):
+    """
+    Test that a `load` interrupted by a duplicate `_id` still leaves what it inserted for `cleanup()` to delete.
+
+    Asserts:
+    - The `BulkWriteError` is re-raised.
+    - `cleanup()` deletes every document `load` inserted, but not the pre-existing one whose `_id` clashed.
+    """
+    [path] = baker.export(DocumentToTest, tmp_path / "people.bson", _quantity=5)
+    with path.open("rb") as handle:
+        existing = list(bson.decode_file_iter(handle))[3]
+    collection = DocumentToTest._get_collection()
+    collection.insert_one(existing)
+
+    with pytest.raises(BulkWriteError):
+        baker.load(DocumentToTest, path, _batch_size=2)
+    assert DocumentToTest.objects.count() == 4
+
+    baker.cleanup()
+    assert [document["_id"] for document in collection.find()] == [existing["_id"]]
+    collection.delete_one({"_id": existing["_id"]})
+
+
+def test_load_inserts_raw_batches_into_a_real_pymongo_collection(tmp_path):
+    """
+    Test that `load_documents` hands a `pymongo` collection undecoded `RawBSONDocument` batches.
+
+    Asserts:
+    - `insert_many` receives batches of at most `batch_size` `RawBSONDocument` instances.
+    - The returned ids match the `_id` of every document in the file.
+    """
+    [path] = baker.export(DocumentToTest, tmp_path / "people.bson", _quantity=3)
+    collection = MagicMock(spec=Collection)
+
+    ids = load_documents(collection, path, batch_size=2)
+
+    batches = [call.args[0] for call in collection.insert_many.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert all(isinstance(document, RawBSONDocument) for batch in batches for document in batch)
+    with path.open("rb") as handle:
+        assert ids == [document["_id"] for document in bson.decode_file_iter(handle)]
+
+
+def test_load_rejects_compressed_dumps(tmp_path):
+    """
+    Test that `baker.load()` raises a clear error for a gzipped dump, which can't be memory-mapped.
+
+    Asserts:
+    - A `ValueError` mentioning the compression is raised, and nothing is inserted.
+    """
+    [path] = baker.export(DocumentToTest, tmp_path / "people.bson", _quantity=2, _compress=True)
+
+    with pytest.raises(ValueError, match="gzip-compressed"):
+        baker.load(DocumentToTest, path)
+    assert DocumentToTest.objects.count() == 0
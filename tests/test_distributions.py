@@ -0,0 +1,226 @@
+from collections import Counter
+
+import pytest
+
+from mongo_bakery import Recipe
+from mongo_bakery.bakery import Baker
+from mongo_bakery.distributions import (
+    Cardinality,
+    Distribution,
+    Length,
+    Normal,
+    NullRatio,
+    Pareto,
+    Weighted,
+    Zipf,
+)
+from tests.test_mongo_bakery_basics import (
+    BotDialog,
+    DocumentToTest,
+    EmbeddedListDocument,
+    MapFieldDocument,
+    SeedableDocument,
+    TypedListDocument,
+)
+
+
+def test_distribution_subclasses_must_implement_take():
+    """
+    Test that `Distribution` is abstract, so a subclass missing `take` fails when created rather than when drawn from.
+
+    Asserts:
+    - Instantiating `Distribution`, or a subclass that doesn't define `take`, raises a `TypeError`.
+    """
+
+    class Incomplete(Distribution):
+        pass
+
+    with pytest.raises(TypeError):
+        Distribution()
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_weighted_and_zipf_skew_values():
+    """
+    Test that `Weighted` and `Zipf` draw values with the requested skew.
+
+    Asserts:
+    - `Weighted` only returns its values, the heaviest one most often.
+    - `Zipf` returns ranks from 1 to `n`, rank 1 far more often than rank `n`, or the given values instead.
+    """
+    baker = Baker()
+    try:
+        instances = baker.prepare(SeedableDocument, _quantity=1000, name=Weighted({"active": 8, "banned": 2}))
+        counts = Counter(instance.name for instance in instances)
+        assert set(counts) == {"active", "banned"}
+        assert counts["active"] > 2 * counts["banned"]
+
+        ranks = Counter(Zipf(50, s=1.5).take(2000))
+        assert set(ranks) <= set(range(1, 51))
+        assert ranks[1] > 10 * ranks[50]
+
+        assert set(Zipf(2, values=["hot", "cold"]).take(100)) <= {"hot", "cold"}
+        with pytest.raises(ValueError, match="Zipf needs 3 values, got 2"):
+            Zipf(3, values=["hot", "cold"])
+    finally:
+        baker.cleanup()
+
+
+def test_normal_clamps_and_rounds_for_integer_fields():
+    """
+    Test that `Normal` clamps values to its bounds and rounds them for integer fields.
+
+    Asserts:
+    - Values for an `IntField` are ints within `min_value` and `max_value`.
+    - Values for a `FloatField` keep their fractions unless `integer=True`.
+    """
+    baker = Baker()
+    instances = baker.prepare(
+        SeedableDocument,
+        _quantity=500,
+        age=Normal(35, 20, min_value=18, max_value=90),
+        height_ft=Normal(5.5, 0.3),
+    )
+
+    ages = [instance.age for instance in instances]
+    assert all(isinstance(age, int) and 18 <= age <= 90 for age in ages)
+    assert 18 in ages
+    assert any(instance.height_ft != int(instance.height_ft) for instance in instances)
+
+    rounded = baker.prepare(SeedableDocument, _quantity=10, height_ft=Normal(5.5, 0.3, integer=True))
+    assert all(instance.height_ft == int(instance.height_ft) for instance in rounded)
+
+
+def test_cardinality_limits_distinct_values():
+    """
+    Test that `Cardinality` draws from a pool of exactly `n` distinct values.
+
+    Asserts:
+    - Values come from the field's generator, or from `of`, with exactly `n` distinct values.
+    - A generator that can't produce `n` distinct values raises a `ValueError`.
+    """
+    baker = Baker()
+    try:
+        instances = baker.make(SeedableDocument, _quantity=200, name=Cardinality(5))
+        assert len({instance.name for instance in instances}) == 5
+
+        skewed = baker.prepare(SeedableDocument, _quantity=200, age=Cardinality(3, skew=2, of=Zipf(10)))
+        assert len({instance.age for instance in skewed}) == 3
+
+        with pytest.raises(ValueError, match="Could only generate 2 distinct values, fewer than the 3 requested"):
+            baker.prepare(SeedableDocument, _quantity=10, is_admin=Cardinality(3))
+    finally:
+        baker.cleanup()
+
+
+def test_null_ratio_leaves_optional_field_sparse():
+    """
+    Test that `NullRatio` leaves about the given share of values `None`, and generates the others.
+
+    Asserts:
+    - Roughly the requested share of an optional field is `None`, and the rest are generated strings.
+    - Ratios outside 0 to 1 raise a `ValueError`.
+    """
+    baker = Baker()
+    instances = baker.prepare(DocumentToTest, _quantity=1000, region=NullRatio(0.8))
+
+    regions = [instance.region for instance in instances]
+    assert 700 < regions.count(None) < 900
+    assert all(isinstance(region, str) for region in regions if region is not None)
+
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        NullRatio(1.5)
+
+
+def test_distributions_are_seeded_and_work_in_recipes():
+    """
+    Test that distributions draw from the seeded random generator and can be used as recipe values.
+
+    Asserts:
+    - The same seed produces the same values.
+    - A recipe's distribution is drawn anew for each `make`.
+    """
+    baker = Baker()
+    recipe = Recipe(SeedableDocument, age=Normal(40, 10), name=Cardinality(4, of=Weighted({"a": 1, "b": 1, "c": 1, "d": 1})))
+    try:
+        baker.seed(1234)
+        first = [(instance.age, instance.name) for instance in recipe.make(_quantity=20, _baker=baker)]
+        baker.seed(1234)
+        second = [(instance.age, instance.name) for instance in recipe.make(_quantity=20, _baker=baker)]
+
+        assert first == second
+        assert len({name for _, name in first}) == 4
+    finally:
+        baker.cleanup()
+
+
+def test_length_sizes_list_and_map_fields():
+    """
+    Test that `Length` fills list and map fields with the requested number of generated items.
+
+    Asserts:
+    - A fixed size gives every container exactly that many items, of the inner field's type.
+    - A `(min, max)` range stays within bounds, and a `Pareto` size gives a heavy tail of larger containers.
+    - Map keys are unique, so maps hold exactly the drawn number of items, and embedded documents are built.
+    """
+    baker = Baker()
+    try:
+        lists = baker.make(TypedListDocument, _quantity=20, numbers=Length(500), names=Length((1, 3)))
+        assert all(len(instance.numbers) == 500 for instance in lists)
+        assert all(isinstance(number, int) and 0 <= number <= 100 for number in lists[0].numbers)
+        assert {len(instance.names) for instance in lists} <= {1, 2, 3}
+
+        maps = baker.prepare(MapFieldDocument, _quantity=200, scores=Length(Pareto(1.2, max_value=1000)))
+        sizes = sorted(len(instance.scores) for instance in maps)
+        assert sizes[0] >= 1
+        assert sizes[-1] > 5 * sizes[len(sizes) // 2]
+        assert all(isinstance(score, int) for score in maps[0].scores.values())
+
+        departments = baker.prepare(EmbeddedListDocument, departments=Length(3)).departments
+        assert len(departments) == 3
+        assert all(department.name for department in departments)
+    finally:
+        baker.cleanup()
+
+
+def test_length_nests_dict_fields():
+    """
+    Test that `Length` with `depth` builds nested dicts for a `DictField`.
+
+    Asserts:
+    - Each level holds the requested number of keys, and the innermost values are strings.
+    - `Length` rejects fields that aren't containers, and invalid sizes.
+    """
+    baker = Baker()
+    instance = baker.prepare(DocumentToTest, permissions=Length(4, depth=3))
+
+    level_one = instance.permissions
+    assert len(level_one) == 4
+    level_two = next(iter(level_one.values()))
+    assert len(level_two) == 4
+    level_three = next(iter(level_two.values()))
+    assert len(level_three) == 4
+    assert all(isinstance(value, str) for value in level_three.values())
+
+    with pytest.raises(ValueError, match="Length only applies to ListField, MapField, DictField, BinaryField and FileField values, not IntField"):
+        baker.prepare(SeedableDocument, age=Length(3))
+    with pytest.raises(ValueError, match="0 <= min <= max"):
+        Length((5, 2))
+
+
+def test_bulk_generation_respects_choices_and_counts_stats():
+    """
+    Test that values generated in bulk for containers follow `choices`, and are counted by `collect_stats`.
+
+    Asserts:
+    - Bulk values for a field with `choices` are always allowed values.
+    - Stats count every value generated in bulk.
+    """
+    baker = Baker()
+    node_types = baker._generate_many(BotDialog._fields["node_type"], 100)
+    assert set(node_types) <= {"standard", "manual", "slot", "soft"}
+
+    baker.collect_stats()
+    baker.prepare(TypedListDocument, numbers=Length(1000))
+    assert baker.stats()["fields"]["IntField"]["generated"] == 1000
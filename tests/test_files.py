@@ -0,0 +1,119 @@
+import io
+
+import mongomock.gridfs
+import pytest
+from mongoengine import Document, FileField, ImageField, StringField
+from mongoengine.connection import get_db
+
+from mongo_bakery.bakery import Baker
+from mongo_bakery.distributions import Length
+from mongo_bakery.files import RandomStream
+
+
+class AttachmentDocument(Document):
+    """
+    AttachmentDocument exercises `FileField` generation into GridFS.
+
+    Attributes:
+        name (StringField): A simple required field.
+        content (FileField): The attached file, stored in the "attachments" GridFS bucket.
+
+    Meta:
+        collection (str): The name of the MongoDB collection where the documents are stored.
+    """
+
+    name = StringField(required=True)
+    content = FileField(required=True, collection_name="attachments")
+
+    meta = {"collection": "test_documents"}
+
+
+@pytest.fixture(autouse=True)
+def gridfs_on_mongomock():
+    mongomock.gridfs.enable_gridfs_integration()
+
+
+def _stored_files(collection_name):
+    return get_db()[f"{collection_name}.files"].count_documents({})
+
+
+def test_random_stream_is_generated_as_read():
+    """
+    Test that `RandomStream` yields exactly its size in random bytes, chunk by chunk.
+
+    Asserts:
+    - Reads return at most the requested size, then `b""` once the stream is exhausted.
+    """
+    stream = RandomStream(10)
+    assert len(stream.read(4)) == 4
+    assert len(stream.read()) == 6
+    assert stream.read(4) == b""
+
+
+def test_make_streams_file_fields_into_gridfs():
+    """
+    Test that `make` stores generated `FileField` contents in GridFS, sized by `Length`, and cleans them up in bulk.
+
+    Asserts:
+    - Files have the default size, or the size drawn from `Length`, and read back through the field.
+    - Files of bulk-inserted and unsaved documents are deleted by `cleanup()` too.
+    """
+    baker = Baker()
+    attachment = baker.make(AttachmentDocument)
+    assert len(attachment.content.read()) == 16 * 1024
+
+    big = baker.make(AttachmentDocument, content=Length(1_000_000))
+    assert big.content.length == 1_000_000
+    assert AttachmentDocument.objects.get(id=big.id).content.length == 1_000_000
+
+    baker.make(AttachmentDocument, _quantity=3, content=Length((1, 100)), _return="none")
+    baker.prepare(AttachmentDocument)
+    assert _stored_files("attachments") == 6
+
+    baker.cleanup()
+    assert _stored_files("attachments") == 0
+    assert get_db()["attachments.chunks"].count_documents({}) == 0
+
+
+def test_make_stores_file_object_values_whole():
+    """
+    Test that a file object passed to `make` is stored as a file, not treated as a column of its lines.
+
+    Asserts:
+    - The `FileField` reads back the whole contents of the file object.
+    """
+    baker = Baker()
+    try:
+        attachment = baker.make(AttachmentDocument, content=io.BytesIO(b"first line\nsecond line\n"))
+        assert AttachmentDocument.objects.get(id=attachment.id).content.read() == b"first line\nsecond line\n"
+    finally:
+        baker.cleanup()
+
+
+def test_make_stores_valid_images():
+    """
+    Test that `ImageField`s get a valid PNG at the field's size, with a thumbnail if the field declares one.
+
+    Asserts:
+    - The stored image opens with Pillow and has the field's dimensions and format.
+    - The thumbnail is stored too, and both are deleted by `cleanup()`.
+    """
+    image_module = pytest.importorskip("PIL.Image")
+
+    class AvatarDocument(Document):
+        """Declared here, since `ImageField` raises at class creation without Pillow."""
+
+        picture = ImageField(required=True, size=(120, 80, True), thumbnail_size=(30, 30, False))
+
+        meta = {"collection": "test_documents"}
+
+    baker = Baker()
+    avatar = baker.make(AvatarDocument)
+    assert avatar.picture.size == (120, 80)
+    assert avatar.picture.format == "PNG"
+    assert image_module.open(avatar.picture).size == (120, 80)
+    assert avatar.picture.thumbnail.height == 20
+    assert _stored_files("images") == 2
+
+    baker.cleanup()
+    assert _stored_files("images") == 0
@@ -0,0 +1,111 @@
+import pytest
+from mongoengine import (
+    Document,
+    GeoPointField,
+    LineStringField,
+    MultiLineStringField,
+    MultiPointField,
+    MultiPolygonField,
+    PointField,
+    PolygonField,
+)
+
+from mongo_bakery.bakery import Baker
+from mongo_bakery.geo import Spatial
+from tests.test_mongo_bakery_basics import SeedableDocument
+
+
+class PlaceDocument(Document):
+    """
+    PlaceDocument exercises generation for every geo field type.
+
+    Attributes:
+        location (PointField): A GeoJSON point.
+        legacy_location (GeoPointField): A legacy `[x, y]` coordinate pair.
+        route (LineStringField): A GeoJSON line string.
+        area (PolygonField): A GeoJSON polygon.
+        stops (MultiPointField): A GeoJSON multi point.
+        routes (MultiLineStringField): A GeoJSON multi line string.
+        areas (MultiPolygonField): A GeoJSON multi polygon.
+
+    Meta:
+        collection (str): The name of the MongoDB collection where the documents are stored.
+    """
+
+    location = PointField(required=True)
+    legacy_location = GeoPointField(required=True)
+    route = LineStringField(required=True)
+    area = PolygonField(required=True)
+    stops = MultiPointField(required=True)
+    routes = MultiLineStringField(required=True)
+    areas = MultiPolygonField(required=True)
+
+    meta = {"collection": "test_documents"}
+
+
+def _coordinates(value):
+    if isinstance(value, dict):
+        value = value["coordinates"]
+    if isinstance(value[0], float):
+        return [value]
+    return [point for part in value for point in _coordinates(part)]
+
+
+def test_make_generates_valid_geometries():
+    """
+    Test that every geo field gets a valid geometry, saved and read back as GeoJSON.
+
+    Asserts:
+    - Documents pass MongoEngine's geometry validation and are saved.
+    - Polygon rings are closed, and every coordinate is a valid longitude/latitude.
+    """
+    baker = Baker()
+    try:
+        places = baker.make(PlaceDocument, _quantity=20)
+        stored = PlaceDocument.objects.get(id=places[0].id)
+        assert stored.location["type"] == "Point"
+        assert stored.areas["type"] == "MultiPolygon"
+
+        for place in places:
+            assert place.area[0][0] == place.area[0][-1]
+            assert all(polygon[0][0] == polygon[0][-1] for polygon in place.areas)
+            for field_name in PlaceDocument._fields_ordered[1:]:
+                for lng, lat in _coordinates(getattr(place, field_name)):
+                    assert -180 <= lng <= 180 and -90 <= lat <= 90
+    finally:
+        baker.cleanup()
+
+
+def test_spatial_keeps_shapes_in_bbox_and_clusters_around_hotspots():
+    """
+    Test that `Spatial` keeps every shape inside its bounding box and clusters centers around hotspots.
+
+    Asserts:
+    - Every coordinate of every shape is within the bounding box.
+    - With hotspots, most points are near a hotspot, the heavier one more often.
+    - Invalid arguments and non-geo fields raise a `ValueError`.
+    """
+    baker = Baker()
+    bbox = (-74.05, 40.60, -73.85, 40.90)
+    places = baker.prepare(
+        PlaceDocument,
+        _quantity=200,
+        areas=Spatial(bbox=bbox, size=0.005),
+        location=Spatial(bbox=bbox, hotspots=[(-73.98, 40.75, 0.002), (-73.95, 40.65, 0.002)], weights=[3, 1]),
+    )
+
+    for place in places:
+        for lng, lat in _coordinates(place.areas):
+            assert bbox[0] <= lng <= bbox[2] and bbox[1] <= lat <= bbox[3]
+
+    near_first = sum(abs(place.location[0] + 73.98) < 0.01 and abs(place.location[1] - 40.75) < 0.01 for place in places)
+    near_second = sum(abs(place.location[0] + 73.95) < 0.01 and abs(place.location[1] - 40.65) < 0.01 for place in places)
+    assert near_first + near_second == 200
+    assert near_first > 2 * near_second
+
+    with pytest.raises(ValueError, match="Spatial bbox must be"):
+        Spatial(bbox=(10, 0, 5, 1))
+    with pytest.raises(ValueError, match="one weight per hotspot"):
+        Spatial(hotspots=[(0, 0, 1)], weights=[1, 2])
+    with pytest.raises(ValueError, match="Spatial only applies to GeoJSON and GeoPointField values, not IntField"):
+        baker.prepare(SeedableDocument, age=Spatial())
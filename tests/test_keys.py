@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+import pytest
+from mongoengine import Document, StringField, UUIDField
+
+from mongo_bakery.bakery import Baker
+from mongo_bakery.keys import OrderedKeys
+from tests.test_mongo_bakery_basics import SeedableDocument
+
+
+class EventDocument(Document):
+    """
+    EventDocument exercises ordered key generation for both key types.
+
+    Attributes:
+        event_id (UUIDField): A UUID key.
+        name (StringField): A simple required field.
+
+    Meta:
+        collection (str): The name of the MongoDB collection where the documents are stored.
+    """
+
+    event_id = UUIDField(required=True, binary=False)
+    name = StringField(required=True)
+
+    meta = {"collection": "test_documents"}
+
+
+def test_ordered_object_ids_spread_over_the_period():
+    """
+    Test that `OrderedKeys` gives `_id`s increasing synthetic timestamps spread over the configured period.
+
+    Asserts:
+    - Ids are unique and sorted in the order documents were made.
+    - Their generation times start at `start` and stay within `period`.
+    """
+    baker = Baker()
+    start = datetime(2024, 1, 1)
+    try:
+        events = baker.make(EventDocument, _quantity=200, id=OrderedKeys(period=timedelta(days=365), start=start))
+        ids = [event.id for event in events]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 200
+
+        times = [object_id.generation_time.replace(tzinfo=None) for object_id in ids]
+        assert start <= times[0] < start + timedelta(days=1)
+        assert start + timedelta(days=363) <= times[-1] < start + timedelta(days=365)
+    finally:
+        baker.cleanup()
+
+
+def test_ordered_uuids_are_version_7_and_increasing():
+    """
+    Test that `OrderedKeys` gives `UUIDField`s version 7 UUIDs, increasing even within one millisecond.
+
+    Asserts:
+    - UUIDs have version 7, are unique and sorted, and embed the key's millisecond timestamp.
+    - `OrderedKeys` rejects other field types and non-positive periods.
+    """
+    baker = Baker()
+    start = datetime(2024, 1, 1)
+    events = baker.prepare(EventDocument, _quantity=1000, event_id=OrderedKeys(period=timedelta(milliseconds=10), start=start))
+    uuids = [event.event_id for event in events]
+    assert {key.version for key in uuids} == {7}
+    assert uuids == sorted(uuids)
+    assert len(set(uuids)) == 1000
+    assert uuids[0].int >> 80 == 1_704_067_200_000  # 2024-01-01T00:00:00Z, in milliseconds
+
+    with pytest.raises(ValueError, match="OrderedKeys only applies to UUIDField and ObjectIdField values, not IntField"):
+        baker.prepare(SeedableDocument, age=OrderedKeys())
+    with pytest.raises(ValueError, match="period must be positive"):
+        OrderedKeys(period=timedelta(0))
@@ -1,4 +1,5 @@
 import importlib.util
+import itertools
 import sys
 import types
 import uuid
@@ -31,6 +32,7 @@ from mongoengine import (
     URLField,
     UUIDField,
 )
+from mongoengine.errors import ValidationError
 
 from mongo_bakery import (
     baker,
@@ -942,6 +944,28 @@ def test_make_respects_embedded_document_list_field_inner_type():
     assert all(isinstance(department, Department) for department in instance.departments)
 
 
+def test_make_builds_embedded_field_values_without_the_make_machinery():
+    """
+    Test that embedded field values skip `make`'s persistence work, and reuse one generation plan per class.
+
+    Asserts:
+    - Only the parent document goes through `_bake`; its embedded `Department`s are still fully populated.
+    - Baking more parents doesn't compile another plan for `Department`.
+    """
+    local_baker = bakery_module.Baker()
+    try:
+        with patch.object(local_baker, "_bake", wraps=local_baker._bake) as bake_spy:
+            instances = local_baker.make(EmbeddedListDocument, _quantity=3)
+
+        bake_spy.assert_called_once()
+        departments = [department for instance in instances for department in instance.departments]
+        assert len(departments) == 6
+        assert all(department.name and department.address and department.location for department in departments)
+        assert list(local_baker._embedded_plans) == [Department]
+    finally:
+        local_baker.cleanup()
+
+
 def test_make_respects_map_field_inner_type():
     """
     Test that `baker.make` generates a dict whose values match the inner field type declared for `MapField` (issue #46).
@@ -1210,7 +1234,7 @@ def test_seq_raises_for_unsupported_value_type():
     Test that `baker.seq()` raises a `ValueError` when used with a value type it doesn't know how to increment.
 
     Asserts:
-    - A `ValueError` mentioning the unsupported type is raised when the sequence is resolved.
+    - A `ValueError` mentioning the unsupported type is raised when the sequence is built.
     """
     with pytest.raises(ValueError, match="No sequence strategy defined for value type: list"):
         baker.make(SequenceDocument, name=baker.seq([1, 2, 3]), _quantity=2)
@@ -1260,3 +1284,225 @@ def test_mock_generators_name_their_second_parameter_baker():
         )
 
 
+def test_seq_take_returns_the_values_calls_would_have_returned():
+    """
+    Test that `Sequence.take(n)` returns the next `n` values at once, for every supported value type.
+
+    Asserts:
+    - Taking values and then calling the sequence continues where `take` stopped, matching a twin sequence
+      that was only ever called.
+    """
+    bases = [
+        ("user-", {}),
+        (10, {"increment_by": 5, "start": 0}),
+        (1.5, {"increment_by": 0.1}),
+        (date(2025, 1, 1), {"increment_by": timedelta(days=7)}),
+        (datetime(2025, 1, 1), {"increment_by": timedelta(minutes=1)}),
+    ]
+    for value, options in bases:
+        taken, called = baker.seq(value, **options), baker.seq(value, **options)
+
+        assert [*taken.take(4), taken()] == [called() for _ in range(5)]
+
+
+def test_seq_partitions_are_disjoint():
+    """
+    Test that `Sequence.partition` splits the remaining values into interleaved, non-overlapping sequences.
+
+    Asserts:
+    - Together, the partitions produce exactly the values the original sequence would have.
+    - An out-of-range partition index raises a `ValueError`.
+    """
+    sequence = baker.seq("order-")
+    sequence()
+    partitions = [sequence.partition(index, 3) for index in range(3)]
+
+    values = [value for partition in partitions for value in partition.take(4)]
+
+    assert sorted(values) == sorted(sequence.take(12))
+    assert partitions[1].take(2) == ["order-15", "order-18"]
+    with pytest.raises(ValueError, match="between 0 and 2"):
+        sequence.partition(3, 3)
+
+
+class FakeArray:
+    """A minimal stand-in for a NumPy array: `make` only relies on `__array__` and `tolist()`."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def __array__(self):
+        raise AssertionError("make should convert arrays with tolist()")
+
+    def tolist(self):
+        return list(self.values)
+
+
+def test_make_zips_iterators_ranges_and_arrays_across_quantity():
+    """
+    Test that iterator, `range` and array-like kwargs supply one value per instance, in order.
+
+    Asserts:
+    - Instance `i` gets the `i`-th value of each column, and an infinite iterator is only consumed `_quantity` times.
+    - List values are still used as-is for every instance.
+    """
+    counter = itertools.count(100)
+    instances = baker.make(
+        SequenceDocument,
+        _quantity=3,
+        name=(f"user-{i}" for i in range(3)),
+        age=range(20, 23),
+        height_ft=FakeArray([5.5, 6.0, 6.5]),
+    )
+    counted = baker.make(SequenceDocument, _quantity=2, age=counter)
+    numbers = baker.make(TypedListDocument, _quantity=2, numbers=[1, 2])
+    try:
+        assert [instance.name for instance in instances] == ["user-0", "user-1", "user-2"]
+        assert [instance.age for instance in instances] == [20, 21, 22]
+        assert [instance.height_ft for instance in instances] == [5.5, 6.0, 6.5]
+        assert [instance.age for instance in counted] == [100, 101]
+        assert next(counter) == 102
+        assert [instance.numbers for instance in numbers] == [[1, 2], [1, 2]]
+    finally:
+        baker.cleanup()
+
+
+def test_make_uses_querysets_as_plain_values():
+    """
+    Test that a `QuerySet` kwarg is one value for every instance, like a list, rather than a column.
+
+    Asserts:
+    - Every instance's `ListField(ReferenceField)` holds all the documents the `QuerySet` matches.
+    """
+
+    class Shelf(Document):
+        books = ListField(ReferenceField(ReferencedDocument), required=True)
+
+        meta = {"collection": "test_documents"}
+
+    books = baker.make(ReferencedDocument, _quantity=2, name="queried")
+    try:
+        shelves = baker.make(Shelf, _quantity=2, books=ReferencedDocument.objects(name="queried"))
+        expected = sorted(book.id for book in books)
+        assert [sorted(book.id for book in shelf.books) for shelf in shelves] == [expected, expected]
+    finally:
+        baker.cleanup()
+
+
+def test_make_rejects_columns_of_the_wrong_length_before_saving_anything():
+    """
+    Test that a column kwarg whose length doesn't match `_quantity` raises before any instance is built.
+
+    Asserts:
+    - Short iterators and sized columns of the wrong length raise a `ValueError` naming the field.
+    - Nothing was saved.
+    """
+    count_before = SequenceDocument.objects.count()
+    with pytest.raises(ValueError, match="`name` ran out after 2 values, but _quantity is 3"):
+        baker.make(SequenceDocument, _quantity=3, name=iter(["a", "b"]))
+    with pytest.raises(ValueError, match="`age` has 4 values, but _quantity is 3"):
+        baker.make(SequenceDocument, _quantity=3, age=FakeArray([1, 2, 3, 4]))
+    assert SequenceDocument.objects.count() == count_before
+
+
+def test_make_can_return_ids_or_nothing(monkeypatch):
+    """
+    Test that `make(..., _return="ids")` inserts in batches and returns only ids, and `_return="none"` nothing.
+
+    Asserts:
+    - The ids of every inserted document come back, in order (a single id when `_quantity` is 1).
+    - `"none"` returns `None`, yet the documents exist.
+    - `cleanup()` deletes everything, and no instances were kept around.
+    """
+    monkeypatch.setattr(bakery_module, "INSERT_BATCH_SIZE", 2)
+    local_baker = bakery_module.Baker()
+    try:
+        ids = local_baker.make(SequenceDocument, _quantity=5, _return="ids", age=range(5))
+        single_id = local_baker.make(SequenceDocument, _return="ids", age=99)
+        nothing = local_baker.make(SeedableDocument, _quantity=3, _return="none", name="bulk")
+
+        assert [document.age for document in SequenceDocument.objects(id__in=ids).order_by("age")] == [0, 1, 2, 3, 4]
+        assert {document.id for document in SequenceDocument.objects(id__in=ids)} == set(ids)
+        assert SequenceDocument.objects.get(id=single_id).age == 99
+        assert nothing is None
+        assert SeedableDocument.objects(name="bulk").count() == 3
+        assert local_baker._created_instances == []
+    finally:
+        local_baker.cleanup()
+    assert SequenceDocument.objects(id__in=[*ids, single_id]).count() == 0
+    assert SeedableDocument.objects(name="bulk").count() == 0
+
+
+def test_make_cleans_up_batches_inserted_before_a_failing_one(monkeypatch):
+    """
+    Test that batches bulk-inserted before one fails are still tracked, so `cleanup()` deletes them.
+
+    Asserts:
+    - An invalid value partway through raises, after the batches before it were inserted.
+    - `cleanup()` deletes every document that was inserted.
+    """
+    monkeypatch.setattr(bakery_module, "INSERT_BATCH_SIZE", 2)
+    local_baker = bakery_module.Baker()
+    with pytest.raises(ValidationError):
+        local_baker.make(SequenceDocument, _quantity=5, _return="ids", name="partial", age=iter([0, 1, 2, 3, "x"]))
+    assert SequenceDocument.objects(name="partial").count() == 4
+
+    local_baker.cleanup()
+    assert SequenceDocument.objects(name="partial").count() == 0
+
+
+def test_make_rejects_unknown_return_shapes_and_embedded_ids():
+    """
+    Test that `make` validates `_return`.
+
+    Asserts:
+    - An unknown shape raises a `ValueError` listing the valid ones.
+    - Asking for the ids of an `EmbeddedDocument`, which is never saved, raises a `ValueError`.
+    """
+    with pytest.raises(ValueError, match="_return must be one of documents, ids, none"):
+        baker.make(SequenceDocument, _return="objects")
+    with pytest.raises(ValueError, match="EmbeddedDocuments aren't saved on their own"):
+        baker.make(Department, _return="ids")
+
+
+def test_lazy_prepare_generates_fields_on_first_read():
+    """
+    Test that `prepare(..., _lazy=True)` only generates the fields a test reads, deterministically.
+
+    Asserts:
+    - Reading one field generates only that field; explicit values are set up front.
+    - With the same seed, fields get the same values whatever order they're read in.
+    - Reading lazy fields leaves the shared random generator untouched for later generation.
+    """
+    baker.seed(3)
+    instance = baker.prepare(SeedableDocument, _lazy=True, is_admin=True)
+    assert instance.is_admin is True
+    assert isinstance(instance.name, str)
+    assert set(instance._data._pending) == {"age", "height_ft", "joined_at"}
+    name, age = instance.name, instance.age
+    after_reads = baker.prepare(SeedableDocument).name
+
+    baker.seed(3)
+    reread = baker.prepare(SeedableDocument, _lazy=True, is_admin=True)
+    assert (reread.age, reread.name) == (age, name)
+
+    baker.seed(3)
+    baker.prepare(SeedableDocument, _lazy=True)
+    assert baker.prepare(SeedableDocument).name == after_reads
+
+
+def test_lazy_instances_are_materialized_when_saved():
+    """
+    Test that saving a lazily prepared instance generates every field it hadn't read.
+
+    Asserts:
+    - The saved document holds a value for every required field.
+    """
+    instance = baker.prepare(SeedableDocument, _lazy=True)
+    instance.save()
+    try:
+        stored = SeedableDocument._get_collection().find_one({"_id": instance.id})
+        assert {"name", "age", "height_ft", "is_admin", "joined_at"} <= stored.keys()
+        assert instance._data._pending == {}
+    finally:
+        instance.delete()
@@ -1,7 +1,19 @@
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import mongoengine
 import pytest
 
 from mongo_bakery import baker
-from mongo_bakery.pytest_plugin import baker as baker_fixture
+from mongo_bakery.bakery import Baker
+from mongo_bakery.pytest_plugin import (
+    _bakery_worker_setup,
+    baker as baker_fixture,
+    baker_module as baker_module_fixture,
+    worker_db_name,
+    worker_seed,
+)
 from tests.test_mongo_bakery_basics import DocumentToTest
 
 
@@ -45,3 +57,265 @@ def test_baker_fixture_cleans_up_created_instances_on_teardown():
     with pytest.raises(StopIteration):
         next(generator)
     assert DocumentToTest.objects.count() == 0
+
+
+MOCK_CONNECTION_CONFTEST = """
+import mongoengine
+import mongomock
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_mongo_connection():
+    mongoengine.connect(
+        "testdb", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient, uuidRepresentation="standard"
+    )
+"""
+
+DOCUMENT_MODULE = """
+from mongoengine import Document, StringField
+
+
+class Widget(Document):
+    name = StringField(required=True)
+"""
+
+
+def test_scoped_baker_fixtures_yield_a_dedicated_baker():
+    """
+    Test that the scoped `baker_*` fixtures yield their own `Baker`, not the shared one.
+
+    Asserts:
+    - The yielded baker is a `Baker`, distinct from the shared instance behind the function-scoped fixture.
+    - Its teardown cleans up what it created.
+    """
+    generator = baker_module_fixture.__wrapped__()
+    scoped_baker = next(generator)
+    assert isinstance(scoped_baker, Baker)
+    assert scoped_baker is not baker
+
+    scoped_baker.make(DocumentToTest)
+    assert DocumentToTest.objects.count() == 1
+    with pytest.raises(StopIteration):
+        next(generator)
+    assert DocumentToTest.objects.count() == 0
+
+
+def test_module_scoped_data_survives_function_scoped_cleanup(pytester):
+    """
+    Test that data baked through `baker_module` is shared across a module's tests and cleaned up after it.
+
+    The function-scoped `baker` fixture's per-test `cleanup()` must not delete it.
+
+    Asserts:
+    - Every inner test passes: the module-scoped document is visible to the second test even though the
+      first one also used (and cleaned up) the function-scoped `baker`, and the next module sees none.
+    """
+    pytester.makeconftest(MOCK_CONNECTION_CONFTEST)
+    pytester.makepyfile(
+        widgets=DOCUMENT_MODULE,
+        test_a_module_scope="""
+import pytest
+
+from widgets import Widget
+
+
+@pytest.fixture(scope="module")
+def reference_widget(baker_module):
+    return baker_module.make(Widget, name="reference")
+
+
+def test_first(reference_widget, baker):
+    baker.make(Widget)
+    assert Widget.objects.count() == 2
+
+
+def test_second(reference_widget):
+    assert [widget.name for widget in Widget.objects] == ["reference"]
+""",
+        test_b_next_module="""
+from widgets import Widget
+
+
+def test_module_data_was_cleaned_up():
+    assert Widget.objects.count() == 0
+""",
+    )
+
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider")
+
+    result.assert_outcomes(passed=3)
+
+
+def test_worker_db_name_and_seed_are_derived_per_xdist_worker():
+    """
+    Test that each xdist worker gets its own database name and seed, and non-distributed runs keep the configured ones.
+
+    Asserts:
+    - Workers get the configured database name suffixed with their id, and the seed plus their number.
+    - The xdist controller id (`"master"`) leaves both untouched.
+    """
+    assert worker_db_name("testdb", "gw3") == "testdb_gw3"
+    assert worker_db_name("testdb", "master") == "testdb"
+    assert worker_seed(100, "gw3") == 103
+    assert worker_seed(100, "master") == 100
+
+
+def test_plugin_connects_each_xdist_worker_to_its_own_database(pytester, monkeypatch):
+    """
+    Test that, with `mongo_bakery_db` configured, the plugin connects an xdist worker to a private database.
+
+    Runs the inner session as if it were xdist worker `gw2`, and checks the seeded, per-worker setup from inside it.
+
+    Asserts:
+    - The default connection points at `testdb_gw2`, and baked documents land there.
+    - The shared baker was seeded with the configured seed plus the worker number.
+    """
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw2")
+    pytester.makeini(
+        """
+[pytest]
+mongo_bakery_db = testdb
+mongo_bakery_mongo_client_class = mongomock.MongoClient
+mongo_bakery_seed = 40
+"""
+    )
+    pytester.makepyfile(
+        widgets=DOCUMENT_MODULE,
+        test_worker_database="""
+from mongoengine import get_db
+
+from widgets import Widget
+
+
+def test_worker_database(baker):
+    baker.make(Widget)
+    assert get_db().name == "testdb_gw2"
+    assert get_db()["widget"].count_documents({}) == 1
+    assert baker._seed == 42
+""",
+    )
+
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider")
+
+    result.assert_outcomes(passed=1)
+
+
+def test_plugin_drops_the_worker_database_at_session_end(monkeypatch):
+    """
+    Test that the per-worker database the plugin created is dropped, and its connection removed, on teardown.
+
+    Drives the session fixture's generator directly with a stub config, on a dedicated connection alias.
+
+    Asserts:
+    - While the session runs, documents written through the alias land in `bakerydb_gw5`.
+    - After teardown the database no longer exists and the alias is disconnected.
+    """
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw5")
+    ini = {
+        "mongo_bakery_seed": "",
+        "mongo_bakery_db": "bakerydb",
+        "mongo_bakery_db_host": "mongodb://localhost",
+        "mongo_bakery_db_alias": "xdist_drop_test",
+        "mongo_bakery_mongo_client_class": "mongomock.MongoClient",
+    }
+    generator = _bakery_worker_setup.__wrapped__(SimpleNamespace(getini=ini.__getitem__))
+    next(generator)
+    client = mongoengine.get_connection("xdist_drop_test")
+    mongoengine.get_db("xdist_drop_test")["widgets"].insert_one({"name": "gear"})
+    assert "bakerydb_gw5" in client.list_database_names()
+
+    with pytest.raises(StopIteration):
+        next(generator)
+
+    assert "bakerydb_gw5" not in client.list_database_names()
+    with pytest.raises(mongoengine.connection.ConnectionFailure):
+        mongoengine.get_connection("xdist_drop_test")
+
+
+BAKING_TESTS_MODULE = """
+from widgets import Widget
+
+
+def test_bakes_many(baker):
+    baker.make(Widget, _quantity=5)
+
+
+def test_bakes_one(baker):
+    baker.make(Widget)
+
+
+def test_without_baker():
+    pass
+"""
+
+
+def test_bakery_report_lists_the_slowest_baked_tests(pytester):
+    """
+    Test that `--bakery-report` prints a summary of what each test using the `baker` fixture baked.
+
+    Asserts:
+    - The summary section is printed, with one line per baked test and its documents per class.
+    - Tests that don't use the `baker` fixture aren't listed.
+    """
+    pytester.makeconftest(MOCK_CONNECTION_CONFTEST)
+    pytester.makepyfile(widgets=DOCUMENT_MODULE, test_baking=BAKING_TESTS_MODULE)
+
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider", "--bakery-report")
+
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(
+        [
+            "*slowest baked tests*",
+            "*s 5 documents test_baking.py::test_bakes_many (generate *s, save *s, cleanup *s) Widget: 5",
+        ]
+    )
+    result.stdout.fnmatch_lines(["*s 1 documents test_baking.py::test_bakes_one (*) Widget: 1"])
+    result.stdout.no_fnmatch_line("*test_without_baker (*")
+
+
+def test_bakery_max_documents_fails_tests_that_bake_too_much(pytester):
+    """
+    Test that `--bakery-max-documents` fails tests whose `baker` fixture creates more documents than allowed.
+
+    Asserts:
+    - Only the test baking 5 documents fails, with a message naming the limit and the documents per class.
+    - No report is printed without `--bakery-report`.
+    """
+    pytester.makeconftest(MOCK_CONNECTION_CONFTEST)
+    pytester.makepyfile(widgets=DOCUMENT_MODULE, test_baking=BAKING_TESTS_MODULE)
+
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider", "--bakery-max-documents", "3")
+
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines(["baked 5 documents, more than --bakery-max-documents=3 (Widget: 5)"])
+    result.stdout.no_fnmatch_line("*slowest baked tests*")
+
+
+def test_importing_the_plugin_defers_the_baker_and_its_dependencies():
+    """
+    Test that importing the pytest plugin, as every test run does, doesn't import the baker or its dependencies.
+
+    Runs in a fresh interpreter, since this test session has long imported everything.
+
+    Asserts:
+    - After importing `mongo_bakery.pytest_plugin`, none of faker, mongoengine, unittest.mock or
+      `mongo_bakery.bakery` is imported.
+    - Importing `mongo_bakery.bakery` still doesn't import faker, until the shared baker generates data.
+    """
+    script = """
+import sys
+
+import mongo_bakery.pytest_plugin
+
+print(sorted(name for name in ("faker", "mongoengine", "unittest.mock", "mongo_bakery.bakery") if name in sys.modules))
+
+from mongo_bakery import baker
+
+print("faker" in sys.modules)
+baker.seed(1)
+print("faker" in sys.modules)
+"""
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert result.stdout.split("\n")[:3] == ["[]", "False", "True"]
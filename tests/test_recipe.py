@@ -0,0 +1,94 @@
+from mongo_bakery import Recipe
+from mongo_bakery.bakery import Baker
+from tests.test_mongo_bakery_basics import (
+    NonCyclicDualReferenceDocument,
+    ReferencedDocument,
+    SeedableDocument,
+)
+
+
+def test_recipe_make_resolves_static_callable_and_sequence_values():
+    """
+    Test that `Recipe.make` uses static values as-is and resolves callables and sequences for each instance.
+
+    Asserts:
+    - Every instance gets the static value, a fresh callable result and the next sequence value.
+    - Fields the recipe doesn't mention are still generated, and everything is cleaned up with the baker.
+    """
+    baker = Baker()
+    ages = iter(range(30, 40))
+    recipe = Recipe(SeedableDocument, is_admin=True, age=lambda: next(ages), name=baker.seq("user-"))
+    try:
+        instances = recipe.make(_quantity=3, _baker=baker)
+
+        assert [instance.is_admin for instance in instances] == [True, True, True]
+        assert [instance.age for instance in instances] == [30, 31, 32]
+        assert [instance.name for instance in instances] == ["user-1", "user-2", "user-3"]
+        assert all(instance.joined_at is not None for instance in instances)
+    finally:
+        baker.cleanup()
+    assert SeedableDocument.objects(id__in=[instance.id for instance in instances]).count() == 0
+
+
+def test_nested_recipes_fill_reference_fields():
+    """
+    Test that a recipe used as a field value is made for each instance, e.g. to fill a `ReferenceField`.
+
+    Asserts:
+    - Each reference points to a distinct, saved document built from the nested recipe.
+    - Overrides passed to `make` replace the recipe's values for that call only.
+    """
+    baker = Baker()
+    referenced = Recipe(ReferencedDocument, name="shared shape")
+    recipe = Recipe(NonCyclicDualReferenceDocument, primary_ref=referenced, secondary_ref=referenced)
+    try:
+        first, second = recipe.make(_quantity=2, _baker=baker)
+        assert first.primary_ref.name == "shared shape"
+        assert len({first.primary_ref.id, first.secondary_ref.id, second.primary_ref.id}) == 3
+        assert ReferencedDocument.objects(id=first.secondary_ref.id).count() == 1
+
+        existing = baker.make(ReferencedDocument)
+        overridden = recipe.make(_baker=baker, primary_ref=existing)
+        assert overridden.primary_ref.id == existing.id
+        assert recipe.make(_baker=baker).primary_ref.id != existing.id
+    finally:
+        baker.cleanup()
+
+
+def test_recipe_prepare_and_extend():
+    """
+    Test that `Recipe.prepare` builds unsaved instances and `Recipe.extend` derives a new recipe.
+
+    Asserts:
+    - Prepared instances have no primary key and aren't in the database.
+    - The extended recipe adds its values, and the original recipe is unchanged.
+    """
+    baker = Baker()
+    base = Recipe(SeedableDocument, name="base")
+    admin = base.extend(is_admin=True)
+
+    prepared = admin.prepare(_baker=baker)
+    assert prepared.pk is None
+    assert (prepared.name, prepared.is_admin) == ("base", True)
+    assert base.attrs == {"name": "base"}
+    assert SeedableDocument.objects(name="base").count() == 0
+
+
+def test_generation_plan_is_compiled_once_per_shape():
+    """
+    Test that repeated calls with the same field names reuse the baker's compiled generation plan.
+
+    Asserts:
+    - Several `make` calls through one recipe compile a single plan, and a different set of overrides one more.
+    """
+    baker = Baker()
+    recipe = Recipe(SeedableDocument, name="planned")
+    try:
+        for _ in range(3):
+            recipe.make(_baker=baker)
+        assert len(baker._generated_fields) == 1
+
+        recipe.make(_baker=baker, age=7)
+        assert len(baker._generated_fields) == 2
+    finally:
+        baker.cleanup()
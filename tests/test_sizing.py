@@ -0,0 +1,127 @@
+import bson
+import pytest
+from mongoengine import Document, ListField, StringField, UUIDField
+
+from mongo_bakery.bakery import Baker
+from mongo_bakery.distributions import Normal
+from mongo_bakery.sizing import encoded_size
+from tests.test_mongo_bakery_basics import (
+    DocumentToTest,
+    MapFieldDocument,
+    ReferencedDocument,
+)
+
+
+class TaggedNoteDocument(Document):
+    """
+    TaggedNoteDocument exercises `_target_bytes` padding limits.
+
+    Attributes:
+        title (StringField): A short free-text field, capped by `max_length`.
+        tags (ListField): A list of short strings, padded once `title` is full.
+
+    Meta:
+        collection (str): The name of the MongoDB collection where the documents are stored.
+    """
+
+    title = StringField(required=True, max_length=20)
+    tags = ListField(StringField(max_length=16), required=True)
+
+    meta = {"collection": "test_documents"}
+
+
+class ProfileDocument(Document):
+    """
+    ProfileDocument exercises `_target_bytes` padding around UUIDs and Faker-provider fields.
+
+    Attributes:
+        external_id (UUIDField): A binary UUID, which BSON only encodes with a UUID representation set.
+        email (StringField): Filled by Faker's `email` provider, so it shouldn't be padded.
+        bio (StringField): A free-text field, padded instead.
+
+    Meta:
+        collection (str): The name of the MongoDB collection where the documents are stored.
+    """
+
+    external_id = UUIDField(required=True)
+    email = StringField(required=True)
+    bio = StringField(required=True)
+
+    meta = {"collection": "test_documents"}
+
+
+def _stored_size(document_class, pk):
+    return len(bson.encode(document_class._get_collection().find_one({"_id": pk})))
+
+
+def test_make_pads_documents_to_target_bytes():
+    """
+    Test that `make(..., _target_bytes=...)` pads each saved document to the requested BSON size.
+
+    Asserts:
+    - With a fixed target, every stored document encodes to exactly that many bytes, for both return shapes.
+    - With a distribution, each document has its own target size.
+    """
+    baker = Baker()
+    try:
+        documents = baker.make(DocumentToTest, _quantity=5, _target_bytes=4096)
+        assert [_stored_size(DocumentToTest, document.pk) for document in documents] == [4096] * 5
+
+        ids = baker.make(DocumentToTest, _quantity=5, _target_bytes=2000, _return="ids")
+        assert [_stored_size(DocumentToTest, pk) for pk in ids] == [2000] * 5
+
+        varied = baker.make(DocumentToTest, _quantity=20, _target_bytes=Normal(8192, 1024, min_value=1024))
+        sizes = {_stored_size(DocumentToTest, document.pk) for document in varied}
+        assert len(sizes) > 10
+        assert all(size >= 1024 for size in sizes)
+    finally:
+        baker.cleanup()
+
+
+def test_target_bytes_respects_field_limits():
+    """
+    Test that padding stays within `max_length`, falling back to list fields, and reports targets it can't reach.
+
+    Asserts:
+    - A capped string is filled up to its `max_length`, then list items no longer than the inner `max_length` are added.
+    - Unsaved instances are padded too, counting the `_id` `save()` would add.
+    - A document with no field to pad, or `_target_bytes` with `_lazy`, raises a `ValueError`.
+    """
+    baker = Baker()
+    try:
+        note = baker.make(TaggedNoteDocument, _target_bytes=1000)
+        assert len(note.title) == 20
+        assert all(len(tag) <= 16 for tag in note.tags)
+        assert 990 <= _stored_size(TaggedNoteDocument, note.pk) <= 1000
+
+        prepared = baker.prepare(ReferencedDocument, _target_bytes=3000)
+        assert prepared.pk is None
+        prepared.save()
+        assert _stored_size(ReferencedDocument, prepared.pk) == 3000
+        prepared.delete()
+
+        with pytest.raises(ValueError, match="_target_bytes needs a generated StringField"):
+            baker.make(MapFieldDocument, _target_bytes=1000)
+        with pytest.raises(ValueError, match="can't be combined with _lazy"):
+            baker.prepare(DocumentToTest, _lazy=True, _target_bytes=1000)
+    finally:
+        baker.cleanup()
+
+
+def test_target_bytes_pads_free_text_before_provider_fields():
+    """
+    Test that padding handles UUID fields and leaves values from Faker providers alone while free text has room.
+
+    Asserts:
+    - A document with a binary `UUIDField` is padded to exactly its target size, counting the `_id` it would get.
+    - The free-text `bio` takes the padding, while the provider-filled `email` stays a plain address.
+    """
+    baker = Baker()
+    try:
+        profiles = baker.prepare(ProfileDocument, _quantity=3, _target_bytes=1500)
+        assert [encoded_size(profile) for profile in profiles] == [1500] * 3
+        for profile in profiles:
+            assert "@" in profile.email and " " not in profile.email
+            assert len(profile.bio) > 1000
+    finally:
+        baker.cleanup()
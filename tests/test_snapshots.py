@@ -0,0 +1,100 @@
+from unittest.mock import MagicMock
+
+import bson
+from bson.raw_bson import RawBSONDocument
+from mongoengine import Document, StringField
+from pymongo.collection import Collection
+
+from mongo_bakery.bakery import Baker
+from mongo_bakery.snapshots import capture_collection, restore_collection
+from tests.test_mongo_bakery_basics import SeedableDocument
+
+
+class OtherCollectionDocument(Document):
+    """
+    OtherCollectionDocument lives in its own collection, unlike the shared `test_documents` one.
+
+    Attributes:
+        name (StringField): A simple required field, only used to make the document saveable.
+
+    Meta:
+        collection (str): The name of the MongoDB collection where the documents are stored.
+    """
+
+    name = StringField(required=True)
+
+    meta = {"collection": "other_documents"}
+
+
+def test_restore_resets_collections_to_the_snapshot():
+    """
+    Test that `baker.restore()` undoes inserts, updates and deletes made after `baker.snapshot()`.
+
+    Restores twice, to check that changes made to the live collection never leak into the snapshot itself.
+
+    Asserts:
+    - After each restore, the collection holds exactly the snapshotted documents, with their snapshotted values.
+    """
+    baker = Baker()
+    try:
+        originals = baker.make(SeedableDocument, _quantity=3)
+        expected = {document.id: document.name for document in originals}
+        snapshot = baker.snapshot()
+
+        for _ in range(2):
+            baker.make(SeedableDocument, _quantity=2)
+            SeedableDocument.objects(id=originals[0].id).update(set__name="changed")
+            SeedableDocument.objects(id=originals[1].id).delete()
+
+            baker.restore(snapshot)
+
+            assert {document.id: document.name for document in SeedableDocument.objects} == expected
+    finally:
+        baker.cleanup()
+
+
+def test_restore_resets_what_cleanup_deletes():
+    """
+    Test that `baker.restore()` also resets the instances tracked for `cleanup()`.
+
+    Documents created after the snapshot in a collection it doesn't cover are deleted by `restore` itself.
+
+    Asserts:
+    - A document baked in an uncovered collection after the snapshot is gone after `restore`, while one
+      created there without the baker is left alone.
+    - `cleanup()` after `restore` deletes exactly the snapshotted documents.
+    """
+    baker = Baker()
+    try:
+        baker.make(SeedableDocument, _quantity=2)
+        snapshot = baker.snapshot()
+        untouched = OtherCollectionDocument(name="not baked").save()
+        baker.make(OtherCollectionDocument)
+
+        baker.restore(snapshot)
+
+        assert list(OtherCollectionDocument.objects) == [untouched]
+        baker.cleanup()
+        assert SeedableDocument.objects.count() == 0
+    finally:
+        baker.cleanup()
+        OtherCollectionDocument.objects.delete()
+
+
+def test_non_mongomock_collections_are_dumped_and_reloaded_as_raw_bson():
+    """
+    Test that collections on a real server are captured with `find_raw_batches` and reloaded without decoding.
+
+    Asserts:
+    - Restoring empties the collection, then inserts every captured document as a `RawBSONDocument`.
+    """
+    documents = [{"_id": 1, "name": "a"}, {"_id": 2, "name": "b"}]
+    collection = MagicMock(spec=Collection)
+    collection.find_raw_batches.return_value = [b"".join(bson.encode(document) for document in documents)]
+
+    restore_collection(collection, capture_collection(collection))
+
+    collection.delete_many.assert_called_once_with({})
+    [inserted] = collection.insert_many.call_args.args
+    assert all(isinstance(document, RawBSONDocument) for document in inserted)
+    assert [dict(document) for document in inserted] == documents
@@ -0,0 +1,115 @@
+from mongoengine import Document, ListField, ReferenceField
+
+from mongo_bakery.bakery import Baker
+from mongo_bakery.distributions import Length
+from tests.test_mongo_bakery_basics import (
+    NonCyclicDualReferenceDocument,
+    ReferencedDocument,
+    SeedableDocument,
+)
+
+
+def test_stats_are_empty_until_enabled():
+    """
+    Test that a `Baker` collects no stats unless `collect_stats()` was called.
+
+    Asserts:
+    - `stats()` reports empty sections after baking with stats disabled.
+    """
+    baker = Baker()
+    try:
+        baker.make(SeedableDocument, _quantity=2)
+        assert baker.stats() == {"total": {}, "documents": {}, "fields": {}, "cleanup": {}}
+    finally:
+        baker.cleanup()
+
+
+def test_stats_count_documents_fields_and_references():
+    """
+    Test that `stats()` reports per-class and per-field-type counters and timings.
+
+    Asserts:
+    - Each class counts the documents created, and referenced documents count as references.
+    - Each field type counts the values generated, with non-negative timings.
+    - The total section has a timing per phase.
+    """
+    baker = Baker()
+    baker.collect_stats()
+    try:
+        baker.make(SeedableDocument, _quantity=3)
+        baker.make(NonCyclicDualReferenceDocument, _quantity=2)
+
+        stats = baker.stats()
+        seedable = stats["documents"]["SeedableDocument"]
+        assert seedable["created"] == 3
+        assert "references" not in seedable
+        assert {"generate_seconds", "construct_seconds", "save_seconds"} <= seedable.keys()
+        assert stats["documents"]["NonCyclicDualReferenceDocument"]["created"] == 2
+        assert stats["documents"]["ReferencedDocument"] == {
+            **stats["documents"]["ReferencedDocument"],
+            "created": 4,
+            "references": 4,
+        }
+        assert stats["fields"]["ReferenceField"]["generated"] == 4
+        assert stats["fields"]["StringField"]["generated"] == 3 + 4
+        assert all(counters["seconds"] >= 0 for counters in stats["fields"].values())
+        assert stats["total"].keys() == {"generate_seconds", "construct_seconds", "save_seconds"}
+    finally:
+        baker.cleanup()
+
+
+def test_stats_count_documents_drawn_by_distributions_as_references():
+    """
+    Test that documents baked while drawing a distribution are nested in the `make` call that drew it.
+
+    Asserts:
+    - Referenced documents drawn by `Length` count as references, not top-level documents.
+    - The container's generate time includes theirs, and so does the total.
+    """
+
+    class Library(Document):
+        books = ListField(ReferenceField(ReferencedDocument), required=True)
+
+        meta = {"collection": "test_documents"}
+
+    baker = Baker()
+    baker.collect_stats()
+    try:
+        baker.make(Library, _quantity=2, books=Length(3))
+
+        stats = baker.stats()
+        books, library = stats["documents"]["ReferencedDocument"], stats["documents"]["Library"]
+        assert books["created"] == books["references"] == 6
+        assert library["created"] == 2
+        assert library["generate_seconds"] >= books["generate_seconds"] + books["save_seconds"]
+        assert stats["total"]["generate_seconds"] == library["generate_seconds"]
+    finally:
+        baker.cleanup()
+
+
+def test_stats_record_cleanup_and_reset():
+    """
+    Test that `cleanup()` is recorded, and that `reset_stats()` and `collect_stats(False)` discard stats.
+
+    Asserts:
+    - The cleanup section counts calls and deleted documents.
+    - `reset_stats()` empties every section but keeps collecting.
+    - `collect_stats(False)` stops collecting.
+    """
+    baker = Baker()
+    baker.collect_stats()
+    baker.make(SeedableDocument, _quantity=2)
+    baker.cleanup()
+
+    cleanup = baker.stats()["cleanup"]
+    assert cleanup["calls"] == 1
+    assert cleanup["deleted"] == 2
+
+    baker.reset_stats()
+    assert baker.stats() == {"total": {}, "documents": {}, "fields": {}, "cleanup": {}}
+    baker.make(SeedableDocument)
+    assert baker.stats()["documents"]["SeedableDocument"]["created"] == 1
+
+    baker.collect_stats(False)
+    assert baker.stats()["documents"] == {}
+    baker.cleanup()
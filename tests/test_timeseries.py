@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+
+import pytest
+from mongoengine import DateTimeField, Document, FloatField, StringField
+
+from mongo_bakery.bakery import Baker
+from mongo_bakery.timeseries import TimeSeries
+
+
+class ReadingDocument(Document):
+    """
+    ReadingDocument exercises time-series generation.
+
+    Attributes:
+        timestamp (DateTimeField): When the reading was taken.
+        sensor_id (StringField): Which sensor took it, the series' metadata.
+        value (FloatField): The measured value.
+
+    Meta:
+        collection (str): The name of the MongoDB collection where the documents are stored.
+    """
+
+    timestamp = DateTimeField(required=True)
+    sensor_id = StringField(required=True)
+    value = FloatField(required=True)
+
+    meta = {"collection": "test_documents"}
+
+
+START = datetime(2025, 3, 1)
+
+
+def test_timeseries_emits_increasing_timestamps_per_series():
+    """
+    Test that `_timeseries` gives documents increasing timestamps at the configured interval, across series.
+
+    Asserts:
+    - Without jitter, readings are exactly one interval apart, every series reading at each step.
+    - Documents are inserted in time order, and the rest of their fields are still generated.
+    """
+    baker = Baker()
+    try:
+        series = TimeSeries("timestamp", start=START, interval=timedelta(seconds=10), series={"sensor_id": ["a", "b"]})
+        readings = baker.make(ReadingDocument, _quantity=6, _timeseries=series)
+
+        assert [reading.timestamp for reading in readings] == [
+            START,
+            START,
+            START + timedelta(seconds=10),
+            START + timedelta(seconds=10),
+            START + timedelta(seconds=20),
+            START + timedelta(seconds=20),
+        ]
+        assert [reading.sensor_id for reading in readings] == ["a", "b", "a", "b", "a", "b"]
+        assert all(isinstance(reading.value, float) for reading in readings)
+
+        ids = baker.make(ReadingDocument, _quantity=50, _return="ids", _timeseries=TimeSeries("timestamp", start=START))
+        stored = ReadingDocument._get_collection().find({"_id": {"$in": ids}}).sort("_id", 1)
+        timestamps = [document["timestamp"] for document in stored]
+        assert timestamps == sorted(timestamps)
+    finally:
+        baker.cleanup()
+
+
+def test_timeseries_jitter_gaps_and_bursts():
+    """
+    Test that jitter, gaps and bursts shape the spacing of readings while timestamps keep increasing.
+
+    Asserts:
+    - Jittered steps stay within the jitter share of the interval.
+    - Gaps add longer steps, and bursts pack readings into a fraction of the interval.
+    - Out-of-range settings and kwargs that clash with the time series raise a `ValueError`.
+    """
+    baker = Baker()
+    jittered = TimeSeries("timestamp", start=START, jitter=0.2).columns(200)["timestamp"]
+    steps = [(later - earlier).total_seconds() for earlier, later in _pairs(list(jittered))]
+    assert all(48 <= step <= 72 for step in steps)
+    assert len(set(steps)) > 100
+
+    shaped = TimeSeries("timestamp", start=START, gaps=(0.05, timedelta(hours=1)), bursts=(0.05, 10))
+    steps = [(later - earlier).total_seconds() for earlier, later in _pairs(list(shaped.columns(2000)["timestamp"]))]
+    assert all(step > 0 for step in steps)
+    assert any(step > 120 for step in steps)
+    assert any(abs(step - 6) < 0.001 for step in steps)
+
+    with pytest.raises(ValueError, match="jitter must be at least 0 and less than 1"):
+        TimeSeries("timestamp", jitter=1)
+    with pytest.raises(ValueError, match="_timeseries already sets timestamp"):
+        baker.make(ReadingDocument, timestamp=START, _timeseries=TimeSeries("timestamp"))
+
+
+def _pairs(values):
+    return zip(values, values[1:], strict=False)